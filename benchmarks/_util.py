@@ -0,0 +1,60 @@
+"""Helpers shared by the benchmark scripts."""
+
+# Standard Library
+import timeit
+
+# Pyramid
+import colander
+
+
+def best_ms(func, number=20, repeat=5):
+    """Return the best time of ``repeat`` runs of ``number`` calls of
+    ``func``, in milliseconds per call."""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1000
+
+
+def report(label, *columns):
+    print(("%-40s" % label) + "".join("%14s" % col for col in columns))
+
+
+def wide_schema(width=300):
+    """A mapping with ``width`` string children."""
+    schema = colander.SchemaNode(colander.Mapping())
+    for num in range(width):
+        schema.add(
+            colander.SchemaNode(colander.String(), name="field%s" % num)
+        )
+    return schema
+
+
+def deep_schema(depth=50, width=3):
+    """Nested mappings ``depth`` levels deep with ``width`` string leaves
+    at every level."""
+    schema = node = colander.SchemaNode(colander.Mapping())
+    for level in range(depth):
+        for num in range(width):
+            node.add(
+                colander.SchemaNode(colander.String(), name="leaf%s" % num)
+            )
+        child = colander.SchemaNode(colander.Mapping(), name="level%s" % level)
+        node.add(child)
+        node = child
+    return schema
+
+
+def sequence_schema():
+    """A mapping holding a sequence of person mappings."""
+
+    class Person(colander.Schema):
+        first_name = colander.SchemaNode(colander.String())
+        last_name = colander.SchemaNode(colander.String())
+        age = colander.SchemaNode(colander.Integer())
+
+    class People(colander.SequenceSchema):
+        person = Person()
+
+    class Schema(colander.Schema):
+        people = People()
+
+    return Schema()
@@ -0,0 +1,72 @@
+"""Sequence items: ``Field.clone()`` versus re-running the ``Field``
+constructor for every item of a 5,000-item sequence of mappings."""
+
+# Standard Library
+import os
+import sys
+import weakref
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Deform
+from deform import Form  # noqa: E402
+
+from _util import best_ms  # noqa: E402
+from _util import report  # noqa: E402
+from _util import sequence_schema  # noqa: E402
+
+ITEMS = 5000
+
+
+def reconstruct(field):
+    """Clone ``field`` the way Deform used to: construct a new field from
+    the schema, then overwrite its attributes and rebuild its children."""
+    cloned = field.__class__(
+        field.schema,
+        renderer=field.renderer,
+        counter=field.counter,
+        resource_registry=field.resource_registry,
+    )
+    cloned.order = next(cloned.counter)
+    cloned.oid = None
+    children = []
+    for child in field.children:
+        cloned_child = reconstruct(child)
+        cloned_child._parent = weakref.ref(cloned)
+        children.append(cloned_child)
+    cloned.children = children
+    return cloned
+
+
+def main():
+    form = Form(sequence_schema())
+    item = form["people"].children[0]
+    appstruct = {
+        "people": [
+            {"first_name": "Jane", "last_name": "Doe", "age": num}
+            for num in range(ITEMS)
+        ]
+    }
+    cstruct = form.schema.serialize(appstruct)
+
+    def clone_all(clone):
+        for _ in range(ITEMS):
+            clone(item)
+
+    def clone_method(field):
+        return field.clone()
+
+    def deserialize():
+        Form(sequence_schema()).deserialize(cstruct)
+
+    def timed(func):
+        return "%.1f" % best_ms(func, number=1, repeat=3)
+
+    report("%s items" % ITEMS, "ms")
+    report("re-running the constructor", timed(lambda: clone_all(reconstruct)))
+    report("Field.clone()", timed(lambda: clone_all(clone_method)))
+    report("Form.deserialize (one clone per item)", timed(deserialize))
+
+
+if __name__ == "__main__":
+    main()
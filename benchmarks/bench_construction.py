@@ -0,0 +1,47 @@
+"""Form construction for wide and deep schemas: ``Form(schema)`` alone and
+with the default widget of every field resolved, as rendering does.  Run
+it against two checkouts to compare construction cost before and after a
+change."""
+
+# Standard Library
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Deform
+from deform import Form  # noqa: E402
+
+from _util import best_ms  # noqa: E402
+from _util import deep_schema  # noqa: E402
+from _util import report  # noqa: E402
+from _util import wide_schema  # noqa: E402
+
+
+def build(schema):
+    """Construct a form and resolve every widget."""
+    form = Form(schema)
+    stack = [form]
+    while stack:
+        field = stack.pop()
+        field.widget
+        stack.extend(field.children)
+    return form
+
+
+def main():
+    report("schema", "Form() ms", "widgets ms")
+    cases = [
+        ("wide (300 fields)", wide_schema(300)),
+        ("wide (1000 fields)", wide_schema(1000)),
+        ("deep (50 levels x 3 leaves)", deep_schema(50, 3)),
+        ("deep (200 levels x 1 leaf)", deep_schema(200, 1)),
+    ]
+    for label, schema in cases:
+        form = best_ms(lambda: Form(schema))
+        widgets = best_ms(lambda: build(schema))
+        report(label, "%.3f" % form, "%.3f" % widgets)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Reassigning a cstruct in which one leaf changed: full propagation
+versus ``Field.update_cstruct``."""
+
+# Standard Library
+import copy
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Pyramid
+import colander  # noqa: E402
+
+# Deform
+from deform import Form  # noqa: E402
+
+from _util import best_ms  # noqa: E402
+from _util import report  # noqa: E402
+from _util import wide_schema  # noqa: E402
+
+
+def grouped_schema(groups, width):
+    """A mapping of ``groups`` mappings with ``width`` string leaves."""
+    schema = colander.SchemaNode(colander.Mapping())
+    for num in range(groups):
+        group = wide_schema(width)
+        group.name = "group%s" % num
+        schema.add(group)
+    return schema
+
+
+def main():
+    # each measurement switches the cstruct back and forth
+    report("schema", "assign ms", "update ms", "speedup")
+    cases = [
+        ("wide (1000 fields)", wide_schema(1000)),
+        ("grouped (20 x 50 fields)", grouped_schema(20, 50)),
+        ("grouped (100 x 50 fields)", grouped_schema(100, 50)),
+    ]
+    for label, schema in cases:
+        form = Form(schema)
+        cstruct = form.cstruct
+        # equal to the current cstruct but for one leaf, as after a
+        # one-field validation failure
+        changed = copy.deepcopy(cstruct)
+        leaf = changed
+        while isinstance(leaf[sorted(leaf)[-1]], dict):
+            leaf = leaf[sorted(leaf)[-1]]
+        leaf[sorted(leaf)[-1]] = "changed"
+
+        def assign():
+            form.cstruct = cstruct
+            form.cstruct = changed
+
+        def update():
+            form.update_cstruct(cstruct)
+            form.update_cstruct(changed)
+
+        before = best_ms(assign)
+        after = best_ms(update)
+        speedup = "%.1fx" % (before / after)
+        report(label, "%.3f" % before, "%.3f" % after, speedup)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Dispatching the errors of a submission with one error per row of a
+long sequence: comparing every error position with every item (as
+before) versus looking the items up by position."""
+
+# Standard Library
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Deform
+from deform import Form  # noqa: E402
+from deform import ValidationFailure  # noqa: E402
+from deform.widget import SequenceWidget  # noqa: E402
+
+from _util import best_ms  # noqa: E402
+from _util import report  # noqa: E402
+from _util import sequence_schema  # noqa: E402
+
+
+class ScanningSequenceWidget(SequenceWidget):
+    """Dispatches the errors of the items like SequenceWidget used to."""
+
+    def _error_targets(self, field, error):
+        targets = []
+        sequence_fields = getattr(field, "sequence_fields", [])
+        for e in error.children:
+            for num, subfield in enumerate(sequence_fields):
+                if e.pos == num:
+                    targets.append((subfield, e))
+        return targets
+
+
+def controls(rows):
+    result = [("__start__", "people:sequence")]
+    for num in range(rows):
+        result.extend(
+            [
+                ("__start__", "person:mapping"),
+                ("first_name", "first%s" % num),
+                ("last_name", "last%s" % num),
+                ("age", "not a number"),
+                ("__end__", "person:mapping"),
+            ]
+        )
+    result.append(("__end__", "people:sequence"))
+    return result
+
+
+def failed_form(widget, rows):
+    """Return a form holding the result of a failed validation of a
+    submission with ``rows`` invalid rows, and the error."""
+    form = Form(sequence_schema())
+    form["people"].widget = widget
+    try:
+        form.validate(controls(rows))
+    except ValidationFailure as e:
+        return form, e.error
+    raise AssertionError("validation succeeded")
+
+
+def main():
+    report("errors", "scan ms", "indexed ms", "speedup")
+    for rows in (1000, 10000):
+        scanning = failed_form(ScanningSequenceWidget(), rows)
+        indexed = failed_form(SequenceWidget(), rows)
+
+        def dispatch(form, error):
+            def run():
+                for field in form.get_field_index().fields:
+                    field.error = None
+                form.widget.handle_error(form, error)
+
+            return run
+
+        before = best_ms(dispatch(*scanning), number=1, repeat=3)
+        after = best_ms(dispatch(*indexed), number=1, repeat=3)
+        speedup = "%.1fx" % (before / after)
+        report(
+            "%s rows (%s errors)" % (rows, rows),
+            "%.3f" % before,
+            "%.3f" % after,
+            speedup,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""The time a new process takes to import Deform and to validate a form,
+and whether Chameleon is imported on the way, as reported by
+``python -X importtime``."""
+
+# Standard Library
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _util import report  # noqa: E402
+
+VALIDATE = "\n".join(
+    [
+        "import deform, colander",
+        "schema = colander.SchemaNode(colander.Mapping())",
+        "schema.add(colander.SchemaNode(colander.String(), name='a'))",
+        "deform.Form(schema).validate([('a', 'x')])",
+    ]
+)
+
+RENDER = VALIDATE + "\ndeform.Form(schema).render()"
+
+
+def importtime(statement):
+    """Return the cumulative import time of each module imported by
+    ``statement`` in a new interpreter, in milliseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:"):
+            self_us, cumulative, name = line[12:].split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def main(repeat=9):
+    report("statement", "deform ms", "chameleon ms")
+    for label, statement in (
+        ("import deform", "import deform"),
+        ("validate a form", VALIDATE),
+        ("render a form", RENDER),
+    ):
+        runs = sorted(
+            (importtime(statement) for num in range(repeat)),
+            key=lambda times: times["deform"],
+        )
+        times = runs[repeat // 2]  # the median run
+        chameleon = times.get("chameleon")
+        report(
+            label,
+            "%.1f" % times["deform"],
+            "-" if chameleon is None else "%.1f" % chameleon,
+        )
+
+
+if __name__ == "__main__":
+    main()
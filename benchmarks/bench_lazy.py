@@ -0,0 +1,53 @@
+"""Tabbed forms: eager ``Form(schema)`` versus ``Form(schema, lazy=True)``
+when a request only touches one tab."""
+
+# Standard Library
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Pyramid
+import colander  # noqa: E402
+
+# Deform
+from deform import Form  # noqa: E402
+
+from _util import best_ms  # noqa: E402
+from _util import report  # noqa: E402
+
+
+def tabbed_schema(tabs=20, fields=25):
+    """A mapping of ``tabs`` mappings holding ``fields`` strings each."""
+    schema = colander.SchemaNode(colander.Mapping())
+    for tab in range(tabs):
+        node = colander.SchemaNode(colander.Mapping(), name="tab%s" % tab)
+        for num in range(fields):
+            node.add(
+                colander.SchemaNode(
+                    colander.String(), name="field%s" % num, missing=""
+                )
+            )
+        schema.add(node)
+    return schema
+
+
+def edit_one_tab(schema, **kw):
+    form = Form(schema, **kw)
+    return form["tab0"].render()
+
+
+def main():
+    report("schema", "eager ms", "lazy ms", "speedup")
+    for tabs, fields in ((5, 25), (20, 25), (50, 50)):
+        schema = tabbed_schema(tabs, fields)
+        label = "%s tabs x %s fields" % (tabs, fields)
+        before = best_ms(lambda: edit_one_tab(schema))
+        after = best_ms(lambda: edit_one_tab(schema, lazy=True))
+        report(
+            label, "%.3f" % before, "%.3f" % after, "%.1fx" % (before / after)
+        )
+
+
+if __name__ == "__main__":
+    main()
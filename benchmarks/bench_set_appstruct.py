@@ -0,0 +1,73 @@
+"""Setting an appstruct on a form: serializing it with the schema and
+then assigning the cstruct (as before) versus ``Field.set_appstruct``,
+which assigns the cstructs of plain mappings as it serializes them."""
+
+# Standard Library
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Pyramid
+import colander  # noqa: E402
+
+# Deform
+from deform import Form  # noqa: E402
+
+from _util import best_ms  # noqa: E402
+from _util import deep_schema  # noqa: E402
+from _util import report  # noqa: E402
+from _util import sequence_schema  # noqa: E402
+from _util import wide_schema  # noqa: E402
+
+
+def nested_schema(groups=30, width=30):
+    """A mapping of ``groups`` mappings with ``width`` string leaves."""
+    schema = colander.SchemaNode(colander.Mapping())
+    for group in range(groups):
+        child = colander.SchemaNode(colander.Mapping(), name="group%s" % group)
+        for num in range(width):
+            child.add(
+                colander.SchemaNode(colander.String(), name="field%s" % num)
+            )
+        schema.add(child)
+    return schema
+
+
+def sample(node):
+    """An appstruct filling every node of ``node``."""
+    if isinstance(node.typ, colander.Mapping):
+        return {child.name: sample(child) for child in node.children}
+    if isinstance(node.typ, colander.Sequence):
+        return [sample(node.children[0]) for num in range(200)]
+    if isinstance(node.typ, colander.Integer):
+        return 42
+    return "value"
+
+
+def main():
+    report("schema", "two-pass ms", "one-pass ms", "speedup")
+    cases = [
+        ("wide (1000 fields)", wide_schema(1000)),
+        ("nested (30 x 30 fields)", nested_schema()),
+        ("deep (50 levels)", deep_schema()),
+        ("sequence (200 items)", sequence_schema()),
+    ]
+    for label, schema in cases:
+        appstruct = sample(schema)
+        form = Form(schema)
+
+        def two_pass():
+            form.cstruct = schema.serialize(appstruct)
+
+        def one_pass():
+            form.set_appstruct(appstruct)
+
+        before = best_ms(two_pass)
+        after = best_ms(one_pass)
+        speedup = "%.1fx" % (before / after)
+        report(label, "%.3f" % before, "%.3f" % after, speedup)
+
+
+if __name__ == "__main__":
+    main()
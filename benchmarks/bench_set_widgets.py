@@ -0,0 +1,59 @@
+"""Widget overrides: ``set_widgets`` with a dictionary of dotted names
+versus applying a precompiled ``WidgetOverrides``."""
+
+# Standard Library
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Pyramid
+import colander  # noqa: E402
+
+# Deform
+from deform import Form  # noqa: E402
+from deform.field import WidgetOverrides  # noqa: E402
+from deform.widget import TextAreaWidget  # noqa: E402
+
+from _util import best_ms  # noqa: E402
+from _util import report  # noqa: E402
+
+
+def sectioned_schema(sections, fields):
+    schema = colander.SchemaNode(colander.Mapping())
+    for section in range(sections):
+        node = colander.SchemaNode(
+            colander.Mapping(), name="section%s" % section
+        )
+        for num in range(fields):
+            node.add(
+                colander.SchemaNode(colander.String(), name="field%s" % num)
+            )
+        schema.add(node)
+    return schema
+
+
+def main():
+    report("overrides", "dict ms", "compiled ms", "speedup")
+    for sections, fields in ((10, 10), (20, 25), (40, 50)):
+        schema = sectioned_schema(sections, fields)
+        widget = TextAreaWidget()
+        values = {
+            "section%s.field%s" % (section, num): widget
+            for section in range(sections)
+            for num in range(fields)
+        }
+        overrides = WidgetOverrides(values)
+        form = Form(schema)
+        before = best_ms(lambda: form.set_widgets(values))
+        after = best_ms(lambda: form.set_widgets(overrides))
+        report(
+            "%s keys" % len(values),
+            "%.3f" % before,
+            "%.3f" % after,
+            "%.1fx" % (before / after),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Looking a template up by name, as every widget rendering does:
+through the template loader (as before) versus through the renderer's
+cache of template objects."""
+
+# Standard Library
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Deform
+from deform import ZPTRendererFactory  # noqa: E402
+from deform.template import default_dir  # noqa: E402
+
+from _util import best_ms  # noqa: E402
+from _util import report  # noqa: E402
+
+
+def main():
+    renderer = ZPTRendererFactory((default_dir,), auto_reload=False)
+    report("template name", "loader us", "renderer us", "speedup")
+    for name in (
+        "textinput",
+        "readonly/textinput",
+        "deform:templates/textinput.pt",
+    ):
+        renderer.load(name)
+
+        def loader():
+            renderer.loader.load(name)
+
+        def cached():
+            renderer.load(name)
+
+        # per lookup, in microseconds
+        before = best_ms(loader, number=10000) * 1000
+        after = best_ms(cached, number=10000) * 1000
+        report(
+            name, "%.2f" % before, "%.2f" % after, "%.1fx" % (before / after)
+        )
+
+
+if __name__ == "__main__":
+    main()
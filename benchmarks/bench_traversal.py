@@ -0,0 +1,60 @@
+"""Tree traversals: construction, cstruct propagation, requirement
+collection and error dispatch on mapping schemas of ordinary depths."""
+
+# Standard Library
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Pyramid
+import colander  # noqa: E402
+
+# Deform
+from deform import Form  # noqa: E402
+
+from _util import best_ms  # noqa: E402
+from _util import deep_schema  # noqa: E402
+from _util import report  # noqa: E402
+
+
+def nested_errors(form):
+    """An error tree with one error per field of ``form``."""
+    root = colander.Invalid(form.schema, "error")
+    stack = [(form, root)]
+    while stack:
+        field, error = stack.pop()
+        for num, child in enumerate(field.children):
+            child_error = colander.Invalid(child.schema, "error")
+            error.add(child_error, num)
+            stack.append((child, child_error))
+    return root
+
+
+def main():
+    report("schema", "construct ms", "cstruct ms", "requires ms", "errors ms")
+    for depth, width in ((5, 20), (20, 5), (50, 3), (150, 2)):
+        schema = deep_schema(depth, width)
+        form = Form(schema)
+        cstruct = form.cstruct
+        error = nested_errors(form)
+
+        def set_cstruct():
+            form.cstruct = cstruct
+
+        def dispatch():
+            for field in form._walk():
+                field.error = None
+            form.widget.handle_error(form, error)
+
+        report(
+            "%s levels x %s leaves" % (depth, width),
+            "%.3f" % best_ms(lambda: Form(schema)),
+            "%.3f" % best_ms(set_cstruct),
+            "%.3f" % best_ms(form.get_widget_requirements),
+            "%.3f" % best_ms(dispatch),
+        )
+
+
+if __name__ == "__main__":
+    main()
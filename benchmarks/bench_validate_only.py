@@ -0,0 +1,47 @@
+"""Validate-only requests: constructing a form with an appstruct and
+validating a submission, with the appstruct serialized when the form is
+constructed (as before) versus never, since the cstruct is not needed."""
+
+# Standard Library
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Deform
+from deform import Form  # noqa: E402
+
+from _util import best_ms  # noqa: E402
+from _util import report  # noqa: E402
+from _util import wide_schema  # noqa: E402
+
+
+def main():
+    report("schema", "eager ms", "lazy ms", "speedup")
+    for width in (300, 1000):
+        schema = wide_schema(width)
+        appstruct = {"field%s" % num: "value" for num in range(width)}
+        controls = [("field%s" % num, "new") for num in range(width)]
+
+        def eager():
+            form = Form(schema, appstruct=appstruct)
+            form.cstruct  # what the constructor used to compute
+            form.validate(controls)
+
+        def lazy():
+            form = Form(schema, appstruct=appstruct)
+            form.validate(controls)
+
+        before = best_ms(eager)
+        after = best_ms(lazy)
+        speedup = "%.1fx" % (before / after)
+        report(
+            "wide (%s fields)" % width,
+            "%.3f" % before,
+            "%.3f" % after,
+            speedup,
+        )
+
+
+if __name__ == "__main__":
+    main()
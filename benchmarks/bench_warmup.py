@@ -0,0 +1,47 @@
+"""The first rendering of a form by a new renderer (what the first
+request of a worker pays) versus by a renderer on which
+``ZPTRendererFactory.warmup`` was called beforehand."""
+
+# Standard Library
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Deform
+from deform import Form  # noqa: E402
+from deform import ZPTRendererFactory  # noqa: E402
+from deform.template import default_dir  # noqa: E402
+
+from _util import report  # noqa: E402
+from _util import sequence_schema  # noqa: E402
+from _util import wide_schema  # noqa: E402
+
+
+def first_render_ms(schema, warm):
+    renderer = ZPTRendererFactory((default_dir,))
+    if warm:
+        timings = renderer.warmup()
+    form = Form(schema, renderer=renderer)
+    start = time.perf_counter()
+    form.render()
+    elapsed = (time.perf_counter() - start) * 1000
+    return elapsed, timings if warm else None
+
+
+def main():
+    report("schema", "cold ms", "warm ms", "speedup")
+    for label, schema in (
+        ("wide (30 fields)", wide_schema(30)),
+        ("sequence", sequence_schema()),
+    ):
+        cold = min(first_render_ms(schema, False)[0] for num in range(3))
+        warm, timings = first_render_ms(schema, True)
+        report(label, "%.3f" % cold, "%.3f" % warm, "%.1fx" % (cold / warm))
+    total = sum(timings.values()) * 1000
+    print("warmup compiled %s templates in %.1f ms" % (len(timings), total))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,19 @@ from . import renderer  # API
 from .exception import TemplateError  # API
 from .exception import ValidationFailure  # API
 from .field import Field  # API
+from .field import PathOids  # API
 from .form import Button  # API
 from .form import Form  # API
 from .schema import CSRFSchema  # API
 from .schema import FileData  # API
-from .template import ZPTRendererFactory  # API
-from .template import default_renderer  # API
+from .state import RequestState  # API
+
+
+def __getattr__(name):
+    # the template module (and Chameleon) is only imported when a renderer
+    # is needed
+    if name in ("ZPTRendererFactory", "default_renderer"):
+        from . import template
+
+        return getattr(template, name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -1,24 +1,29 @@
 """Field."""
 
 # Standard Library
+import collections
+import copy
+import functools
+import importlib
 import itertools
+import operator
 import re
 import unicodedata
 import weakref
 
 # Pyramid
 import colander
-from chameleon.utils import Markup
 import peppercorn
 
 # Deform
 from deform.widget import HiddenWidget
 
-from . import decorator
 from . import exception
 from . import schema
-from . import template
 from . import widget
+from .state import FieldState
+from .state import UNSET
+from .state import current as _current_state
 
 
 class _Marker(object):
@@ -31,6 +36,699 @@ class _Marker(object):
 _marker = _Marker()
 
 
+class _LazyDefault(object):
+    """A class attribute standing for the attribute ``name`` of the module
+    ``module``, which is only imported (and the attribute, e.g. the default
+    renderer, created) when it is first read.  Until then, fields built
+    without a renderer or resource registry keep it as a placeholder (see
+    ``_class_default``), resolved when it is first used."""
+
+    def __init__(self, module, name):
+        self.module = module
+        self.name = name
+        self.value = _marker
+
+    def resolve(self):
+        value = self.value
+        if value is _marker:
+            module = importlib.import_module(self.module)
+            value = self.value = getattr(module, self.name)
+        return value
+
+    def __get__(self, inst, objtype=None):
+        return self.resolve()
+
+
+def _class_default(cls, name):
+    """Return the class attribute ``name`` of ``cls``, or the
+    ``_LazyDefault`` standing for it if it was not resolved yet."""
+    for klass in cls.__mro__:
+        value = klass.__dict__.get(name, _marker)
+        if value is not _marker:
+            if value.__class__ is _LazyDefault and value.value is _marker:
+                return value
+            break
+    return getattr(cls, name)
+
+
+# Chameleon is only imported once something is rendered
+def _markup(text):
+    from chameleon.utils import Markup
+
+    return Markup(text)
+
+
+class _SchemaAlias(object):
+    """A data descriptor which proxies a field attribute to the attribute
+    of the same name on the field's schema node unless a value has been
+    assigned to it on the field itself."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, inst, objtype=None):
+        if inst is None:
+            return self
+        aliases = inst._aliases
+        if aliases is not None and self.name in aliases:
+            return aliases[self.name]
+        return getattr(inst.schema, self.name)
+
+    # The overrides dictionary may be shared between a field and its
+    # copies, so it is replaced rather than mutated (copy on write).
+
+    def __set__(self, inst, value):
+        aliases = dict(inst._aliases or ())
+        aliases[self.name] = value
+        inst._aliases = aliases
+
+    def __delete__(self, inst):
+        aliases = inst._aliases
+        if aliases is not None and self.name in aliases:
+            aliases = dict(aliases)
+            del aliases[self.name]
+            inst._aliases = aliases
+
+
+class _NameAlias(_SchemaAlias):
+    """The :class:`_SchemaAlias` of ``name``, which also drops the
+    indexes of the parent field and its ancestors that map names to
+    fields when the name of a field is assigned or deleted."""
+
+    def __set__(self, inst, value):
+        _SchemaAlias.__set__(self, inst, value)
+        inst._renamed()
+
+    def __delete__(self, inst):
+        _SchemaAlias.__delete__(self, inst)
+        inst._renamed()
+
+
+def _slot_names(cls):
+    """Return the names of the instance slots defined by ``cls`` and its
+    bases (excluding ``__dict__`` and ``__weakref__``) which are copied
+    along with a field, i.e. all of them but the slots listed in
+    ``cls._cache_slots``, and a getter returning their values."""
+    names = _slot_names_cache.get(cls)
+    if names is None:
+        names = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get("__slots__", ()):
+                if name not in ("__dict__", "__weakref__"):
+                    if name not in cls._cache_slots:
+                        names.append(name)
+        names = _slot_names_cache[cls] = (
+            tuple(names),
+            operator.attrgetter(*names),
+        )
+    return names
+
+
+_slot_names_cache = {}
+
+
+def _copy_field(field):
+    """Return a shallow copy of ``field`` made without calling its
+    constructor.  Values are shared with ``field``, except for the
+    instance dictionary, which is copied, and the slots holding derived
+    data, which are reset."""
+    cls = field.__class__
+    copied = cls.__new__(cls)
+    names, getter = _slot_names(cls)
+    try:
+        values = getter(field)
+    except AttributeError:
+        # some slot is unset; copy the others one by one
+        for name in names:
+            value = getattr(field, name, _marker)
+            if value is not _marker:
+                setattr(copied, name, value)
+    else:
+        for name, value in zip(names, values):
+            setattr(copied, name, value)
+    for name in cls._cache_slots:
+        setattr(copied, name, None)
+    extra = field.__dict__
+    if extra:
+        copied.__dict__.update(extra)
+    return copied
+
+
+@functools.lru_cache(maxsize=2048)
+def _item_css_class(name):
+    css_class = (
+        unicodedata.normalize("NFKD", name)
+        .encode("ascii", "ignore")
+        .decode("ascii")
+    )
+    css_class = re.sub(r"[^\w\s-]", "", css_class).strip().lower()  # noQA
+    css_class = re.sub(r"[-\s]+", "-", css_class)  # noQA
+    return "item-%s" % css_class
+
+
+class WidgetOverrides(object):
+    """A compiled set of widget overrides, as accepted by
+    :meth:`deform.Field.set_widgets`.
+
+    ``values`` is a dictionary mapping dotted field names to widgets and
+    ``separator`` the string separating the names in its keys, with the
+    same meaning as the arguments of :meth:`deform.Field.set_widgets`.
+    The keys are compiled into a trie of name elements, so applying the
+    overrides visits each field named by a key prefix once, whatever the
+    number of keys.  The object does not refer to any field and can be
+    applied to any number of forms built from the same schema.
+
+    Applying the overrides behaves like applying each key in turn: when
+    several keys name the same field, the last one wins, and if a key
+    names a field which does not exist, the widgets of the keys before it
+    are assigned and the :exc:`KeyError` (or :exc:`IndexError` for a
+    ``*`` element naming the first child of a field without children)
+    raised by the lookup is propagated.
+    """
+
+    def __init__(self, values, separator="."):
+        self.widgets = []
+        # a trie node is [indexes of the keys ending here, {element:
+        # node}, index of the first key passing through]
+        self._trie = [[], {}, 0]
+        for index, (key, value) in enumerate(values.items()):
+            node = self._trie
+            if key:
+                for element in key.split(separator):
+                    branch = node[1].get(element)
+                    if branch is None:
+                        branch = node[1][element] = [[], {}, index]
+                    node = branch
+            node[0].append(index)
+            self.widgets.append(value)
+
+    def apply(self, field):
+        """Assign the widgets to ``field`` and its descendants."""
+        widgets = self.widgets
+        targets = [None] * len(widgets)
+        failure = None  # (index of the first failing key, exception)
+        visited = []
+        stack = [(field, self._trie)]
+        while stack:
+            field, (indexes, branches, _) = stack.pop()
+            visited.append(field)
+            for index in indexes:
+                targets[index] = field
+            for element, branch in branches.items():
+                try:
+                    if element == "*":
+                        child = field.children[0]
+                    else:
+                        child = field[element]
+                except (KeyError, IndexError) as e:
+                    if failure is None or branch[2] < failure[0]:
+                        failure = (branch[2], e)
+                    continue
+                stack.append((child, branch))
+        end = len(widgets) if failure is None else failure[0]
+        for index in range(end):
+            target = targets[index]
+            if _is_stock(target, "widget"):
+                target._widget = widgets[index]
+            else:
+                target.widget = widgets[index]
+        # every target is in ``visited`` along with all its ancestors up to
+        # the field the overrides are applied to
+        for target in visited:
+            if _is_stock(target, "widget"):
+                target._tree_cache = None
+        visited[0]._invalidate_tree_cache()
+        if failure is not None:
+            raise failure[1]
+
+
+class PathOids(object):
+    """An oid strategy deriving the ``oid`` of each field from its path in
+    the field tree instead of the order of its construction, so a form
+    renders the same HTML whatever else was constructed or cloned before
+    it.  Pass an instance as the ``oid_strategy`` argument of a form (or
+    of a root field) to opt in; the default oids look like
+    ``deformField0``.
+
+    The oid of the root field is ``deformField``, or
+    ``deformField-<namespace>`` if ``namespace`` is passed (use distinct
+    namespaces for forms rendered on the same page).  The oid of any
+    other field is the oid of its parent followed by ``-`` and the name
+    of the field, with every character other than letters, digits and
+    ``_`` replaced by ``_``.  The items rendered by a
+    :class:`deform.widget.SequenceWidget` use their index in place of the
+    name.  The prototype used to add items in the browser has the oid of
+    the sequence followed by ``--proto``, a marker ``join`` cannot
+    produce, which ``deform.js`` replaces when it inserts an item.
+
+    Fields with an ``oid`` set on their schema node keep it.  Oids which
+    are not unique within a form raise a :exc:`ValueError` when the form
+    is constructed (or, for lazy forms, when the children of a field are
+    materialized).
+    """
+
+    prefix = "deformField"
+    proto = "--proto"
+
+    def __init__(self, namespace=None):
+        self.root_oid = self.prefix
+        if namespace is not None:
+            self.root_oid = self.join(self.prefix, namespace)
+
+    def __repr__(self):
+        return "<%s %s>" % (self.__class__.__name__, self.root_oid)
+
+    def join(self, oid, name):
+        """Return the oid of a field named ``name`` whose parent has the
+        oid ``oid``."""
+        return "%s-%s" % (oid, re.sub(r"\W", "_", str(name)) or "_")
+
+    def oid(self, field):
+        """Return the oid of ``field``."""
+        parent = field.parent
+        if parent is None:
+            return self.root_oid
+        return self.join(parent.oid, field.name)
+
+    def item_oid(self, field, index):
+        """Return the oid of the item at position ``index`` of the
+        sequence ``field``, or of its prototype if ``index`` is
+        ``None``."""
+        if index is None:
+            return field.oid + self.proto
+        return self.join(field.oid, index)
+
+    def check(self, fields):
+        """Raise a :exc:`ValueError` if two of ``fields`` have the same
+        oid."""
+        seen = {}
+        for field in fields:
+            oid = field.oid
+            other = seen.setdefault(oid, field)
+            if other is not field:
+                raise ValueError(
+                    "Fields %r and %r have the same oid %r"
+                    % (other, field, oid)
+                )
+
+
+FieldIndexEntry = collections.namedtuple(
+    "FieldIndexEntry", ("field", "path", "parent", "depth", "category")
+)
+
+
+class FieldIndex(object):
+    """A flat index of a field and its descendants in document order,
+    as returned by :meth:`deform.Field.get_field_index`.
+
+    The index holds parallel tuples with one element per field:
+
+    ``fields``
+        The fields.  A field comes before its children and the items of
+        its ``sequence_fields`` (which follow the children), and all of
+        its descendants come before its next sibling.
+
+    ``paths``
+        The dotted path of each field relative to the indexed field, as
+        understood by :meth:`deform.Field.get_field` (``''`` for the
+        indexed field itself, the position of the item for sequence
+        items).
+
+    ``parents``
+        The position of the parent of each field (``-1`` for the indexed
+        field).
+
+    ``depths``
+        The depth of each field (``0`` for the indexed field).
+
+    ``categories``
+        The ``category`` of the widget of each field (see
+        :class:`deform.widget.Widget`).
+
+    ``ends``
+        The position following the last descendant of each field, so the
+        subtree of the field at position ``pos`` is
+        ``fields[pos:ends[pos]]``.
+
+    Indexing the index returns a :class:`deform.field.FieldIndexEntry`
+    named tuple of ``(field, path, parent, depth, category)``.
+    """
+
+    __slots__ = (
+        "fields",
+        "paths",
+        "parents",
+        "depths",
+        "categories",
+        "ends",
+        "_positions",
+    )
+
+    def __init__(self, fields, paths, parents, depths, categories, ends):
+        self.fields = tuple(fields)
+        self.paths = tuple(paths)
+        self.parents = tuple(parents)
+        self.depths = tuple(depths)
+        self.categories = tuple(categories)
+        self.ends = tuple(ends)
+        self._positions = None
+
+    @classmethod
+    def build(cls, field, state=None):
+        """Return the index of ``field`` and its descendants, reading the
+        ``sequence_fields`` of the request ``state`` if one is passed."""
+        columns = ([], [], [], [], [])
+        _flatten(field, "", 0, -1, state, columns)
+        ends = _subtree_ends(columns[2], 0)
+        return cls(*columns, ends)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __iter__(self):
+        for pos in range(len(self.fields)):
+            yield self[pos]
+
+    def __getitem__(self, pos):
+        return FieldIndexEntry(
+            self.fields[pos],
+            self.paths[pos],
+            self.parents[pos],
+            self.depths[pos],
+            self.categories[pos],
+        )
+
+    def __contains__(self, field):
+        return field in self._get_positions()
+
+    def _get_positions(self):
+        positions = self._positions
+        if positions is None:
+            positions = self._positions = {
+                field: pos for pos, field in enumerate(self.fields)
+            }
+        return positions
+
+    def position(self, field):
+        """Return the position of ``field`` in the index or raise a
+        :exc:`KeyError` if it is not indexed."""
+        return self._get_positions()[field]
+
+    def subtree(self, pos):
+        """Return the range of the positions of the field at ``pos`` and
+        its descendants."""
+        return range(pos, self.ends[pos])
+
+    def replace_items(self, field, items, state=None):
+        """Return the index resulting from assigning ``items`` (a sequence
+        of fields, or ``None``) to the ``sequence_fields`` of the indexed
+        field ``field``, or this index if ``field`` is not indexed.  Only
+        the items are walked; the rest of the index is shifted."""
+        pos = self._get_positions().get(field)
+        if pos is None:
+            return self
+        ends = self.ends
+        end = ends[pos]
+        # the items follow the subtrees of the children
+        start = pos + 1
+        for num in range(len(field.children)):
+            start = ends[start]
+        parents = self.parents
+        columns = ([], [], [], [], [])
+        path = self.paths[pos]
+        depth = self.depths[pos] + 1
+        for num, item in enumerate(items or ()):
+            _flatten(
+                item,
+                "%s.%s" % (path, num) if path else str(num),
+                depth,
+                -1,
+                state,
+                columns,
+            )
+        delta = len(columns[0]) - (end - start)
+        new_parents = columns[2]
+        new_ends = _subtree_ends(new_parents, start)
+        new_parents = [pos if p < 0 else p + start for p in new_parents]
+        # the ends of the field and its ancestors move with the items
+        head = [e + delta if e >= end else e for e in ends[: pos + 1]]
+        head.extend(ends[pos + 1 : start])
+        tail = [e + delta for e in ends[end:]]
+        return FieldIndex(
+            self.fields[:start] + tuple(columns[0]) + self.fields[end:],
+            self.paths[:start] + tuple(columns[1]) + self.paths[end:],
+            parents[:start]
+            + tuple(new_parents)
+            + tuple(p + delta if p >= end else p for p in parents[end:]),
+            self.depths[:start] + tuple(columns[3]) + self.depths[end:],
+            self.categories[:start]
+            + tuple(columns[4])
+            + self.categories[end:],
+            head + new_ends + tail,
+        )
+
+
+def _sequence_items(field, state):
+    """Return the ``sequence_fields`` of ``field`` (in the request
+    ``state`` if one is passed), or ``None`` if it is not set."""
+    if state is not None:
+        field_state = state.get(field)
+        if field_state is not None:
+            return field_state.sequence_fields
+    return field._sequence_fields
+
+
+def _flatten(field, path, depth, parent, state, columns):
+    """Append ``field`` (whose parent is at position ``parent``) and its
+    descendants in document order to the ``columns`` of a
+    :class:`FieldIndex` (without the ends)."""
+    fields, paths, parents, depths, categories = columns
+    stack = [field]
+    stack_paths = [path]
+    stack_parents = [parent]
+    stack_depths = [depth]
+    while stack:
+        field = stack.pop()
+        path = stack_paths.pop()
+        depth = stack_depths.pop()
+        pos = len(fields)
+        fields.append(field)
+        paths.append(path)
+        parents.append(stack_parents.pop())
+        depths.append(depth)
+        categories.append(getattr(field.widget, "category", "default"))
+        prefix = path + "." if path else ""
+        names = [child.name for child in field.children]
+        items = [field.children]
+        sequence_fields = _sequence_items(field, state)
+        if sequence_fields:
+            names.extend(str(num) for num in range(len(sequence_fields)))
+            items.append(sequence_fields)
+        children = [child for part in items for child in part]
+        for num in range(len(children) - 1, -1, -1):
+            stack.append(children[num])
+            stack_paths.append(prefix + names[num])
+            stack_parents.append(pos)
+            stack_depths.append(depth + 1)
+
+
+def _subtree_ends(parents, offset):
+    """Return the ends of the subtrees of a document-order list of fields
+    given the positions of their ``parents`` in the list (``-1`` for the
+    roots), offset by ``offset``."""
+    ends = list(range(1, len(parents) + 1))
+    for pos in range(len(parents) - 1, -1, -1):
+        parent = parents[pos]
+        if parent >= 0 and ends[pos] > ends[parent]:
+            ends[parent] = ends[pos]
+    return [end + offset for end in ends]
+
+
+def _changing(method):
+    def changing(self, *args, **kw):
+        owner = self._owner()
+        if owner is not None:
+            owner._children_changing()
+        return method(self, *args, **kw)
+
+    changing.__name__ = method.__name__
+    changing.__doc__ = method.__doc__
+    return changing
+
+
+class _ChildList(list):
+    """The ``children`` of a field: a list which tells the field (held by
+    weak reference) before its contents change, so that the data the
+    field derives from its children is computed again.  Fields whose
+    schema node has no children, but for the root field, have a plain
+    list, which spares a weak reference per leaf field.  Copies are plain
+    lists."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner, children=()):
+        list.__init__(self, children)
+        self._owner = weakref.ref(owner)
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    __setitem__ = _changing(list.__setitem__)
+    __delitem__ = _changing(list.__delitem__)
+    __iadd__ = _changing(list.__iadd__)
+    __imul__ = _changing(list.__imul__)
+    append = _changing(list.append)
+    extend = _changing(list.extend)
+    insert = _changing(list.insert)
+    pop = _changing(list.pop)
+    remove = _changing(list.remove)
+    clear = _changing(list.clear)
+    sort = _changing(list.sort)
+    reverse = _changing(list.reverse)
+
+
+# fields append to the children they build without notifying themselves
+_append_child = list.append
+
+
+class _PendingChildren(object):
+    """Stands in for the children of a lazy field until they are
+    materialized.  ``kw`` holds the keyword arguments passed on to the
+    children and ``plan`` the part of the autofocus plan (see
+    :func:`_autofocus_plan`) relative to the lazy field, or ``None`` if
+    it is computed from the schema when the children are materialized
+    (see :meth:`deform.Field._resolve_autofocus_plan`)."""
+
+    __slots__ = ("kw", "plan")
+
+    def __init__(self, kw, plan=None):
+        self.kw = kw
+        self.plan = plan
+
+
+class _PendingCstruct(object):
+    """Stands in for the cstructs of the fields of a tree built from
+    ``appstruct`` until one of them is needed, so building a form which
+    is only validated does not serialize its appstruct (see
+    :meth:`deform.Field._resolve_cstruct`).  A mapping or list appstruct
+    is copied (not deeply), so assigning its items once the form is
+    built does not change what the form renders.  The root field is kept
+    alive until then, as a subfield may outlive the form it belongs to
+    and still need its share of the appstruct."""
+
+    __slots__ = ("root", "appstruct")
+
+    def __init__(self, root, appstruct):
+        self.root = root
+        if isinstance(appstruct, (dict, list)):
+            appstruct = copy.copy(appstruct)
+        self.appstruct = appstruct
+
+    def resolve(self):
+        """Serialize the appstruct with the schema of the root field and
+        assign its parts to the fields of the tree still holding this
+        object."""
+        root = self.root
+        if root is None:
+            return  # already resolved
+        root._apply_appstruct(self.appstruct, initial=True, pending=self)
+        self.root = self.appstruct = None
+
+
+def _autofocus_plan(schema):
+    """Return the autofocus plan of the field tree built from ``schema``
+    with the default ``focus``.
+
+    The plan is a ``(target, first)`` pair of tuples of child positions
+    leading from ``schema`` to a descendant node, either of which may be
+    ``None``.  ``target`` leads to the node whose field receives
+    automatic focus.  ``first`` leads to the first focusable input, and
+    a field has ``have_first_input`` set once the tree is built when that
+    input precedes the end of its subtree in document order; ``()`` means
+    every field has it set.  This is the decision the :class:`Field`
+    constructor takes as it builds the tree eagerly; lazy fields compute
+    it before they build their children."""
+    # frames are [children iterator, child count, focused]
+    stack = [[iter(schema.children), 0, False]]
+    while stack:
+        frame = stack[-1]
+        children, num, focused = frame
+        child = next(children, _marker)
+        if child is _marker:
+            stack.pop()
+            continue
+        if (
+            not focused
+            and type(child.typ) in Field.focusable_input_types
+            and type(child.widget) is not Field.hidden_type
+        ):
+            first = tuple(frame[1] - 1 for frame in stack[:-1]) + (num,)
+            # the input receives focus unless it or one of its following
+            # siblings has ``autofocus`` set; the rest of the tree does not
+            # matter
+            for node in itertools.chain((child,), children):
+                if getattr(node, "autofocus", None) is not None:
+                    return None, first
+            return first, first
+        if getattr(child, "autofocus", None) is not None:
+            frame[2] = True
+        frame[1] = num + 1
+        stack.append([iter(child.children), 0, False])
+    return None, None
+
+
+def _child_plan(plan, num):
+    """Return the part of the autofocus ``plan`` of a field relative to
+    its child at position ``num``, and whether that child receives
+    automatic focus."""
+    target, first = plan
+    if target is not None:
+        if target[0] == num:
+            target = target[1:]
+        else:
+            target = None
+    if first:
+        if first[0] == num:
+            first = first[1:]
+        elif first[0] < num:
+            first = ()
+        else:
+            first = None
+    if target == ():
+        return (None, first), True
+    return (target, first), False
+
+
+def _unchanged(cstruct, current):
+    """Return true if ``cstruct`` is the same object as, or of the same
+    type as and equal to, the ``current`` cstruct of a field."""
+    return cstruct is current or (
+        cstruct.__class__ is current.__class__ and cstruct == current
+    )
+
+
+def _is_plain_mapping(node):
+    """Return true if ``node`` serializes an appstruct exactly like
+    :class:`colander.Mapping` does when it ignores unknown keys, which
+    :meth:`deform.Field._apply_appstruct` can do while it walks the
+    fields."""
+    typ = node.typ
+    return (
+        typ.__class__ is colander.Mapping
+        and typ.unknown == "ignore"
+        and getattr(node.serialize, "__func__", None)
+        is colander.SchemaNode.serialize
+    )
+
+
+def _is_stock(field, name):
+    """Return true if the attribute ``name`` of ``field`` is the one
+    defined by :class:`Field`.  Tree traversals handle the descendants
+    for which this is true themselves and call the attribute of the
+    others (e.g. objects standing in for fields in tests)."""
+    return getattr(field.__class__, name, None) is getattr(Field, name)
+
+
 class Field(object):
     """Represents an individual form field (a visible object in a
     form rendering).
@@ -71,6 +769,19 @@ class Field(object):
             custom oid can provided, but if the field is cloned,
             the clones will get unique default oids.
 
+        cstruct_diff
+            If true, assigning the ``cstruct`` of a field skips the
+            subtrees whose cstruct is unchanged, see
+            :meth:`deform.Field.update_cstruct`.  It is passed to the
+            constructor of the root field and shared with its descendants.
+            Default: ``False``.
+
+        oid_strategy
+            ``None`` (the default) or an object computing the default
+            oids of the fields of a form, such as :class:`deform.PathOids`.
+            It is passed to the constructor of the root field and shared
+            with its descendants.
+
         name
             An alias for self.schema.name
 
@@ -86,8 +797,14 @@ class Field(object):
         typ
             An alias for self.schema.typ
 
+        The aliases above are looked up on the schema node each time
+        they are accessed; assigning a value to one of them on the
+        field overrides the schema value for this field only.
+
         children
-            Child fields of this field.
+            Child fields of this field.  Lookups by name (``field[name]``
+            and ``name in field``) are answered from an index which is
+            rebuilt when ``children`` is reassigned or changes length.
 
         parent
             The parent field of this field or ``None`` if this field is
@@ -144,7 +861,10 @@ class Field(object):
       The ``appstruct`` constructor argument is used to prepopulate field
       values related to this form's schema.  If an appstruct is not supplied,
       the form's fields will be rendered with default values unless an
-      appstruct is supplied to the ``render`` method explicitly.
+      appstruct is supplied to the ``render`` method explicitly.  The
+      appstruct is serialized when the ``cstruct`` of a field is first
+      needed (e.g. for rendering), not by the constructor, so a form which
+      is only validated never serializes it.
 
       The :class:`deform.Field` constructor also accepts *arbitrary*
       keyword arguments.  When an 'unknown' keyword argument is
@@ -154,12 +874,69 @@ class Field(object):
       All keyword arguments (explicit and unknown) are also attached to
       all *children* nodes of the field being constructed.
 
+      If ``lazy`` is true, the children of the field are not constructed
+      along with it: they are materialized the first time ``children`` is
+      accessed (by iterating over the field, looking a child up by name,
+      rendering or validating), and the cstruct of the field is only
+      propagated to its children at that point.  Each child is lazy in
+      turn, so the subtrees of a large form which are never touched
+      during a request are never built.  Fields of a lazy tree receive
+      their ``order`` (and therefore their default ``oid``) when they are
+      materialized rather than in document order.  Default: ``False``.
+
+    *Memory layout*
+
+      Fields are created in large numbers (one per schema node, plus one
+      per item of each rendered or submitted sequence), so the attributes
+      every field carries are stored in ``__slots__`` and the aliases of
+      schema attributes are not copied onto the field.  An instance
+      dictionary is still available and is only allocated when an
+      attribute which is not a slot is assigned (for example an unknown
+      constructor keyword argument or scratchpad state set by a widget).
+      Subclasses which do not declare ``__slots__`` themselves keep
+      working unchanged.
+
     """
 
-    error = None
-    _cstruct = colander.null
-    default_renderer = template.default_renderer
-    default_resource_registry = widget.default_resource_registry
+    __slots__ = (
+        "counter",
+        "order",
+        "schema",
+        "_renderer",
+        "_resource_registry",
+        "autofocus",
+        "focus",
+        "oid_strategy",
+        "cstruct_diff",
+        "_have_first_input",
+        "_error",
+        "_cstruct",
+        "_oid",
+        "_parent",
+        "_widget",
+        "_aliases",
+        "_children",
+        "_child_index",
+        "_tree_cache",
+        "_sequence_fields",
+        "__dict__",
+        "__weakref__",
+    )
+
+    # slots holding data derived from the field tree; they are reset when
+    # a field is copied
+    _cache_slots = ("_child_index", "_tree_cache")
+
+    name = _NameAlias("name")
+    title = _SchemaAlias("title")
+    description = _SchemaAlias("description")
+    required = _SchemaAlias("required")
+    typ = _SchemaAlias("typ")  # required by Invalid exception
+
+    default_renderer = _LazyDefault("deform.template", "default_renderer")
+    default_resource_registry = _LazyDefault(
+        "deform.widget", "default_resource_registry"
+    )
     # Allowable input types for automatic focusing
     focusable_input_types = (
         type(colander.Boolean()),
@@ -183,32 +960,87 @@ class Field(object):
         appstruct=colander.null,
         parent=None,
         autofocus=None,
+        lazy=False,
+        oid_strategy=None,
+        cstruct_diff=False,
         **kw
     ):
+        self._setup(
+            schema,
+            renderer,
+            counter,
+            resource_registry,
+            parent,
+            autofocus,
+            oid_strategy,
+            cstruct_diff,
+            kw,
+        )
+        # the appstruct is serialized when the cstruct of a field of the
+        # tree is needed; the descendants share the placeholder
+        self._cstruct = _PendingCstruct(self, appstruct)
+        if self._have_first_input:
+            plan = (None, ())
+        elif parent is None and self.focus == "on":
+            # the field receiving automatic focus is decided from the
+            # schema as the children are built
+            plan = None
+        else:
+            plan = (None, None)
+        if lazy:
+            if schema.children:
+                if plan is None:
+                    self._have_first_input = None
+                self._children = _PendingChildren(kw, plan)
+        else:
+            self._build_children(kw, plan)
+            if parent is None and self.oid_strategy is not None:
+                self.oid_strategy.check(self._walk())
+        if self.__class__.set_appstruct is not Field.set_appstruct:
+            # a subclass customizing set_appstruct gets it called by the
+            # constructor as it always did
+            self.set_appstruct(appstruct)
+
+    def _setup(
+        self,
+        schema,
+        renderer,
+        counter,
+        resource_registry,
+        parent,
+        autofocus,
+        oid_strategy,
+        cstruct_diff,
+        kw,
+    ):
+        """Initialize the attributes of this field, but not its
+        children."""
         self.counter = counter or itertools.count()
         self.order = next(self.counter)
-        self.oid = getattr(schema, "oid", "deformField%s" % self.order)
+        self._oid = getattr(schema, "oid", None)
         self.schema = schema
-        self.typ = schema.typ  # required by Invalid exception
-        self.name = schema.name
-        self.title = schema.title
-        self.description = schema.description
-        self.required = schema.required
+        self._aliases = None
+        self._widget = None
+        self._error = None
+        self._cstruct = colander.null
         if renderer is None:
-            renderer = self.default_renderer
+            renderer = _class_default(self.__class__, "default_renderer")
         if resource_registry is None:
-            resource_registry = self.default_resource_registry
-        self.renderer = renderer
+            resource_registry = _class_default(
+                self.__class__, "default_resource_registry"
+            )
+        self._renderer = renderer
 
         # Parameters passed from parent field to child
         if "focus" in kw:
             focus = kw["focus"]
         else:
             focus = "on"
+        self.focus = focus
         if "have_first_input" in kw:
-            self.have_first_input = kw["have_first_input"]
+            self._have_first_input = kw["have_first_input"]
         else:
-            self.have_first_input = False
+            self._have_first_input = False
 
         if (
             focus == "off"
@@ -220,59 +1052,174 @@ class Field(object):
         else:
             self.autofocus = "autofocus"
 
-        self.resource_registry = resource_registry
-        self.children = []
+        self._resource_registry = resource_registry
+        self.oid_strategy = oid_strategy
+        self.cstruct_diff = cstruct_diff
+        if schema.children or parent is None:
+            self._children = _ChildList(self)
+        else:
+            self._children = []
+        self._child_index = None
+        self._tree_cache = None
+        self._sequence_fields = None
         if parent is not None:
             parent = weakref.ref(parent)
         self._parent = parent
-        self.__dict__.update(kw)
-
-        first_input_index = -1
-        child_count = 0
-        focused = False
-        for child in schema.children:
-            if (
-                focus == "on"
-                and not focused
-                and type(child.typ) in Field.focusable_input_types
-                and type(child.widget) is not Field.hidden_type
-                and not self.have_first_input
-            ):
-                first_input_index = child_count
-                self.found_first()  # Notify ancestors
+        for key, value in kw.items():
+            setattr(self, key, value)
+
+    def _build_children(self, kw, plan):
+        """Construct the descendants of this field in document order,
+        applying the autofocus ``plan`` (see :func:`_autofocus_plan`)
+        relative to this field or, if ``plan`` is ``None``, deciding which
+        field receives automatic focus as they are built.
+
+        The tree is built with an explicit stack holding one frame per
+        field whose children are being constructed, so the depth of the
+        schema is not limited by the recursion limit.  A frame is
+        ``[field, schema children iterator, kw, plan, child count, first
+        input position, focused]``, the last two being used when
+        deciding."""
+        found = False
+        stack = [[self, iter(self.schema.children), kw, plan, 0, -1, False]]
+        while stack:
+            frame = stack[-1]
+            field, children, kw, plan, num, first_input_index, focused = frame
+            child = next(children, _marker)
+            if child is _marker:
+                stack.pop()
+                if plan is None:
+                    field._have_first_input = found
+                    if not focused and first_input_index != -1:
+                        # User did not set autofocus. Focus on first valid
+                        # input.
+                        field._children[first_input_index].autofocus = (
+                            "autofocus"
+                        )
+                continue
+            frame[4] = num + 1
             autofocus = getattr(child, "autofocus", None)
-
-            if autofocus is not None:
-                focused = True
-
-            kw["have_first_input"] = self.have_first_input
-            self.children.append(
-                Field(
-                    child,
-                    renderer=renderer,
-                    counter=self.counter,
-                    resource_registry=resource_registry,
-                    parent=self,
-                    autofocus=autofocus,
-                    **kw
-                )
+            if plan is None:
+                child_plan = None
+                if (
+                    not found
+                    and not focused
+                    and type(child.typ) in Field.focusable_input_types
+                    and type(child.widget) is not Field.hidden_type
+                ):
+                    frame[5] = num
+                    found = True
+                if autofocus is not None:
+                    frame[6] = True
+            else:
+                child_plan, focused = _child_plan(plan, num)
+            child_kw = dict(kw)
+            child_field = Field.__new__(Field)
+            child_field._setup(
+                child,
+                field._renderer,
+                field.counter,
+                field._resource_registry,
+                field,
+                autofocus,
+                field.oid_strategy,
+                field.cstruct_diff,
+                child_kw,
+            )
+            child_field._cstruct = field._cstruct
+            if child_plan is not None:
+                child_field._have_first_input = child_plan[1] is not None
+                if focused:
+                    # User did not set autofocus. Focus on first valid
+                    # input.
+                    child_field.autofocus = "autofocus"
+            _append_child(field._children, child_field)
+            stack.append(
+                [
+                    child_field,
+                    iter(child.children),
+                    child_kw,
+                    child_plan,
+                    0,
+                    -1,
+                    False,
+                ]
             )
-            child_count += 1
-        if (
-            focus == "on"
-            and not focused
-            and first_input_index != -1
-            and self.have_first_input
-        ):
-            # User did not set autofocus. Focus on first valid input.
-            self.children[first_input_index].autofocus = "autofocus"
-        self.set_appstruct(appstruct)
 
     def found_first(self):
         """Set have_first_input of ancestors"""
-        self.have_first_input = True
-        if self.parent is not None:
-            self.parent.found_first()
+        field = self
+        while field is not None:
+            field._have_first_input = True
+            field = field.parent
+
+    def _get_have_first_input(self):
+        value = self._have_first_input
+        if value is None:
+            # a lazy field whose autofocus plan is not computed yet
+            self._resolve_autofocus_plan(self._children)
+            value = self._have_first_input
+        return value
+
+    def _set_have_first_input(self, value):
+        self._have_first_input = value
+
+    have_first_input = property(_get_have_first_input, _set_have_first_input)
+
+    def _resolve_autofocus_plan(self, pending):
+        """Return the autofocus plan of the ``pending`` children of this
+        lazy field, computing it from the schema if it was left to be
+        decided, in which case ``have_first_input`` is set as well."""
+        plan = pending.plan
+        if plan is None:
+            plan = pending.plan = _autofocus_plan(self.schema)
+        if self._have_first_input is None:
+            self._have_first_input = plan[1] is not None
+        return plan
+
+    def _get_oid(self):
+        oid = self._oid
+        if oid is None:
+            strategy = self.oid_strategy
+            if strategy is None:
+                oid = "deformField%s" % self.order
+            else:
+                oid = strategy.oid(self)
+            self._oid = oid
+        return oid
+
+    def _set_oid(self, oid):
+        self._oid = oid
+
+    oid = property(_get_oid, _set_oid)
+
+    # Until a field is rendered, its renderer and resource registry may
+    # be the placeholder of the default ones, which are only created when
+    # they are first used (see ``_LazyDefault``).
+
+    def _get_renderer(self):
+        renderer = self._renderer
+        if renderer.__class__ is _LazyDefault:
+            renderer = self._renderer = renderer.resolve()
+        return renderer
+
+    def _set_renderer(self, renderer):
+        self._renderer = renderer
+
+    renderer = property(_get_renderer, _set_renderer)
+
+    def _get_resource_registry(self):
+        registry = self._resource_registry
+        if registry.__class__ is _LazyDefault:
+            registry = self._resource_registry = registry.resolve()
+        return registry
+
+    def _set_resource_registry(self, registry):
+        self._resource_registry = registry
+
+    resource_registry = property(
+        _get_resource_registry, _set_resource_registry
+    )
 
     @property
     def parent(self):
@@ -310,7 +1257,10 @@ class Field(object):
 
         This method is effectively a shortcut for
         ``cls.set_default_renderer(ZPTRendererFactory(...))``."""
-        cls.default_renderer = template.ZPTRendererFactory(
+        # Deform
+        from deform.template import ZPTRendererFactory
+
+        cls.default_renderer = ZPTRendererFactory(
             search_path,
             auto_reload=auto_reload,
             debug=debug,
@@ -355,19 +1305,340 @@ class Field(object):
         """Iterate over the children fields of this field."""
         return iter(self.children)
 
+    def _get_children(self):
+        children = self._children
+        if children.__class__ is _PendingChildren:
+            children = self._materialize_children(children)
+        return children
+
+    def _materialize_children(self, pending):
+        kw = pending.kw
+        plan = self._resolve_autofocus_plan(pending)
+        children = self._children = _ChildList(self)
+        for num, child in enumerate(self.schema.children):
+            field = Field(
+                child,
+                renderer=self._renderer,
+                counter=self.counter,
+                resource_registry=self._resource_registry,
+                parent=self,
+                autofocus=getattr(child, "autofocus", None),
+                lazy=True,
+                oid_strategy=self.oid_strategy,
+                cstruct_diff=self.cstruct_diff,
+                **kw
+            )
+            child_plan, focused = _child_plan(plan, num)
+            field._have_first_input = child_plan[1] is not None
+            if focused:
+                field.autofocus = "autofocus"
+            if field._children.__class__ is _PendingChildren:
+                field._children.plan = child_plan
+            _append_child(children, field)
+        if self.oid_strategy is not None:
+            self.oid_strategy.check(children)
+        cstruct = self._cstruct
+        if cstruct.__class__ is _PendingCstruct:
+            for field in children:
+                field._cstruct = cstruct
+        else:
+            # propagate the cstruct assigned while the children were pending
+            self._apply_cstruct(cstruct)
+        state = _current_state()
+        if state is not None and state.get(self) is not None:
+            self._apply_cstruct(state.get(self).cstruct, state=state)
+        return children
+
+    def _set_children(self, children):
+        self._children_changing()
+        self._children = _ChildList(self, children)
+
+    children = property(_get_children, _set_children)
+
+    def _children_changing(self):
+        # called before ``children`` is reassigned, and by ``children`` (a
+        # ``_ChildList``) before it is changed in place
+        pending = self._cstruct
+        if pending.__class__ is _PendingCstruct:
+            # the appstruct is serialized for the tree as it was built
+            pending.resolve()
+        self._child_index = None
+        self._invalidate_tree_cache()
+
+    def _renamed(self):
+        # called when ``name`` is assigned or deleted
+        parent = self.parent
+        if parent is not None:
+            parent._child_index = None
+        self._invalidate_tree_cache()
+
+    def _get_child_index(self):
+        # The index maps child names to positions in ``children``.  It is
+        # rebuilt when ``children`` is reassigned or changed in place (or,
+        # for a plain list, changes length) and when a child is renamed.
+        children = self.children
+        index = self._child_index
+        if index is None or index[0] != len(children):
+            positions = {}
+            for pos, child in enumerate(children):
+                positions.setdefault(child.name, pos)
+            index = self._child_index = (len(children), positions)
+        return index[1]
+
+    def _find_child(self, name):
+        pos = self._get_child_index().get(name)
+        if pos is not None:
+            child = self._children[pos]
+            if child.name == name:
+                return child
+            # a child was replaced in place; rebuild and look again
+            self._child_index = None
+            pos = self._get_child_index().get(name)
+            if pos is not None:
+                return self._children[pos]
+        elif self._children.__class__ is not _ChildList:
+            # a plain list may have been changed in place without changing
+            # its length; trust the index only if a scan agrees
+            for child in self._children:
+                if child.name == name:
+                    self._child_index = None
+                    return child
+        return None
+
     def __getitem__(self, name):
         """Return the subfield of this field named ``name`` or raise
         a :exc:`KeyError` if a subfield does not exist named ``name``."""
-        for child in self.children:
-            if child.name == name:
-                return child
-        raise KeyError(name)
+        child = self._find_child(name)
+        if child is None:
+            raise KeyError(name)
+        return child
 
     def __contains__(self, name):
-        for child in self.children:
-            if child.name == name:
-                return True
-        return False
+        return self._find_child(name) is not None
+
+    def _invalidate_tree_cache(self):
+        # The tree cache of a field holds data derived from the subtree
+        # rooted at the field (its path and oid index, its widget
+        # requirements); it is dropped for the field and its ancestors
+        # when ``children``, ``sequence_fields`` or ``widget`` of a field
+        # is assigned, ``children`` is changed in place or a field is
+        # renamed, along with the indexes of the current request.
+        state = _current_state()
+        node = self
+        while node is not None:
+            node._tree_cache = None
+            if state is not None:
+                state._indexes.pop(node, None)
+            node = node.parent
+
+    def _get_tree_cache(self):
+        cache = self._tree_cache
+        if cache is None:
+            cache = self._tree_cache = {}
+        return cache
+
+    def _get_tree_index(self):
+        state = _current_state()
+        if state is None:
+            cache = self._get_tree_cache()
+        else:
+            # the sequence fields of the request are indexed as well
+            cache = state._indexes.setdefault(self, {})
+        index = cache.get("index")
+        if index is None:
+            paths = {}
+            oids = {}
+            stack = [((), self)]
+            while stack:
+                path, field = stack.pop()
+                paths.setdefault(path, field)
+                oids.setdefault(field.oid, field)
+                items = [
+                    (path + (child.name,), child) for child in field.children
+                ]
+                sequence_fields = _sequence_items(field, state)
+                if sequence_fields:
+                    items.extend(
+                        (path + (str(num),), child)
+                        for num, child in enumerate(sequence_fields)
+                    )
+                stack.extend(reversed(items))
+            index = cache["index"] = (paths, oids)
+        return index
+
+    def get_field(self, path, separator="."):
+        """Return the descendant of this field found at the dotted
+        name ``path`` or raise a :exc:`KeyError` if no such field exists.
+
+        ``path`` is interpreted like the keys passed to
+        :meth:`deform.Field.set_widgets`: the empty string means this
+        field itself and an element named ``*`` means the first child of
+        the field found so far.  In addition, the items of a sequence which
+        was deserialized (see :meth:`deform.Field.validate`) can be
+        reached by their position, e.g. ``people.0.first_name``.
+
+        Lookups are answered from an index of the whole field tree which
+        is built on first use and rebuilt after ``children`` or
+        ``sequence_fields`` of a field in the tree is reassigned or a field
+        in the tree is renamed (cloning a field does not affect the tree it
+        was cloned from)."""
+        if not path:
+            return self
+        elements = tuple(path.split(separator))
+        if "*" in elements:
+            field = self
+            for element in elements:
+                if element == "*":
+                    field = field.children[0]
+                else:
+                    field = field[element]
+            return field
+        field = self._get_tree_index()[0].get(elements)
+        if field is None:
+            raise KeyError(path)
+        return field
+
+    def get_field_by_oid(self, oid):
+        """Return the field with the oid ``oid`` among this field and its
+        descendants (including the items of deserialized sequences), or
+        raise a :exc:`KeyError` if there is none.  See
+        :meth:`deform.Field.get_field` for when the underlying index is
+        rebuilt."""
+        field = self._get_tree_index()[1].get(oid)
+        if field is None:
+            raise KeyError(oid)
+        return field
+
+    def get_field_index(self):
+        """Return a :class:`deform.field.FieldIndex` of this field and its
+        descendants, including the items of deserialized sequences, in
+        document order.  Operations which visit every field of a form can
+        scan it instead of recursing over ``children``.
+
+        The index is built on first use and cached like the index of
+        :meth:`deform.Field.get_field`, except that assigning the
+        ``sequence_fields`` of a field (as
+        :class:`deform.widget.SequenceWidget` does when it deserializes
+        the items of a sequence) updates the cached indexes by replacing
+        the entries of the old items with those of the new ones instead
+        of dropping them."""
+        state = _current_state()
+        if state is None:
+            cache = self._get_tree_cache()
+        else:
+            cache = state._indexes.setdefault(self, {})
+        index = cache.get("fields")
+        if index is None:
+            index = cache["fields"] = FieldIndex.build(self, state)
+        return index
+
+    def _get_sequence_fields(self):
+        state = _current_state()
+        if state is None:
+            fields = self._sequence_fields
+        else:
+            fields = state[self].sequence_fields
+        if fields is None:
+            raise AttributeError("sequence_fields")
+        return fields
+
+    def _set_sequence_fields(self, fields):
+        state = _current_state()
+        if state is not None:
+            state[self].sequence_fields = fields
+            for cache in state._indexes.values():
+                cache.pop("index", None)
+                index = cache.get("fields")
+                if index is not None:
+                    cache["fields"] = index.replace_items(self, fields, state)
+            return
+        # the field indexes of the field and its ancestors are updated
+        # rather than rebuilt
+        indexes = []
+        node = self
+        while node is not None:
+            cache = node._tree_cache
+            if cache is not None and "fields" in cache:
+                indexes.append((node, cache["fields"]))
+            node = node.parent
+        self._sequence_fields = fields
+        self._invalidate_tree_cache()
+        for node, index in indexes:
+            node._get_tree_cache()["fields"] = index.replace_items(
+                self, fields
+            )
+
+    def _del_sequence_fields(self):
+        self._set_sequence_fields(None)
+
+    sequence_fields = property(
+        _get_sequence_fields,
+        _set_sequence_fields,
+        _del_sequence_fields,
+        doc="The item fields of a sequence created by the last "
+        "deserialization of this field (set by "
+        ":class:`deform.widget.SequenceWidget`).",
+    )
+
+    def _get_error(self):
+        state = _current_state()
+        if state is None:
+            return self._error
+        return state[self].error
+
+    def _set_error(self, error):
+        state = _current_state()
+        if state is None:
+            self._error = error
+        else:
+            state[self].error = error
+
+    error = property(_get_error, _set_error)
+
+    def _get_unparseable(self):
+        state = _current_state()
+        if state is None:
+            value = self.__dict__.get("unparseable", UNSET)
+        else:
+            value = state[self].unparseable
+        if value is UNSET:
+            raise AttributeError("unparseable")
+        return value
+
+    def _set_unparseable(self, value):
+        state = _current_state()
+        if state is None:
+            self.__dict__["unparseable"] = value
+        else:
+            state[self].unparseable = value
+
+    def _del_unparseable(self):
+        state = _current_state()
+        if state is None:
+            self.__dict__.pop("unparseable", None)
+        else:
+            state[self].unparseable = UNSET
+
+    unparseable = property(
+        _get_unparseable,
+        _set_unparseable,
+        _del_unparseable,
+        doc="The submitted value a widget could not parse (set by "
+        "the CSV widgets).",
+    )
+
+    def _new_state(self):
+        """Return the :class:`deform.state.FieldState` a request starts
+        with for this field, holding the values of this field."""
+        cstruct = self._cstruct
+        if cstruct.__class__ is _PendingCstruct:
+            cstruct = self._resolve_cstruct()
+        return FieldState(
+            self._error,
+            cstruct,
+            self._sequence_fields,
+            self.__dict__.get("unparseable"),
+        )
 
     def clone(self):
         """Clone the field and its subfields, retaining attribute
@@ -375,57 +1646,133 @@ class Field(object):
         attribute of the node is not cloned; instead the field
         receives a new order attribute; it will be a number larger
         than the last rendered field of this set.  The parent of the cloned
-        node will become ``None`` unconditionally."""
-        cloned = self.__class__(self.schema)
-        cloned.__dict__.update(self.__dict__)
-        cloned.order = next(cloned.counter)
-        cloned.oid = "deformField%s" % cloned.order
-        cloned._parent = None
-        children = []
-        for field in self.children:
-            cloned_child = field.clone()
-            cloned_child._parent = weakref.ref(cloned)
-            children.append(cloned_child)
-        cloned.children = children
+        node will become ``None`` unconditionally.
+
+        The constructor is not run again: the clones share the schema,
+        widget, renderer, cstruct and other attribute values of the
+        originals.  Children which have not been materialized yet (see
+        the ``lazy`` constructor argument) are not materialized by
+        cloning; the clone materializes its own when they are accessed."""
+        cloned = None
+        state = _current_state()
+        stack = [(self, None)]
+        while stack:
+            field, parent = stack.pop()
+            if parent is not None and field.__class__.clone is not Field.clone:
+                # a child with its own cloning implementation
+                copied = field.clone()
+                copied._parent = weakref.ref(parent)
+                _append_child(parent._children, copied)
+                continue
+            if field._cstruct.__class__ is _PendingCstruct:
+                field._resolve_cstruct()
+            copied = _copy_field(field)
+            copied.order = next(copied.counter)
+            copied._oid = None
+            if state is not None:
+                field_state = state.get(field)
+                if field_state is not None:
+                    state._fields[copied] = field_state.copy()
+            if parent is None:
+                copied._parent = None
+                cloned = copied
+            else:
+                copied._parent = weakref.ref(parent)
+                _append_child(parent._children, copied)
+            children = field._children
+            if children.__class__ is not _PendingChildren:
+                if children.__class__ is _ChildList:
+                    copied._children = _ChildList(copied)
+                else:
+                    copied._children = []
+                stack.extend((child, copied) for child in reversed(children))
         return cloned
 
-    @decorator.reify
-    def widget(self):
+    def _walk(self):
+        """Yield this field and all of its descendants in document
+        order."""
+        stack = [self]
+        while stack:
+            field = stack.pop()
+            yield field
+            stack.extend(reversed(field.children))
+
+    def prepare(self):
+        """Finish building this field and its descendants, and return this
+        field.
+
+        The children of lazy fields (see the ``lazy`` constructor
+        argument), the cstructs serialized from the ``appstruct`` passed to
+        the constructor and the default widgets are otherwise built when
+        they are first needed, which changes the fields.  Call this method
+        before sharing a form between concurrent requests, each of which
+        uses it within its own :class:`deform.RequestState`."""
+        for field in self._walk():
+            if field._cstruct.__class__ is _PendingCstruct:
+                field._resolve_cstruct()
+            field.widget  # assigns the default widget
+        return self
+
+    def _get_widget(self):
         """If a widget is not assigned directly to a field, this
         function will be called to generate a default widget (only
         once). The result of this function will then be assigned as
         the ``widget`` attribute of the field for the rest of the
         lifetime of this field. If a widget is assigned to a field
         before form processing, this function will not be called."""
+        wdg = self._widget
+        if wdg is None:
+            wdg = self._widget = self._default_widget()
+        return wdg
+
+    def _set_widget(self, widget):
+        self._widget = widget
+        self._invalidate_tree_cache()
+
+    def _del_widget(self):
+        self._widget = None
+        self._invalidate_tree_cache()
+
+    widget = property(_get_widget, _set_widget, _del_widget)
+
+    def _default_widget(self):
         wdg = getattr(self.schema, "widget", None)
         if wdg is not None:
             return wdg
         widget_maker = getattr(self.schema.typ, "widget_maker", None)
         if widget_maker is None:
-            widget_maker = schema.default_widget_makers.get(
-                self.schema.typ.__class__
-            )
-            if widget_maker is None:
-                for cls, wgt in schema.default_widget_makers.items():
-                    if isinstance(self.schema.typ, cls):
-                        widget_maker = wgt
-                        break
+            makers = schema.default_widget_makers
+            if isinstance(makers, schema.WidgetMakerRegistry):
+                widget_maker = makers.resolve(self.schema.typ.__class__)
+            else:
+                # a plain dictionary assigned by application code
+                widget_maker = makers.get(self.schema.typ.__class__)
+                if widget_maker is None:
+                    for cls, wgt in makers.items():
+                        if isinstance(self.schema.typ, cls):
+                            widget_maker = wgt
+                            break
         if widget_maker is None:
             widget_maker = widget.TextInputWidget
         return widget_maker(item_css_class=self.default_item_css_class())
 
     def default_item_css_class(self):
+        """Return the CSS class (``item-`` followed by the normalized
+        name of the field) used for the item container of this field,
+        or ``None`` if the field has no name.  Results are cached
+        process-wide by name, see
+        :meth:`deform.Field.item_css_class_cache_info`."""
         if not self.name:
             return None
+        return _item_css_class(str(self.name))
 
-        css_class = (
-            unicodedata.normalize("NFKD", str(self.name))
-            .encode("ascii", "ignore")
-            .decode("ascii")
-        )
-        css_class = re.sub(r"[^\w\s-]", "", css_class).strip().lower()  # noQA
-        css_class = re.sub(r"[-\s]+", "-", css_class)  # noQA
-        return "item-%s" % css_class
+    @staticmethod
+    def item_css_class_cache_info():
+        """Return the statistics of the process-wide cache used by
+        :meth:`deform.Field.default_item_css_class` as a named tuple of
+        ``hits``, ``misses``, ``maxsize`` and ``currsize`` (see
+        :func:`functools.lru_cache`)."""
+        return _item_css_class.cache_info()
 
     def get_widget_requirements(self):
         """Return a sequence of two tuples in the form
@@ -445,24 +1792,45 @@ class Field(object):
         See also the ``requirements`` attribute of
         :class:`deform.Widget` and the explanation of widget
         requirements in :ref:`get_widget_requirements`.
-        """
-        L = []
 
-        requirements = [req for req in self.widget.requirements] + [
-            req
-            for child in self.children
-            for req in child.get_widget_requirements()
-        ]
+        The result is cached on this field until the ``widget``,
+        ``children`` or ``sequence_fields`` attribute of this field or
+        one of its descendants is assigned (e.g. by
+        :meth:`deform.Field.set_widgets`).  Changing the ``requirements``
+        of a widget already in use is not detected.
+        """
+        cache = self._get_tree_cache()
+        L = cache.get("requirements")
+        if L is None:
+            L = cache["requirements"] = self._collect_widget_requirements()
+        return list(L)
+
+    def _collect_widget_requirements(self):
+        requirements = []
+        stack = [self]
+        while stack:
+            field = stack.pop()
+            if field is not self and not _is_stock(
+                field, "get_widget_requirements"
+            ):
+                requirements.extend(field.get_widget_requirements())
+                continue
+            requirements.extend(field.widget.requirements)
+            stack.extend(reversed(field.children))
 
-        if requirements:
-            for requirement in requirements:
-                if isinstance(requirement, dict):
-                    L.append(requirement)
-                else:
-                    reqt = tuple(requirement)
-                    if reqt not in L:
-                        L.append(reqt)
-        return L
+        # keep the first occurrence of each (name, version) requirement
+        # and every dictionary requirement, in order
+        L = []
+        seen = set()
+        for requirement in requirements:
+            if isinstance(requirement, dict):
+                L.append(requirement)
+            else:
+                reqt = tuple(requirement)
+                if reqt not in seen:
+                    seen.add(reqt)
+                    L.append(reqt)
+        return tuple(L)
 
     def get_widget_resources(self, requirements=None):
         """Return a resources dictionary in the form ``{'js':[seq],
@@ -579,20 +1947,16 @@ class Field(object):
 
           Set *form* node's widget to a ``MyMappingWidget``.
 
+
+        ``values`` may also be a :class:`deform.field.WidgetOverrides`
+        object compiled from such a dictionary, in which case
+        ``separator`` is ignored.  Compiling the dictionary once and
+        reusing it is cheaper when the same overrides are applied to many
+        forms (e.g. once per request).
         """
-        for k, v in values.items():
-            if not k:
-                self.widget = v
-            else:
-                path = k.split(separator)
-                field = self
-                while path:
-                    element = path.pop(0)
-                    if element == "*":
-                        field = field.children[0]
-                    else:
-                        field = field[element]
-                field.widget = v
+        if not isinstance(values, WidgetOverrides):
+            values = WidgetOverrides(values, separator)
+        values.apply(self)
 
     @property
     def errormsg(self):
@@ -805,26 +2169,242 @@ class Field(object):
         return appstruct
 
     def _get_cstruct(self):
-        return self._cstruct
+        state = _current_state()
+        if state is not None:
+            return state[self].cstruct
+        cstruct = self._cstruct
+        if cstruct.__class__ is _PendingCstruct:
+            cstruct = self._resolve_cstruct()
+        return cstruct
+
+    def _resolve_cstruct(self):
+        """Compute the cstruct of this field, which is still the
+        placeholder assigned by the constructor, and return it.
+
+        The prototype of a sequence (and its descendants) gets its
+        default cstruct without serializing the appstruct; the other
+        fields get theirs when the appstruct is serialized for the whole
+        tree."""
+        pending = self._cstruct
+        field = self
+        while True:
+            parent = field.parent
+            if parent is None:
+                pending.resolve()
+                break
+            if isinstance(parent.schema.typ, colander.Sequence):
+                field._apply_appstruct(
+                    colander.null, initial=True, pending=pending
+                )
+                break
+            field = parent
+        cstruct = self._cstruct
+        if cstruct is pending:
+            # not reachable from the field the appstruct was passed to
+            cstruct = self._cstruct = colander.null
+        return cstruct
 
     def _set_cstruct(self, cstruct):
-        self._cstruct = cstruct
-        child_cstructs = self.schema.cstruct_children(cstruct)
-        if not isinstance(child_cstructs, colander.SequenceItems):
-            # If the schema's type returns SequenceItems, it means that the
-            # node is a sequence node, which means it has one child
-            # representing its prototype instead of a set of "real" children;
-            # our widget handle cloning the prototype node.  The prototype's
-            # cstruct will already be set up with its default value by virtue
-            # of set_appstruct having been called in its constructor, and we
-            # needn't (and can't) do anything more.
-            for n, child in enumerate(self.children):
-                child.cstruct = child_cstructs[n]
+        initial = self._cstruct.__class__ is _PendingCstruct
+        self._apply_cstruct(
+            cstruct, initial, self.cstruct_diff, state=_current_state()
+        )
+
+    def update_cstruct(self, cstruct):
+        """Set the cstruct of this field like assigning ``cstruct`` does,
+        but skip the subtrees whose cstruct is unchanged: a field whose
+        new cstruct is the same object as, or equal to, its current
+        cstruct keeps the cstructs of its descendants.
+
+        This is only correct when cstructs are not mutated in place and
+        the descendants' cstructs were last set through their ancestors,
+        which is the case for the cstructs set by Deform itself.  Pass
+        ``cstruct_diff=True`` to the constructor of a form to make every
+        cstruct assignment in the form (including the ones made during
+        validation) behave like this method."""
+        self._apply_cstruct(cstruct, diff=True, state=_current_state())
+
+    def _apply_cstruct(
+        self, cstruct, initial=False, diff=False, pending=None, state=None
+    ):
+        """Set the cstruct of this field and propagate the child cstructs
+        it holds to the descendant fields, using an explicit stack.  If
+        ``diff`` is true, the subtrees whose cstruct is unchanged are
+        skipped (see :meth:`deform.Field.update_cstruct`).  If
+        ``pending`` is passed, only the fields whose cstruct is still the
+        placeholder ``pending`` are assigned.  If ``state`` is passed, the
+        cstructs are assigned in that :class:`deform.state.RequestState`
+        instead of the fields.
+
+        If the schema's type returns SequenceItems, it means that the node
+        is a sequence node, which means it has one child representing its
+        prototype instead of a set of "real" children; our widget handle
+        cloning the prototype node.  The prototype's cstruct is set up with
+        its default value when the field is constructed (``initial`` is
+        true) and we needn't (and can't) do anything more afterwards."""
+        fields = [self]
+        cstructs = [cstruct]
+        while fields:
+            field = fields.pop()
+            cstruct = cstructs.pop()
+            if (
+                field.__class__ is not Field
+                and field is not self
+                and not _is_stock(field, "cstruct")
+            ):
+                if pending is None:
+                    field.cstruct = cstruct
+                continue
+            if pending is not None:
+                if field._cstruct is pending:
+                    field._cstruct = cstruct
+            elif state is None:
+                if diff and _unchanged(cstruct, field._cstruct):
+                    continue
+                field._cstruct = cstruct
+            else:
+                field_state = state[field]
+                if diff and _unchanged(cstruct, field_state.cstruct):
+                    continue
+                field_state.cstruct = cstruct
+            children = field._children
+            if children.__class__ is _PendingChildren:
+                continue  # propagated when the children are materialized
+            child_cstructs = field.schema.cstruct_children(cstruct)
+            if isinstance(child_cstructs, colander.SequenceItems):
+                if initial:
+                    for child in reversed(children):
+                        if (
+                            pending is not None
+                            and child._cstruct is not pending
+                        ):
+                            continue
+                        fields.append(child)
+                        cstructs.append(child.schema.serialize(colander.null))
+                continue
+            for n in range(len(children) - 1, -1, -1):
+                fields.append(children[n])
+                cstructs.append(child_cstructs[n])
+
+    def _apply_appstruct(
+        self, appstruct, initial=False, pending=None, state=None
+    ):
+        """Serialize ``appstruct`` with the schema of this field, assign
+        the result like :meth:`deform.Field._apply_cstruct` does and
+        return it.
+
+        The mappings of the tree which ignore unknown keys (the default
+        for :class:`colander.Mapping`) are serialized while the fields are
+        walked, so the child cstructs are not extracted again from the
+        serialized cstruct; the other nodes are serialized by their schema
+        and their cstructs propagated as usual.  Nothing is assigned if
+        serialization raises.  A :exc:`colander.Invalid` raised while
+        walking holds the error of a single node, so the schema then
+        serializes the whole appstruct again to raise the error tree it
+        always did."""
+        try:
+            assigned = self._serialize_appstruct(appstruct)
+        except colander.Invalid:
+            cstruct = self.schema.serialize(appstruct)
+            self._apply_cstruct(cstruct, initial, pending=pending, state=state)
+            return cstruct
+        fields, cstructs, propagate = assigned
+        for n in range(len(fields)):
+            field = fields[n]
+            cstruct = cstructs[n]
+            if propagate[n]:
+                if field.__class__ is Field or _is_stock(field, "cstruct"):
+                    field._apply_cstruct(
+                        cstruct, initial, False, pending, state
+                    )
+                elif pending is None:
+                    field.cstruct = cstruct
+            elif pending is not None:
+                if field._cstruct is pending:
+                    field._cstruct = cstruct
+            elif state is None:
+                field._cstruct = cstruct
+            else:
+                state[field].cstruct = cstruct
+        return cstructs[0]
+
+    def _serialize_appstruct(self, appstruct):
+        """Serialize ``appstruct`` for :meth:`deform.Field._apply_appstruct`
+        and return the fields of the tree paired with their cstructs, in
+        parallel lists, along with whether each cstruct must still be
+        propagated to the descendants of its field."""
+        node = self.schema
+        if self._children.__class__ is _PendingChildren or not (
+            _is_plain_mapping(node)
+        ):
+            return [self], [node.serialize(appstruct)], [True]
+        null = colander.null
+        drop = colander.drop
+        root = {}
+        fields = [self]
+        cstructs = [root]
+        propagate = [False]
+        # the mapping fields to walk, their appstructs and cstructs
+        stack = [self]
+        values = [appstruct]
+        results = [root]
+        while stack:
+            field = stack.pop()
+            value = values.pop()
+            result = results.pop()
+            # colander.SchemaNode.serialize and colander.Mapping.serialize
+            if value is null:
+                value = field.schema.default
+            if isinstance(value, colander.deferred):
+                value = null
+            if value is null:
+                value = {}
+            # colander.Mapping._validate, which turns any error into
+            # colander.Invalid
+            if not hasattr(value, "items"):
+                raise colander.Invalid(field.schema)
+            try:
+                value = dict(value)
+            except Exception:
+                raise colander.Invalid(field.schema)
+            for child in field._children:
+                node = child.schema
+                name = node.name
+                subvalue = value.get(name, null)
+                # dropped children are left out of the mapping and get the
+                # cstruct colander.Mapping.cstruct_children gives them
+                dropped = subvalue is drop or (
+                    subvalue is null and getattr(node, "default", None) is drop
+                )
+                if dropped:
+                    subvalue = null
+                children = child._children
+                stock = child.__class__ is Field or _is_stock(child, "cstruct")
+                if (
+                    stock
+                    and children.__class__ is not _PendingChildren
+                    and _is_plain_mapping(node)
+                ):
+                    cstruct = {}
+                    stack.append(child)
+                    values.append(subvalue)
+                    results.append(cstruct)
+                    child_propagate = False
+                else:
+                    cstruct = node.serialize(subvalue)
+                    if cstruct is drop and not dropped:
+                        dropped = True
+                        cstruct = node.serialize(null)
+                    child_propagate = not stock or bool(children)
+                if not dropped:
+                    result[name] = cstruct
+                fields.append(child)
+                cstructs.append(cstruct)
+                propagate.append(child_propagate)
+        return fields, cstructs, propagate
 
     def _del_cstruct(self):
-        if "_cstruct" in self.__dict__:
-            # rely on class-scope _cstruct (null)
-            del self._cstruct
+        self._cstruct = colander.null
 
     cstruct = property(_get_cstruct, _set_cstruct, _del_cstruct)
 
@@ -839,9 +2419,14 @@ class Field(object):
     def set_appstruct(self, appstruct):
         """Set the cstruct of this node (and its child nodes) using
         ``appstruct`` as input."""
-        cstruct = self.schema.serialize(appstruct)
-        self.cstruct = cstruct
-        return cstruct
+        if self.cstruct_diff:
+            cstruct = self.schema.serialize(appstruct)
+            self.cstruct = cstruct
+            return cstruct
+        initial = self._cstruct.__class__ is _PendingCstruct
+        return self._apply_appstruct(
+            appstruct, initial, state=_current_state()
+        )
 
     def set_pstruct(self, pstruct):
         """Set the cstruct of this node (and its child nodes) using
@@ -871,7 +2456,7 @@ class Field(object):
         if name is None:
             name = self.name
         tag = '<input type="hidden" name="__start__" value="%s:mapping"/>'
-        return Markup(tag % (name,))
+        return _markup(tag % (name,))
 
     def end_mapping(self, name=None):
         """Create an end-mapping tag (a literal).  If ``name`` is ``None``,
@@ -881,7 +2466,7 @@ class Field(object):
         if name is None:
             name = self.name
         tag = '<input type="hidden" name="__end__" value="%s:mapping"/>'
-        return Markup(tag % (name,))
+        return _markup(tag % (name,))
 
     def start_sequence(self, name=None):
         """Create a start-sequence tag (a literal).  If ``name`` is ``None``,
@@ -891,7 +2476,7 @@ class Field(object):
         if name is None:
             name = self.name
         tag = '<input type="hidden" name="__start__" value="%s:sequence"/>'
-        return Markup(tag % (name,))
+        return _markup(tag % (name,))
 
     def end_sequence(self, name=None):
         """Create an end-sequence tag (a literal).  If ``name`` is ``None``,
@@ -902,7 +2487,7 @@ class Field(object):
         if name is None:
             name = self.name
         tag = '<input type="hidden" name="__end__" value="%s:sequence"/>'
-        return Markup(tag % (name,))
+        return _markup(tag % (name,))
 
     def start_rename(self, name=None):
         """Create a start-rename tag (a literal).  If ``name`` is ``None``,
@@ -912,7 +2497,7 @@ class Field(object):
         if name is None:
             name = self.name
         tag = '<input type="hidden" name="__start__" value="%s:rename"/>'
-        return Markup(tag % (name,))
+        return _markup(tag % (name,))
 
     def end_rename(self, name=None):
         """Create a start-rename tag (a literal).  If ``name`` is ``None``,
@@ -922,4 +2507,4 @@ class Field(object):
         if name is None:
             name = self.name
         tag = '<input type="hidden" name="__end__" value="%s:rename"/>'
-        return Markup(tag % (name,))
+        return _markup(tag % (name,))
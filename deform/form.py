@@ -3,8 +3,6 @@
 # Standard Library
 import re
 
-from chameleon.utils import Markup
-
 from . import field
 from . import widget
 
@@ -150,12 +148,23 @@ class Form(field.Field):
         self.buttons = _buttons
         self.formid = formid
         self.use_ajax = use_ajax
-        self.ajax_options = Markup(ajax_options.strip())
+        self.ajax_options = ajax_options.strip()
         form_widget = getattr(schema, "widget", None)
         if form_widget is None:
             form_widget = widget.FormWidget()
         self.widget = form_widget
 
+    # ``ajax_options`` is made a literal when it is read, so that forms
+    # which are never rendered do not import Chameleon
+
+    def _get_ajax_options(self):
+        return field._markup(self._ajax_options)
+
+    def _set_ajax_options(self, ajax_options):
+        self._ajax_options = ajax_options
+
+    ajax_options = property(_get_ajax_options, _set_ajax_options)
+
 
 class Button(object):
     """
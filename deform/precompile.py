@@ -0,0 +1,75 @@
+"""Fill a compiled template cache ahead of time."""
+
+# Standard Library
+import argparse
+import os.path
+import sys
+
+# Deform
+from deform.template import ZPTRendererFactory
+from deform.template import default_dir
+from deform.utils import resource_filename
+
+
+def main(argv=None):
+    """Compile the Deform templates, and those of the directories passed,
+    into a cache directory usable as the ``cache_dir`` of a
+    :class:`deform.ZPTRendererFactory`, e.g. while building a container
+    image::
+
+        deform-precompile /var/cache/deform mypackage:templates
+
+    Directories may be given as asset specs (``package:directory``) as
+    with :func:`deform.renderer.configure_zpt_renderer`.  The renderer
+    using the cache must be configured with the same ``encoding``, or
+    the compiled templates will not be found.
+    """
+    parser = argparse.ArgumentParser(
+        prog="deform-precompile",
+        description="Compile Deform templates into a cache directory.",
+    )
+    parser.add_argument("cache_dir", help="the cache directory")
+    parser.add_argument(
+        "search_path",
+        nargs="*",
+        help="other template directories or package:directory asset specs",
+    )
+    parser.add_argument(
+        "--no-default",
+        action="store_true",
+        help="do not compile the templates bundled with Deform",
+    )
+    parser.add_argument(
+        "--encoding", default="utf-8", help="the template encoding"
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="only report errors"
+    )
+    args = parser.parse_args(argv)
+    paths = []
+    for path in args.search_path:
+        if ":" in path and not os.path.isdir(path):
+            pkg, resource_name = path.split(":", 1)
+            path = resource_filename(pkg, resource_name)
+        paths.append(path)
+    if not args.no_default:
+        paths.append(default_dir)
+    renderer = ZPTRendererFactory(
+        tuple(paths),
+        auto_reload=False,
+        encoding=args.encoding,
+        cache_dir=args.cache_dir,
+    )
+    timings = renderer.warmup()
+    if not args.quiet:
+        for name, seconds in timings.items():
+            print("%8.1f ms  %s" % (seconds * 1000, name))
+        print(
+            "%d templates compiled into %s in %.1f ms"
+            % (len(timings), args.cache_dir, sum(timings.values()) * 1000)
+        )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
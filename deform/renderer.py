@@ -1,13 +1,12 @@
 """Renderer."""
 
-from pkg_resources import resource_filename
-
 # Deform
 import deform
 import deform.form
+from deform.utils import resource_filename
 
 
-def configure_zpt_renderer(search_path=(), translator=None):
+def configure_zpt_renderer(search_path=(), translator=None, cache_dir=None):
     """Initialize ZPT widget rendering for Deform forms.
 
     Include given package asset paths in the paths Deform uses to
@@ -34,6 +33,9 @@ def configure_zpt_renderer(search_path=(), translator=None):
     :param search_path: List of additional search paths for widget templates.
 
     :param translator: Translator function to localizing i18n strings
+
+    :param cache_dir: Directory keeping the compiled templates (see the
+        ``cache_dir`` argument of :class:`deform.ZPTRendererFactory`)
     """
 
     # Don't let the user to slip in a string
@@ -47,5 +49,7 @@ def configure_zpt_renderer(search_path=(), translator=None):
         paths.append(resource_filename(pkg, resource_name))
 
     deform.form.Form.default_renderer = deform.ZPTRendererFactory(
-        tuple(paths) + default_paths, translator=translator
+        tuple(paths) + default_paths,
+        translator=translator,
+        cache_dir=cache_dir,
     )
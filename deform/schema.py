@@ -8,21 +8,115 @@ from deform.i18n import _
 
 from . import widget
 
-default_widget_makers = {
-    colander.Mapping: widget.MappingWidget,
-    colander.Sequence: widget.SequenceWidget,
-    colander.String: widget.TextInputWidget,
-    colander.Integer: widget.TextInputWidget,
-    colander.Float: widget.TextInputWidget,
-    colander.Decimal: widget.TextInputWidget,
-    colander.Boolean: widget.CheckboxWidget,
-    colander.Date: widget.DateInputWidget,
-    colander.DateTime: widget.DateTimeInputWidget,
-    colander.Tuple: widget.TextInputCSVWidget,
-    colander.Time: widget.TimeInputWidget,
-    colander.Money: widget.MoneyInputWidget,
-    colander.Set: widget.CheckboxChoiceWidget,
-}
+
+class WidgetMakerRegistry(dict):
+    """
+    A dictionary mapping :term:`Colander` type classes to the widget
+    factories (widget makers) used to create the default widget of the
+    fields whose schema node has a type of that class.
+
+    :meth:`resolve` finds the widget maker for a type class by following
+    its method resolution order, so a custom type which subclasses a
+    registered type (e.g. a subclass of :class:`colander.String`) gets
+    the widget of its nearest registered ancestor.  Results are cached
+    per type class; the cache is cleared whenever the registry is
+    modified, whether through :meth:`register` and :meth:`unregister` or
+    through the usual dictionary methods.
+    """
+
+    def __init__(self, *arg, **kw):
+        dict.__init__(self, *arg, **kw)
+        self._resolved = {}
+
+    def resolve(self, typ_class):
+        """Return the widget maker registered for the class
+        ``typ_class`` or the nearest of its base classes, or ``None``.
+        If no class in the MRO of ``typ_class`` is registered, the first
+        registered class ``typ_class`` is a (possibly virtual) subclass
+        of is used."""
+        try:
+            return self._resolved[typ_class]
+        except KeyError:
+            pass
+        maker = None
+        for cls in typ_class.__mro__:
+            maker = dict.get(self, cls)
+            if maker is not None:
+                break
+        else:
+            for cls, wgt in self.items():
+                if issubclass(typ_class, cls):
+                    maker = wgt
+                    break
+        self._resolved[typ_class] = maker
+        return maker
+
+    def register(self, typ_class, maker):
+        """Use ``maker`` to create the default widget of fields whose
+        schema type is an instance of ``typ_class``."""
+        self[typ_class] = maker
+
+    def unregister(self, typ_class):
+        """Remove the widget maker registered for ``typ_class``, if
+        any."""
+        self.pop(typ_class, None)
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self._resolved.clear()
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._resolved.clear()
+
+    def clear(self):
+        dict.clear(self)
+        self._resolved.clear()
+
+    def pop(self, *arg):
+        try:
+            return dict.pop(self, *arg)
+        finally:
+            self._resolved.clear()
+
+    def popitem(self):
+        try:
+            return dict.popitem(self)
+        finally:
+            self._resolved.clear()
+
+    def setdefault(self, key, default=None):
+        try:
+            return dict.setdefault(self, key, default)
+        finally:
+            self._resolved.clear()
+
+    def update(self, *arg, **kw):
+        dict.update(self, *arg, **kw)
+        self._resolved.clear()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+default_widget_makers = WidgetMakerRegistry(
+    {
+        colander.Mapping: widget.MappingWidget,
+        colander.Sequence: widget.SequenceWidget,
+        colander.String: widget.TextInputWidget,
+        colander.Integer: widget.TextInputWidget,
+        colander.Float: widget.TextInputWidget,
+        colander.Decimal: widget.TextInputWidget,
+        colander.Boolean: widget.CheckboxWidget,
+        colander.Date: widget.DateInputWidget,
+        colander.DateTime: widget.DateTimeInputWidget,
+        colander.Tuple: widget.TextInputCSVWidget,
+        colander.Time: widget.TimeInputWidget,
+        colander.Money: widget.MoneyInputWidget,
+        colander.Set: widget.CheckboxChoiceWidget,
+    }
+)
 
 
 @colander.deferred
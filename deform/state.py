@@ -0,0 +1,122 @@
+"""Per-request field state."""
+
+# Standard Library
+import contextvars
+
+_current = contextvars.ContextVar("deform.state", default=None)
+
+#: Return the :class:`deform.state.RequestState` active in the current
+#: context, or ``None``.
+current = _current.get
+
+
+class _Unset(object):
+    def __repr__(self):  # pragma: no cover
+        return "UNSET"
+
+
+UNSET = _Unset()
+
+
+class FieldState(object):
+    """The per-request state of a field: the values its ``error``,
+    ``cstruct``, ``sequence_fields`` and ``unparseable`` attributes have
+    while a :class:`deform.state.RequestState` is active, and
+    ``attributes``, a dictionary of other values widgets keep between
+    deserialization and rendering.  A ``sequence_fields`` of ``None`` and
+    an ``unparseable`` of :data:`deform.state.UNSET` mean the attribute
+    is not set."""
+
+    __slots__ = (
+        "error",
+        "cstruct",
+        "sequence_fields",
+        "unparseable",
+        "attributes",
+    )
+
+    def __init__(
+        self,
+        error=None,
+        cstruct=None,
+        sequence_fields=None,
+        unparseable=None,
+        attributes=None,
+    ):
+        self.error = error
+        self.cstruct = cstruct
+        self.sequence_fields = sequence_fields
+        self.unparseable = UNSET if unparseable is None else unparseable
+        self.attributes = {} if attributes is None else attributes
+
+    def copy(self):
+        """Return a copy of this state."""
+        return FieldState(
+            self.error,
+            self.cstruct,
+            self.sequence_fields,
+            self.unparseable,
+            dict(self.attributes),
+        )
+
+
+class RequestState(object):
+    """
+    The state of the fields of a form accumulated while handling a single
+    request, kept apart from the fields themselves.
+
+    While a request state is active (between entering and leaving it as a
+    context manager), the ``error``, ``cstruct``, ``sequence_fields`` and
+    ``unparseable`` attributes of every field are read from and assigned
+    to the state instead of the field.  A field's state starts out with
+    the values of the field when it is first used.  A form which was
+    finished with :meth:`deform.Field.prepare` can therefore be shared by
+    concurrent requests, each of which validates and renders it within
+    its own request state.
+
+    The active state is tracked with :mod:`contextvars`, so each thread
+    (and each asyncio task) has its own.
+
+    Example:
+
+    .. code-block:: python
+
+        form = Form(MySchema(), buttons=('submit',)).prepare()
+
+        def view(request):
+            with RequestState():
+                try:
+                    form.validate(request.POST.items())
+                except ValidationFailure as e:
+                    return e.render()
+                ...
+    """
+
+    def __init__(self):
+        self._fields = {}
+        self._indexes = {}
+        self._tokens = []
+
+    def __enter__(self):
+        self._tokens.append(_current.set(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        _current.reset(self._tokens.pop())
+
+    def __getitem__(self, field):
+        """Return the :class:`deform.state.FieldState` of ``field``,
+        creating it from the field's values if needed."""
+        state = self._fields.get(field)
+        if state is None:
+            state = self._fields[field] = field._new_state()
+        return state
+
+    def get(self, field):
+        """Return the :class:`deform.state.FieldState` of ``field`` or
+        ``None`` if the field was not used in this request yet."""
+        return self._fields.get(field)
+
+    def __len__(self):
+        """Return the number of fields used in this request."""
+        return len(self._fields)
@@ -47,12 +47,12 @@ var deform  = {
         // In order to avoid breaking accessibility:
         //
         // - Find each tag within the prototype node with an id
-        //   that has the string ``deformField(\d+)`` within it, and modify
-        //   its id to have a random component.
+        //   that has the string ``deformField(\d+)`` or the ``--proto``
+        //   marker within it, and modify its id to have a random component
+        //   (see ``deform.itemId``).
         // - For each label referencing an change id, change the label's
         //   for attribute to the new id.
 
-        var fieldmatch = /deformField(\d+)/;
         var code = protonode.attr('prototype');
         var html = decodeURIComponent(code);
         var $htmlnode = $(html);
@@ -61,13 +61,17 @@ var deform  = {
         var genid = deform.randomString(6);
         var idmap = {};
 
+        var replaceid = function(oldid) {
+            return deform.itemId(oldid, genid);
+        };
+
         // replace ids containing ``deformField`` and associated label for=
         // items which point at them
 
         $idnodes.each(function(idx, node) {
             var $node = $(node);
             var oldid = $node.attr('id');
-            var newid = oldid.replace(fieldmatch, "deformField$1-" + genid);
+            var newid = replaceid(oldid);
             $node.attr('id', newid);
             idmap[oldid] = newid;
             var labelselector = 'label[for=' + oldid + ']';
@@ -80,7 +84,7 @@ var deform  = {
         $namednodes.each(function(idx, node) {
             var $node = $(node);
             var oldname = $node.attr('name');
-            var newname = oldname.replace(fieldmatch, "deformField$1-" + genid);
+            var newname = replaceid(oldname);
             $node.attr('name', newname);
             });
 
@@ -151,6 +155,19 @@ var deform  = {
         $lis.find('.deform-order-button').not($lis.find('.deform-seq-container .deform-order-button')).toggle(orderable && has_multiple);
      },
 
+    itemId: function (oldid, genid) {
+        // Return the id (or name) ``oldid`` of a node of the prototype of
+        // a sequence item as given to the node of a new item.  Default
+        // oids get the random ``genid`` after their number.  Oids derived
+        // from field paths (``deform.PathOids``) get it in place of the
+        // last ``--proto`` marker, whatever the oid of the sequence.
+        var fieldmatch = /deformField(\d+)/;
+        if (fieldmatch.test(oldid)) {
+            return oldid.replace(fieldmatch, "deformField$1-" + genid);
+        }
+        return oldid.replace(/^(.*)--proto(?=-|$)/, "$1-" + genid);
+    },
+
     randomString: function (length) {
         var chr='0123456789ABCDEFGHIJKLMNOPQRSTUVWXTZabcdefghiklmnopqrstuvwxyz';
         chr = chr.split('');
@@ -1,13 +1,23 @@
 """Template."""
 
 # Standard Library
+import functools
+import gc
+import hashlib
+import importlib.metadata
+import marshal
 import os.path
+import sys
+import tempfile
+import time
 
 from chameleon.zpt.loader import TemplateLoader
-from pkg_resources import resource_filename
+from chameleon.zpt.template import PageTemplateFile
+from chameleon.zpt.template import PageTextTemplateFile
 from translationstring import ChameleonTranslate
 
 from .exception import TemplateError
+from .utils import resource_filename
 
 BOOLEAN_HTML_ATTRS = frozenset(
     [
@@ -30,10 +40,141 @@ BOOLEAN_HTML_ATTRS = frozenset(
 )
 
 
+# the template settings which change the code Chameleon compiles
+_COMPILE_SETTINGS = (
+    "boolean_attributes",
+    "content_type",
+    "default_expression",
+    "enable_comment_interpolation",
+    "enable_data_attributes",
+    "encoding",
+    "implicit_i18n_attributes",
+    "implicit_i18n_translate",
+    "literal_false",
+    "mode",
+    "restricted_namespace",
+    "strict",
+    "trim_attribute_space",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _chameleon_version():
+    return importlib.metadata.version("Chameleon")
+
+
+def _setting(value):
+    if isinstance(value, (set, frozenset, dict)):
+        value = sorted(value)
+    return repr(value)
+
+
+class _CachedTemplateMixin(object):
+    def digest(self, body, names):
+        # Key the compiled module on what determines its code: the
+        # Chameleon version, the source and the compile settings (not the
+        # absolute path of the template, unlike Chameleon)
+        sha = hashlib.sha256()
+        parts = [_chameleon_version(), self.__class__.__name__, body]
+        parts.append(";".join(names))
+        parts.append(_setting(sorted(self.expression_types)))
+        for name in _COMPILE_SETTINGS:
+            parts.append(_setting(getattr(self, name, None)))
+        for part in parts:
+            sha.update(part.encode("utf-8", "surrogatepass"))
+            sha.update(b"\0")
+        return sha.hexdigest()[:32]
+
+    def _cook(self, body, name, builtins):
+        # The module may have been compiled for a template with the same
+        # source at another path; the path it reports errors at is
+        # looked up in its namespace when an error occurs
+        cooked = super(_CachedTemplateMixin, self)._cook(body, name, builtins)
+        cooked["__filename"] = str(self.filename)
+        return cooked
+
+
+class _CachedPageTemplateFile(_CachedTemplateMixin, PageTemplateFile):
+    pass
+
+
+class _CachedPageTextTemplateFile(_CachedTemplateMixin, PageTextTemplateFile):
+    pass
+
+
+class CompiledTemplateCache(object):
+    """A directory holding the code Chameleon compiles templates into, so
+    a process loading a template compiled before (by any process using
+    the same directory) does not compile it again.  Pass the directory as
+    the ``cache_dir`` argument of :class:`deform.ZPTRendererFactory` to
+    use one; the directory is created if it does not exist.
+
+    Entries are named after a hash of the template source, the Chameleon
+    version and the compile settings of the template, and the Python
+    bytecode version.  They are written to a temporary file renamed into
+    place, so processes sharing the directory never read a partial
+    entry, and an entry which cannot be read is compiled again.  Entries
+    are never removed; stale ones are simply no longer used.  Entries do
+    not depend on the path of the template, so an installation at another
+    path reuses them (errors are still reported at the path of the
+    template being rendered)."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, filename):
+        base = os.path.splitext(filename)[0]
+        name = "%s.%s.code" % (base, sys.implementation.cache_tag)
+        return os.path.join(self.directory, name)
+
+    def _run(self, code):
+        namespace = {}
+        exec(code, namespace)
+        return namespace
+
+    def get(self, filename):
+        """Return the namespace of the compiled module ``filename`` if
+        it is in the cache, else ``None``."""
+        try:
+            with open(self._path(filename), "rb") as f:
+                code = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return self._run(code)
+
+    def build(self, source, filename):
+        """Compile the Python ``source`` Chameleon generated for the
+        module ``filename``, store it and return the module's
+        namespace."""
+        path = self._path(filename)
+        code = compile(source, path, "exec")
+        fd, temp = tempfile.mkstemp(
+            prefix=os.path.basename(path), suffix=".tmp", dir=self.directory
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                marshal.dump(code, f)
+            os.replace(temp, path)
+        except BaseException:
+            os.remove(temp)
+            raise
+        return self._run(code)
+
+
 class ZPTTemplateLoader(TemplateLoader):
     def __init__(self, *args, **kwargs):
         kwargs.setdefault("encoding", "utf-8")
         kwargs.setdefault("boolean_attributes", BOOLEAN_HTML_ATTRS)
+        cache_dir = kwargs.pop("cache_dir", None)
+        if cache_dir is not None:
+            # the templates compile with this in place of Chameleon's
+            # module loader
+            kwargs["loader"] = CompiledTemplateCache(cache_dir)
+            self.formats = {
+                "xml": _CachedPageTemplateFile,
+                "text": _CachedPageTextTemplateFile,
+            }
         super(ZPTTemplateLoader, self).__init__(*args, **kwargs)
 
     def load(self, filename, *args, **kwargs):
@@ -58,7 +199,7 @@ class ZPTRendererFactory(object):
 
     If the template name is an asset spec (has a colon in it, e.g.
     ``mypackage:subdir/subdir2/mytemplate.pt``), use
-    ``pkg_resources.resource_filename`` to resolve it.
+    :mod:`importlib.resources` to resolve it.
     Otherwise, fall back to search-path-based machinery to resolve it.
 
     Allowing an asset spec allows users to specify templates without the
@@ -95,6 +236,22 @@ class ZPTRendererFactory(object):
        during output.  It must accept a translation string and return
        an interpolated translation.  Default: ``None`` (no translation
        performed).
+
+    cache_dir
+       A directory in which the compiled templates are kept for later
+       processes (see :class:`deform.template.CompiledTemplateCache`),
+       e.g. one filled when building a container image with the
+       ``deform-precompile`` command.  It is not used when ``debug`` is
+       true.  Default: ``None`` (templates are compiled by every
+       process).
+
+    Templates are looked up by name once: the renderer keeps the
+    template object of every name it was called with, so rendering a
+    template again only checks whether it changed on disk, and not even
+    that when ``auto_reload`` is false.  Call
+    :meth:`deform.ZPTRendererFactory.invalidate` to look templates up
+    again, e.g. after adding templates to a directory of the search path
+    or, when ``auto_reload`` is false, after changing one.
     """
 
     def __init__(
@@ -104,6 +261,7 @@ class ZPTRendererFactory(object):
         debug=False,
         encoding="utf-8",
         translator=None,
+        cache_dir=None,
     ):
         self.translate = translator
         loader = ZPTTemplateLoader(
@@ -112,15 +270,92 @@ class ZPTRendererFactory(object):
             debug=debug,
             encoding=encoding,
             translate=ChameleonTranslate(translator),
+            cache_dir=cache_dir,
         )
         self.loader = loader
+        self._templates = {}
 
     def __call__(self, template_name, **kw):
-        return self.load(template_name)(**kw)
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self.load(template_name)
+        return template(**kw)
 
     def load(self, template_name):
-        return self.loader.load(template_name)
+        """Return the template object named ``template_name``."""
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self.loader.load(template_name)
+            self._templates[template_name] = template
+        return template
+
+    def invalidate(self, template_name=None):
+        """Forget the template named ``template_name`` (or every template
+        if it is ``None``), so it is looked up on the search path and read
+        again the next time it is rendered."""
+        if template_name is None:
+            self._templates.clear()
+            self.loader.registry.clear()
+            return
+        template = self._templates.get(template_name)
+        if template is None:
+            return
+        # the template may also be known by other names
+        for cache in (self._templates, self.loader.registry):
+            for key in [
+                key for key, value in cache.items() if value is template
+            ]:
+                del cache[key]
+
+    def template_names(self):
+        """Return the sorted names (as passed to the renderer, e.g.
+        ``textinput`` or ``readonly/textinput``) of the ``.pt`` templates
+        found in the directories of the search path and their
+        subdirectories."""
+        names = set()
+        for directory in self.loader.search_path:
+            for dirpath, dirnames, filenames in os.walk(directory):
+                for filename in filenames:
+                    if filename.endswith(".pt"):
+                        path = os.path.join(dirpath, filename)
+                        name = os.path.relpath(path, directory)[:-3]
+                        names.add(name.replace(os.sep, "/"))
+        return sorted(names)
+
+    def warmup(self, freeze=False):
+        """Load and compile every template returned by
+        :meth:`deform.ZPTRendererFactory.template_names` (a template
+        found in several directories is compiled from the first one, as
+        when it is rendered), so rendering does not compile them later.
+        Return a dictionary mapping each template name to the time spent
+        loading and compiling it, in seconds.
+
+        Call it in the master process of a preforking server (e.g. in the
+        gunicorn ``on_starting`` hook) so that the workers share the
+        compiled templates.  If ``freeze`` is true, a full collection is
+        made and :func:`gc.freeze` (where available) then moves every
+        object tracked by the garbage collector to a permanent
+        generation, so collections in the workers do not write to the
+        pages holding them.  Templates are still checked for changes
+        when ``auto_reload`` is true."""
+        timings = {}
+        for name in self.template_names():
+            start = time.perf_counter()
+            self.load(name).cook_check()
+            timings[name] = time.perf_counter() - start
+        if freeze:
+            gc.collect()
+            if hasattr(gc, "freeze"):  # pragma: no branch (not on PyPy)
+                gc.freeze()
+        return timings
 
 
 default_dir = resource_filename("deform", "templates/")
-default_renderer = ZPTRendererFactory((default_dir,))
+
+
+def __getattr__(name):
+    # ``default_renderer`` is created the first time it is used, so that
+    # processes which never render do not build it.
+    if name == "default_renderer":
+        return globals().setdefault(name, ZPTRendererFactory((default_dir,)))
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
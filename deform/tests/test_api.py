@@ -19,3 +19,9 @@ class TestAPI(unittest.TestCase):
         from deform import ZPTRendererFactory  # noQA
         from deform import default_renderer  # noQA
         from deform import widget  # noQA
+
+    def test_missing(self):
+        # Deform
+        import deform
+
+        self.assertRaises(AttributeError, getattr, deform, "missing")
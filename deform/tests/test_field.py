@@ -118,6 +118,149 @@ class TestField(unittest.TestCase):
         self.assertEqual(child_field.foo, "foo")
         self.assertEqual(child_field.bar, "bar")
 
+    def test_schema_aliases(self):
+        schema = DummySchema()
+        field = self._makeOne(schema)
+        schema.title = "new title"
+        self.assertEqual(field.title, "new title")
+        field.title = "field title"
+        self.assertEqual(field.title, "field title")
+        self.assertEqual(schema.title, "new title")
+        del field.title
+        self.assertEqual(field.title, "new title")
+        del field.title  # idempotent
+        self.assertEqual(field.title, "new title")
+
+    def test_schema_alias_on_class(self):
+        # Deform
+        from deform.field import _SchemaAlias
+
+        cls = self._getTargetClass()
+        self.assertTrue(isinstance(cls.name, _SchemaAlias))
+
+    def test_no_instance_dict_unless_needed(self):
+        # Standard Library
+        import gc
+
+        schema = DummySchema()
+        schema.children = [DummySchema()]
+        field = self._makeOne(schema)
+        field.widget = DummyWidget()
+        field.error = "error"
+        for node in (field, field.children[0]):
+            referents = gc.get_referents(node)
+            self.assertFalse([r for r in referents if isinstance(r, dict)])
+        field.unparseable = "abc"
+        self.assertEqual(field.__dict__, {"unparseable": "abc"})
+
+    def test_widget_can_be_deleted(self):
+        # Deform
+        from deform.widget import TextInputWidget
+
+        schema = DummySchema()
+        field = self._makeOne(schema)
+        field.widget = DummyWidget()
+        del field.widget
+        self.assertEqual(field.widget.__class__, TextInputWidget)
+
+    def test_oid_assigned(self):
+        schema = DummySchema()
+        field = self._makeOne(schema)
+        field.oid = "myoid"
+        self.assertEqual(field.oid, "myoid")
+
+    def test_path_oids(self):
+        # Deform
+        from deform.field import PathOids
+
+        schema = DummySchema(
+            children=[
+                DummySchema(name="first name"),
+                DummySchema(children=[DummySchema(name="b")], name="a"),
+            ]
+        )
+        field = self._makeOne(schema, oid_strategy=PathOids())
+        self.assertEqual(
+            [f.oid for f in field._walk()],
+            [
+                "deformField",
+                "deformField-first_name",
+                "deformField-a",
+                "deformField-a-b",
+            ],
+        )
+        field = self._makeOne(schema, oid_strategy=PathOids("login"))
+        self.assertEqual(field["a"]["b"].oid, "deformField-login-a-b")
+
+    def test_path_oids_independent_of_counter(self):
+        # Standard Library
+        import itertools
+
+        # Deform
+        from deform.field import PathOids
+
+        schema = DummySchema(children=[DummySchema(name="a")])
+        field = self._makeOne(
+            schema, counter=itertools.count(10), oid_strategy=PathOids()
+        )
+        clone = field.clone()
+        self.assertNotEqual(clone["a"].order, field["a"].order)
+        self.assertEqual(clone["a"].oid, "deformField-a")
+
+    def test_path_oids_schema_oid_kept(self):
+        # Deform
+        from deform.field import PathOids
+
+        child = DummySchema(children=[DummySchema(name="b")], name="a")
+        child.oid = "custom"
+        schema = DummySchema(children=[child])
+        field = self._makeOne(schema, oid_strategy=PathOids())
+        self.assertEqual(field["a"].oid, "custom")
+        self.assertEqual(field["a"]["b"].oid, "custom-b")
+
+    def test_path_oids_collision(self):
+        # Deform
+        from deform.field import PathOids
+
+        schema = DummySchema(
+            children=[DummySchema(name="a-b"), DummySchema(name="a_b")]
+        )
+        self.assertRaises(
+            ValueError, self._makeOne, schema, oid_strategy=PathOids()
+        )
+
+    def test_path_oids_collision_lazy(self):
+        # Deform
+        from deform.field import PathOids
+
+        schema = DummySchema(
+            children=[
+                DummySchema(
+                    children=[DummySchema(name="a b"), DummySchema(name="a.b")]
+                )
+            ]
+        )
+        field = self._makeOne(schema, oid_strategy=PathOids(), lazy=True)
+        child = field.children[0]
+        self.assertRaises(ValueError, getattr, child, "children")
+
+    def test_oid_strategy_and_cstruct_diff_not_in_dict(self):
+        # Deform
+        from deform.field import PathOids
+
+        schema = DummySchema(
+            children=[DummySchema(children=[DummySchema(name="b")], name="a")]
+        )
+        strategy = PathOids()
+        for lazy in (False, True):
+            field = self._makeOne(
+                schema, oid_strategy=strategy, cstruct_diff=True, lazy=lazy
+            )
+            for child in (field["a"], field["a"]["b"]):
+                self.assertIs(child.oid_strategy, strategy)
+                self.assertTrue(child.cstruct_diff)
+                self.assertEqual(child.__dict__, {})
+
     def test_translate_renderer_has_no_translator(self):
         schema = DummySchema()
         field = self._makeOne(schema)
@@ -142,6 +285,38 @@ class TestField(unittest.TestCase):
         finally:
             cls.set_default_renderer(old)
 
+    def test_default_renderer_resolved_when_used(self):
+        # Deform
+        from deform.field import _LazyDefault
+        from deform.template import default_renderer
+        from deform.widget import default_resource_registry
+
+        class MyField(self._getTargetClass()):
+            default_renderer = _LazyDefault(
+                "deform.template", "default_renderer"
+            )
+            default_resource_registry = _LazyDefault(
+                "deform.widget", "default_resource_registry"
+            )
+
+        schema = DummySchema(children=[DummySchema(name="child")])
+        field = MyField(schema)
+        self.assertEqual(field._renderer.__class__, _LazyDefault)
+        self.assertEqual(field._resource_registry.__class__, _LazyDefault)
+        self.assertIs(field["child"]._renderer, field._renderer)
+        self.assertIs(field.default_renderer, default_renderer)
+        self.assertIs(field["child"].renderer, default_renderer)
+        self.assertIs(field.renderer, default_renderer)
+        self.assertIs(field.resource_registry, default_resource_registry)
+        self.assertIs(MyField(schema)._renderer, default_renderer)
+
+    def test_set_renderer_and_resource_registry(self):
+        field = self._makeOne(DummySchema())
+        field.renderer = "renderer"
+        field.resource_registry = "registry"
+        self.assertEqual(field.renderer, "renderer")
+        self.assertEqual(field.resource_registry, "registry")
+
     def test_set_default_resource_registry(self):
         cls = self._getTargetClass()
         old = cls.default_resource_registry
@@ -154,7 +329,8 @@ class TestField(unittest.TestCase):
     def test_set_zpt_renderer(self):
         cls = self._getTargetClass()
         old = cls.default_renderer
-        from pkg_resources import resource_filename
+        # Deform
+        from deform.utils import resource_filename
 
         template_dir = resource_filename("deform", "templates/")
 
@@ -247,6 +423,64 @@ class TestField(unittest.TestCase):
         widget = field.widget
         self.assertEqual(widget.__class__, TextInputWidget)
 
+    def test_widget_registered_for_derived_type(self):
+        # Pyramid
+        from colander import String
+
+        # Deform
+        from deform import schema as deform_schema
+        from deform.widget import TextAreaWidget
+        from deform.widget import TextInputWidget
+
+        class Text(String):
+            pass
+
+        class LongText(Text):
+            pass
+
+        schema = DummySchema()
+        schema.typ = LongText()
+        self.assertEqual(
+            self._makeOne(schema).widget.__class__, TextInputWidget
+        )
+        deform_schema.default_widget_makers.register(Text, TextAreaWidget)
+        try:
+            self.assertEqual(
+                self._makeOne(schema).widget.__class__, TextAreaWidget
+            )
+        finally:
+            deform_schema.default_widget_makers.unregister(Text)
+        self.assertEqual(
+            self._makeOne(schema).widget.__class__, TextInputWidget
+        )
+
+    def test_widget_default_widget_makers_plain_dict(self):
+        # Pyramid
+        from colander import Sequence
+
+        # Deform
+        from deform import schema as deform_schema
+        from deform.widget import SequenceWidget
+        from deform.widget import TextAreaWidget
+
+        class CustomSequence(Sequence):
+            pass
+
+        saved = deform_schema.default_widget_makers
+        deform_schema.default_widget_makers = {Sequence: SequenceWidget}
+        try:
+            schema = DummySchema()
+            schema.typ = CustomSequence()
+            field = self._makeOne(schema)
+            self.assertEqual(field.widget.__class__, SequenceWidget)
+            deform_schema.default_widget_makers[CustomSequence] = (
+                TextAreaWidget
+            )
+            field = self._makeOne(schema)
+            self.assertEqual(field.widget.__class__, TextAreaWidget)
+        finally:
+            deform_schema.default_widget_makers = saved
+
     def test_set_widgets_emptystring(self):
         schema = DummySchema()
         field = self._makeOne(schema, renderer="abc")
@@ -336,6 +570,88 @@ class TestField(unittest.TestCase):
         self.assertEqual(child1.widget, widget1)
         self.assertEqual(child2.widget, widget2)
 
+    def _makeNestedSchema(self):
+        grandchild = DummySchema(name="grandchild")
+        other = DummySchema(name="other")
+        child = DummySchema(children=[grandchild, other], name="child")
+        empty = DummySchema(name="empty")
+        return DummySchema(children=[child, empty], name="root")
+
+    def test_set_widgets_last_wins(self):
+        field = self._makeOne(self._makeNestedSchema())
+        widget1 = DummyWidget()
+        widget2 = DummyWidget()
+        field.set_widgets(
+            {
+                "child.grandchild": widget1,
+                "child.*": widget2,
+            }
+        )
+        self.assertIs(field["child"]["grandchild"].widget, widget2)
+        self.assertRaises(KeyError, field.set_widgets, {"child|other": 1})
+        field.set_widgets({"child|other": widget2}, separator="|")
+        self.assertIs(field["child"]["other"].widget, widget2)
+
+    def test_set_widgets_missing_partially_applied(self):
+        field = self._makeOne(self._makeNestedSchema())
+        widget1 = DummyWidget()
+        widget2 = DummyWidget()
+        values = {
+            "child.other": widget1,
+            "child.nope.deeper": widget2,
+            "": widget2,
+            "child": widget2,
+        }
+        with self.assertRaises(KeyError) as caught:
+            field.set_widgets(values)
+        self.assertEqual(caught.exception.args, ("nope",))
+        self.assertIs(field["child"]["other"].widget, widget1)
+        self.assertIsNot(field.widget, widget2)
+        self.assertIsNot(field["child"].widget, widget2)
+
+    def test_set_widgets_splat_no_children(self):
+        field = self._makeOne(self._makeNestedSchema())
+        widget = DummyWidget()
+        values = {"child": widget, "empty.*": widget, "empty.x": widget}
+        self.assertRaises(IndexError, field.set_widgets, values)
+        self.assertIs(field["child"].widget, widget)
+
+    def test_set_widgets_compiled_reused(self):
+        # Deform
+        from deform.field import WidgetOverrides
+
+        widget1 = DummyWidget()
+        widget2 = DummyWidget()
+        overrides = WidgetOverrides(
+            {"child/grandchild": widget1, "": widget2}, separator="/"
+        )
+        for _ in range(2):
+            field = self._makeOne(self._makeNestedSchema())
+            field.set_widgets(overrides, separator="ignored")
+            self.assertIs(field["child"]["grandchild"].widget, widget1)
+            self.assertIs(field.widget, widget2)
+
+    def test_set_widgets_shared_prefix_looked_up_once(self):
+        # Deform
+        from deform.field import Field
+
+        lookups = []
+
+        class CountingField(Field):
+            def __getitem__(self, name):
+                lookups.append(name)
+                return Field.__getitem__(self, name)
+
+        field = CountingField(self._makeNestedSchema())
+        field.set_widgets(
+            {
+                "child.grandchild": DummyWidget(),
+                "child.other": DummyWidget(),
+                "child": DummyWidget(),
+            }
+        )
+        self.assertEqual(lookups, ["child"])
+
     def test_get_widget_requirements(self):
         schema = DummySchema()
         field = self._makeOne(schema)
@@ -347,6 +663,85 @@ class TestField(unittest.TestCase):
             result, [("abc", "123"), ("ghi", "789"), ("def", "456")]
         )
 
+    def test_get_widget_requirements_deduplicated_in_order(self):
+        schema = DummySchema(children=[DummySchema(), DummySchema()])
+        field = self._makeOne(schema)
+        field.widget = DummyWidget()
+        field.widget.requirements = (["a", None], {"js": "x.js"})
+        field.children[0].widget = DummyWidget()
+        field.children[0].widget.requirements = (
+            ("b", "1"),
+            ("a", None),
+            {"js": "x.js"},
+        )
+        field.children[1].widget = DummyWidget()
+        field.children[1].widget.requirements = (("b", "1"), ("c", None))
+        self.assertEqual(
+            field.get_widget_requirements(),
+            [
+                ("a", None),
+                {"js": "x.js"},
+                ("b", "1"),
+                {"js": "x.js"},
+                ("c", None),
+            ],
+        )
+
+    def test_get_widget_requirements_cached(self):
+        child = DummySchema(name="child")
+        field = self._makeOne(DummySchema(children=[child]))
+        field.widget = DummyWidget()
+        field.widget.requirements = (("a", None),)
+        field["child"].widget = DummyWidget()
+        field["child"].widget.requirements = (("b", None),)
+        result = field.get_widget_requirements()
+        self.assertEqual(result, [("a", None), ("b", None)])
+        result.append(("mutated", None))
+        field["child"].widget.requirements = (("stale", None),)
+        self.assertEqual(
+            field.get_widget_requirements(), [("a", None), ("b", None)]
+        )
+
+    def test_get_widget_requirements_invalidated(self):
+        child = DummySchema(name="child")
+        field = self._makeOne(DummySchema(children=[child]))
+        field.widget = DummyWidget()
+        field.widget.requirements = ()
+        field["child"].widget = DummyWidget()
+        field["child"].widget.requirements = (("b", None),)
+        self.assertEqual(field.get_widget_requirements(), [("b", None)])
+        widget = DummyWidget()
+        widget.requirements = (("c", None),)
+        field.set_widgets({"child": widget})
+        self.assertEqual(field.get_widget_requirements(), [("c", None)])
+        widget = DummyWidget()
+        widget.requirements = (("d", None),)
+        field["child"].widget = widget
+        self.assertEqual(field.get_widget_requirements(), [("d", None)])
+        del field["child"].widget
+        self.assertEqual(field.get_widget_requirements(), [])
+        field.children = []
+        field.widget = widget
+        self.assertEqual(field.get_widget_requirements(), [("d", None)])
+
+    def test_get_widget_requirements_children_changed_in_place(self):
+        child = DummySchema(name="child")
+        field = self._makeOne(DummySchema(children=[child]))
+        field.widget = DummyWidget()
+        field.widget.requirements = ()
+        field["child"].widget = DummyWidget()
+        field["child"].widget.requirements = (("b", None),)
+        self.assertEqual(field.get_widget_requirements(), [("b", None)])
+        other = self._makeOne(DummySchema(name="other"))
+        other.widget = DummyWidget()
+        other.widget.requirements = (("c", None),)
+        field.children.append(other)
+        self.assertEqual(
+            field.get_widget_requirements(), [("b", None), ("c", None)]
+        )
+        field.children.pop(0)
+        self.assertEqual(field.get_widget_requirements(), [("c", None)])
+
     def test_get_widget_resources_with_registry(self):
         def resource_registry(requirements):
             self.assertEqual(list(requirements), [("abc", "123")])
@@ -387,6 +782,58 @@ class TestField(unittest.TestCase):
         self.assertEqual(result.children[0].cloned, True)
         self.assertEqual(result.children[0]._parent(), result)
 
+    def test_clone_does_not_run_constructor(self):
+        # Deform
+        from deform.field import Field
+
+        calls = []
+
+        class CountingField(Field):
+            def __init__(self, schema, **kw):
+                calls.append(schema)
+                Field.__init__(self, schema, **kw)
+
+        grandchild = DummySchema(name="grandchild")
+        child = DummySchema(children=[grandchild], name="child")
+        field = CountingField(DummySchema(children=[child]), renderer="abc")
+        field.widget = DummyWidget()
+        del calls[:]
+        result = field.clone()
+        self.assertEqual(calls, [])
+        self.assertEqual(result.__class__, CountingField)
+        self.assertIs(result.widget, field.widget)
+        self.assertEqual([f.order for f in result._walk()], [3, 4, 5])
+        self.assertEqual(result["child"]["grandchild"].oid, "deformField5")
+        self.assertIs(result["child"].parent, result)
+        self.assertIs(result["child"]["grandchild"].schema, grandchild)
+
+    def test_clone_alias_overrides_copied_on_write(self):
+        field = self._makeOne(DummySchema())
+        field.title = "original"
+        cloned = field.clone()
+        self.assertEqual(cloned.title, "original")
+        cloned.title = "cloned"
+        del cloned.description
+        field.description = "changed"
+        self.assertEqual(field.title, "original")
+        self.assertEqual(cloned.title, "cloned")
+        self.assertEqual(cloned.description, "description")
+        del field.title
+        self.assertEqual(field.title, "title")
+        self.assertEqual(cloned.title, "cloned")
+
+    def test_clone_keeps_lazy_children_pending(self):
+        # Deform
+        from deform.field import _PendingChildren
+
+        grandchild = DummySchema(name="grandchild")
+        child = DummySchema(children=[grandchild], name="child")
+        field = self._makeOne(DummySchema(children=[child]), lazy=True)
+        field["child"]
+        cloned = field.clone()
+        self.assertIsInstance(cloned["child"]._children, _PendingChildren)
+        self.assertIs(cloned["child"]["grandchild"].parent, cloned["child"])
+
     def test___iter__(self):
         schema = DummySchema()
         field = self._makeOne(schema)
@@ -424,6 +871,531 @@ class TestField(unittest.TestCase):
         field.children = [child]
         self.assertFalse("nope" in field)
 
+    def test___getitem__duplicate_names_first_wins(self):
+        schema = DummySchema()
+        field = self._makeOne(schema)
+        child = DummyField()
+        child2 = DummyField()
+        field.children = [child, child2]
+        self.assertIs(field["name"], child)
+
+    def test___getitem__children_reassigned(self):
+        schema = DummySchema()
+        field = self._makeOne(schema)
+        field.children = [DummyField(name="a")]
+        self.assertTrue("a" in field)
+        child = DummyField(name="b")
+        field.children = [child]
+        self.assertFalse("a" in field)
+        self.assertIs(field["b"], child)
+
+    def test___getitem__children_appended(self):
+        schema = DummySchema()
+        field = self._makeOne(schema)
+        field.children = [DummyField(name="a")]
+        self.assertFalse("b" in field)
+        child = DummyField(name="b")
+        field.children.append(child)
+        self.assertIs(field["b"], child)
+
+    def test___getitem__child_replaced_in_place(self):
+        schema = DummySchema()
+        field = self._makeOne(schema)
+        field.children = [DummyField(name="a"), DummyField(name="b")]
+        self.assertTrue("a" in field)
+        child = DummyField(name="c")
+        field.children[0] = child
+        self.assertFalse("a" in field)
+        self.assertIs(field["c"], child)
+
+    def test___contains__child_replaced_in_place(self):
+        schema = DummySchema(children=[DummySchema(name="a")])
+        field = self._makeOne(schema)
+        self.assertFalse("new" in field)
+        child = DummyField(name="new")
+        field.children[0] = child
+        self.assertTrue("new" in field)
+        self.assertIs(field["new"], child)
+        self.assertFalse("a" in field)
+
+    def test___contains__children_changed_in_place(self):
+        schema = DummySchema(
+            children=[DummySchema(name="a"), DummySchema(name="b")]
+        )
+        field = self._makeOne(schema)
+        self.assertIs(field["a"], field.children[0])
+        field.children.reverse()
+        self.assertIs(field["a"], field.children[1])
+        del field.children[1]
+        self.assertFalse("a" in field)
+        child = DummyField(name="c")
+        field.children.insert(0, child)
+        self.assertIs(field["c"], child)
+        field.children.sort(key=lambda child: child.name)
+        self.assertIs(field["b"], field.children[0])
+
+    def test___contains__leaf_child_replaced_in_place(self):
+        field = self._makeOne(DummySchema())
+        field.children.append(DummyField(name="a"))
+        self.assertFalse("new" in field)
+        child = DummyField(name="new")
+        field.children[0] = child
+        self.assertIs(field["new"], child)
+
+    def test___contains__child_renamed(self):
+        schema = DummySchema(
+            children=[DummySchema(name="a"), DummySchema(name="b")]
+        )
+        field = self._makeOne(schema)
+        self.assertFalse("renamed" in field)
+        child = field["a"]
+        child.name = "renamed"
+        self.assertTrue("renamed" in field)
+        self.assertIs(field["renamed"], child)
+        self.assertFalse("a" in field)
+        del child.name
+        self.assertIs(field["a"], child)
+        self.assertFalse("renamed" in field)
+
+    def test_children_copies_are_lists(self):
+        # Standard Library
+        import copy
+
+        field = self._makeOne(DummySchema(children=[DummySchema()]))
+        self.assertIs(copy.copy(field.children).__class__, list)
+        self.assertIs(field.children[:].__class__, list)
+
+    def test_get_field(self):
+        grandchild = DummySchema(name="grandchild")
+        child = DummySchema(children=[grandchild], name="child")
+        root = DummySchema(children=[child], name="root")
+        field = self._makeOne(root)
+        child_field = field.children[0]
+        grandchild_field = child_field.children[0]
+        self.assertIs(field.get_field(""), field)
+        self.assertIs(field.get_field("child"), child_field)
+        self.assertIs(field.get_field("child.grandchild"), grandchild_field)
+        self.assertIs(
+            field.get_field("child/grandchild", "/"), grandchild_field
+        )
+        self.assertIs(field.get_field("*.grandchild"), grandchild_field)
+        self.assertIs(child_field.get_field("grandchild"), grandchild_field)
+        self.assertRaises(KeyError, field.get_field, "child.nope")
+        self.assertRaises(KeyError, field.get_field, "*.nope")
+
+    def test_get_field_children_reassigned(self):
+        grandchild = DummySchema(name="grandchild")
+        child = DummySchema(children=[grandchild], name="child")
+        root = DummySchema(children=[child], name="root")
+        field = self._makeOne(root)
+        field.get_field("child.grandchild")
+        other = self._makeOne(DummySchema(name="other"))
+        field.children[0].children = [other]
+        self.assertIs(field.get_field("child.other"), other)
+        self.assertRaises(KeyError, field.get_field, "child.grandchild")
+
+    def test_get_field_children_changed_in_place(self):
+        grandchild = DummySchema(name="grandchild")
+        child = DummySchema(children=[grandchild], name="child")
+        root = DummySchema(children=[child], name="root")
+        field = self._makeOne(root)
+        self.assertRaises(KeyError, field.get_field, "other")
+        other = self._makeOne(DummySchema(name="other"))
+        field.children.append(other)
+        self.assertIs(field.get_field("other"), other)
+        self.assertIn("other", field.get_field_index().paths)
+        field["child"].children[:] = [other]
+        self.assertIs(field.get_field("child.other"), other)
+        self.assertRaises(KeyError, field.get_field, "child.grandchild")
+
+    def test_get_field_renamed(self):
+        grandchild = DummySchema(name="grandchild")
+        child = DummySchema(children=[grandchild], name="child")
+        root = DummySchema(children=[child], name="root")
+        field = self._makeOne(root)
+        grandchild_field = field.get_field("child.grandchild")
+        self.assertRaises(KeyError, field.get_field, "renamed.grandchild")
+        field["child"].name = "renamed"
+        self.assertIs(field.get_field("renamed.grandchild"), grandchild_field)
+        self.assertRaises(KeyError, field.get_field, "child.grandchild")
+        self.assertIn("renamed", field.get_field_index().paths)
+
+    def test_get_field_by_oid(self):
+        child = DummySchema(name="child")
+        root = DummySchema(children=[child], name="root")
+        field = self._makeOne(root)
+        self.assertIs(field.get_field_by_oid("deformField0"), field)
+        self.assertIs(
+            field.get_field_by_oid("deformField1"), field.children[0]
+        )
+        self.assertRaises(KeyError, field.get_field_by_oid, "deformField2")
+
+    def test_get_field_sequence_fields(self):
+        item = DummySchema(name="item")
+        sequence = DummySchema(children=[item], name="sequence")
+        root = DummySchema(children=[sequence], name="root")
+        field = self._makeOne(root)
+        sequence_field = field["sequence"]
+        self.assertRaises(KeyError, field.get_field, "sequence.0")
+        self.assertFalse(hasattr(sequence_field, "sequence_fields"))
+        item0 = sequence_field["item"].clone()
+        item1 = sequence_field["item"].clone()
+        sequence_field.sequence_fields = [item0, item1]
+        self.assertEqual(sequence_field.sequence_fields, [item0, item1])
+        self.assertIs(field.get_field("sequence.item"), sequence_field["item"])
+        self.assertIs(field.get_field("sequence.1"), item1)
+        self.assertIs(field.get_field_by_oid(item0.oid), item0)
+        del sequence_field.sequence_fields
+        self.assertRaises(KeyError, field.get_field, "sequence.1")
+
+    def test_get_field_index(self):
+        # Deform
+        from deform.field import FieldIndex
+
+        leaf = DummySchema(name="leaf")
+        item = DummySchema(children=[leaf], name="item")
+        sequence = DummySchema(children=[item], name="sequence")
+        other = DummySchema(name="other")
+        root = DummySchema(children=[sequence, other], name="root")
+        field = self._makeOne(root)
+        field["sequence"].widget.category = "structural"
+        index = field.get_field_index()
+        self.assertIsInstance(index, FieldIndex)
+        self.assertIs(field.get_field_index(), index)
+        self.assertEqual(len(index), 5)
+        self.assertEqual(
+            index.paths,
+            ("", "sequence", "sequence.item", "sequence.item.leaf", "other"),
+        )
+        self.assertEqual(index.parents, (-1, 0, 1, 2, 0))
+        self.assertEqual(index.depths, (0, 1, 2, 3, 1))
+        self.assertEqual(index.ends, (5, 4, 4, 4, 5))
+        self.assertEqual(index.categories[1], "structural")
+        self.assertEqual(index.categories[0], "default")
+        entry = index[3]
+        self.assertIs(entry.field, field["sequence"]["item"]["leaf"])
+        self.assertEqual(entry.path, "sequence.item.leaf")
+        self.assertEqual(entry.parent, 2)
+        self.assertEqual([e.field for e in index], list(field._walk()))
+        self.assertEqual(index.position(field["other"]), 4)
+        self.assertIn(field["other"], index)
+        self.assertRaises(KeyError, index.position, field.clone())
+        self.assertEqual(index.subtree(1), range(1, 4))
+
+    def test_get_field_index_sequence_fields(self):
+        # Deform
+        from deform.field import FieldIndex
+
+        leaf = DummySchema(name="leaf")
+        item = DummySchema(children=[leaf], name="item")
+        sequence = DummySchema(children=[item], name="sequence")
+        other = DummySchema(name="other")
+        root = DummySchema(children=[sequence, other], name="root")
+        field = self._makeOne(root)
+        sequence_field = field["sequence"]
+        index = field.get_field_index()
+        sequence_index = sequence_field.get_field_index()
+        item0 = sequence_field["item"].clone()
+        item1 = sequence_field["item"].clone()
+        sequence_field.sequence_fields = [item0, item1]
+        updated = field.get_field_index()
+        self.assertIsNot(updated, index)
+        self.assertEqual(len(index), 5)
+        self.assertEqual(
+            updated.paths,
+            (
+                "",
+                "sequence",
+                "sequence.item",
+                "sequence.item.leaf",
+                "sequence.0",
+                "sequence.0.leaf",
+                "sequence.1",
+                "sequence.1.leaf",
+                "other",
+            ),
+        )
+        for built, node in (
+            (updated, field),
+            (sequence_field.get_field_index(), sequence_field),
+        ):
+            expected = FieldIndex.build(node)
+            self.assertEqual(built.fields, expected.fields)
+            self.assertEqual(built.parents, expected.parents)
+            self.assertEqual(built.depths, expected.depths)
+            self.assertEqual(built.ends, expected.ends)
+        self.assertEqual(updated.parents[6], 1)
+        self.assertEqual(updated.ends[:2], (9, 8))
+        self.assertEqual(sequence_index.paths[-1], "item.leaf")
+        self.assertEqual(sequence_field.get_field_index().paths[-1], "1.leaf")
+        sequence_field.sequence_fields = [item1]
+        self.assertEqual(len(field.get_field_index()), 7)
+        self.assertIs(field.get_field_index().fields[4], item1)
+        del sequence_field.sequence_fields
+        self.assertEqual(field.get_field_index().fields, index.fields)
+
+    def test_get_field_index_children_reassigned(self):
+        child = DummySchema(name="child")
+        root = DummySchema(children=[child], name="root")
+        field = self._makeOne(root)
+        index = field.get_field_index()
+        field.children = []
+        self.assertEqual(field.get_field_index().fields, (field,))
+        self.assertEqual(len(index), 2)
+
+    def test_clone_does_not_share_indexes(self):
+        child = DummySchema(name="child")
+        root = DummySchema(children=[child], name="root")
+        field = self._makeOne(root)
+        field.get_field("child")
+        self.assertTrue("child" in field)
+        cloned = field.clone()
+        self.assertIs(cloned.get_field("child"), cloned.children[0])
+        self.assertIs(cloned["child"], cloned.children[0])
+        self.assertIs(field.get_field("child"), field.children[0])
+
+    def _makeTabbedSchema(self):
+        # Pyramid
+        import colander
+
+        class Tab(colander.Schema):
+            title = colander.SchemaNode(colander.String())
+            count = colander.SchemaNode(colander.Integer(), missing=0)
+
+        class Tabs(colander.Schema):
+            first = Tab()
+            second = Tab()
+
+        return Tabs()
+
+    def test_ctor_sequence_prototype_gets_its_default(self):
+        # Pyramid
+        import colander
+
+        class Item(colander.Schema):
+            color = colander.SchemaNode(colander.String(), default="red")
+
+        class Items(colander.SequenceSchema):
+            item = Item()
+
+        class Schema(colander.Schema):
+            items = Items()
+
+        field = self._makeOne(
+            Schema(), appstruct={"items": [{"color": "blue"}]}
+        )
+        prototype = field["items"]["item"]
+        self.assertEqual(field["items"].cstruct, [{"color": "blue"}])
+        self.assertEqual(prototype.cstruct, {"color": "red"})
+        self.assertEqual(prototype["color"].cstruct, "red")
+        field.cstruct = {"items": []}
+        self.assertEqual(prototype["color"].cstruct, "red")
+
+    def test_lazy_children_materialized_on_access(self):
+        # Deform
+        from deform.field import _PendingChildren
+
+        field = self._makeOne(self._makeTabbedSchema(), lazy=True)
+        self.assertEqual(field.__class__, self._getTargetClass())
+        self.assertIsInstance(field._children, _PendingChildren)
+        second = field["second"]
+        self.assertIs(second.parent, field)
+        self.assertEqual([child.name for child in field], ["first", "second"])
+        self.assertIsInstance(field["first"]._children, _PendingChildren)
+        self.assertEqual(
+            [child.name for child in second.children], ["title", "count"]
+        )
+        self.assertEqual(second["title"].children, [])
+
+    def test_lazy_leaf_has_no_pending_children(self):
+        # Pyramid
+        import colander
+
+        field = self._makeOne(
+            colander.SchemaNode(colander.String()), lazy=True
+        )
+        self.assertEqual(field._children, [])
+
+    def test_lazy_cstruct_propagated_on_materialization(self):
+        appstruct = {
+            "first": {"title": "one", "count": 1},
+            "second": {"title": "two", "count": 2},
+        }
+        field = self._makeOne(
+            self._makeTabbedSchema(), appstruct=appstruct, lazy=True
+        )
+        self.assertEqual(field["second"]["count"].cstruct, "2")
+        field.cstruct = {"first": {"title": "three", "count": "3"}}
+        self.assertEqual(
+            field["first"].cstruct, {"title": "three", "count": "3"}
+        )
+        self.assertEqual(field["first"]["title"].cstruct, "three")
+
+    def test_lazy_autofocus_matches_eager(self):
+        # Pyramid
+        import colander
+
+        # Deform
+        from deform.widget import HiddenWidget
+
+        def walk(field):
+            yield field
+            for child in field.children:
+                yield from walk(child)
+
+        def autofocus(**kw):
+            return [
+                (field.name, field.autofocus, field.have_first_input)
+                for field in walk(self._makeOne(schema, **kw))
+            ]
+
+        tabs = self._makeTabbedSchema()
+        explicit = self._makeTabbedSchema()
+        explicit["second"]["count"].autofocus = "on"
+        hidden = colander.SchemaNode(colander.Mapping())
+        hidden.add(
+            colander.SchemaNode(
+                colander.String(), name="secret", widget=HiddenWidget()
+            )
+        )
+        hidden.add(tabs.clone())
+        for schema in (tabs, explicit, hidden):
+            for kw in ({}, {"focus": "off"}, {"have_first_input": True}):
+                self.assertEqual(autofocus(lazy=True, **kw), autofocus(**kw))
+
+    def _makeHiddenFirstSchema(self):
+        # Pyramid
+        import colander
+
+        # Deform
+        from deform.widget import HiddenWidget
+
+        schema = colander.SchemaNode(colander.Mapping())
+        hidden = colander.SchemaNode(colander.Mapping(), name="hidden")
+        hidden.add(
+            colander.SchemaNode(
+                colander.String(), name="secret", widget=HiddenWidget()
+            )
+        )
+        schema.add(hidden)
+        schema.add(colander.SchemaNode(colander.String(), name="title"))
+        return schema
+
+    def test_autofocus_have_first_input(self):
+        field = self._makeOne(self._makeHiddenFirstSchema())
+        self.assertTrue(field.have_first_input)
+        self.assertFalse(field["hidden"].have_first_input)
+        self.assertFalse(field["hidden"]["secret"].have_first_input)
+        self.assertTrue(field["title"].have_first_input)
+        self.assertEqual(field["title"].autofocus, "autofocus")
+        self.assertEqual(field["hidden"]["secret"].autofocus, None)
+
+    def test_autofocus_follows_schema_changes(self):
+        # Pyramid
+        import colander
+
+        # Deform
+        from deform.widget import HiddenWidget
+
+        schema = colander.SchemaNode(colander.Mapping())
+        schema.add(colander.SchemaNode(colander.String(), name="other"))
+        schema.add(colander.SchemaNode(colander.String(), name="title"))
+        for lazy in (False, True):
+            field = self._makeOne(schema, lazy=lazy)
+            self.assertEqual(field["other"].autofocus, "autofocus")
+        schema["other"].widget = HiddenWidget()
+        for lazy in (False, True):
+            field = self._makeOne(schema, lazy=lazy)
+            self.assertEqual(field["other"].autofocus, None)
+            self.assertEqual(field["title"].autofocus, "autofocus")
+        schema["title"].autofocus = "off"
+        for lazy in (False, True):
+            field = self._makeOne(schema, lazy=lazy)
+            self.assertEqual(field["other"].autofocus, None)
+            self.assertEqual(field["title"].autofocus, None)
+
+    def test_lazy_have_first_input_before_children(self):
+        field = self._makeOne(self._makeHiddenFirstSchema(), lazy=True)
+        self.assertTrue(field.have_first_input)
+        self.assertFalse(field["hidden"].have_first_input)
+        self.assertEqual(field["title"].autofocus, "autofocus")
+
+    def test_prepare(self):
+        # Deform
+        from deform.field import _PendingChildren
+        from deform.field import _PendingCstruct
+
+        appstruct = {"first": {"title": "one", "count": 1}}
+        field = self._makeOne(
+            self._makeTabbedSchema(), appstruct=appstruct, lazy=True
+        )
+        self.assertIs(field.prepare(), field)
+        fields = list(field._walk())
+        self.assertEqual(len(fields), 7)
+        for each in fields:
+            self.assertIsNot(each._children.__class__, _PendingChildren)
+            self.assertIsNot(each._cstruct.__class__, _PendingCstruct)
+            self.assertIsNot(each._widget, None)
+        self.assertEqual(field["first"]["count"]._cstruct, "1")
+
+    def test_lazy_render_matches_eager(self):
+        # Deform
+        from deform.form import Form
+
+        schema = self._makeTabbedSchema()["first"]
+        appstruct = {"title": "one", "count": 1}
+        self.assertEqual(
+            Form(schema, lazy=True).render(appstruct),
+            Form(schema).render(appstruct),
+        )
+
+    def test_lazy_validate(self):
+        # Deform
+        from deform.form import Form
+
+        form = Form(self._makeTabbedSchema(), lazy=True)
+        controls = [
+            ("__start__", "first:mapping"),
+            ("title", "one"),
+            ("count", "1"),
+            ("__end__", "first:mapping"),
+            ("__start__", "second:mapping"),
+            ("title", "two"),
+            ("count", ""),
+            ("__end__", "second:mapping"),
+        ]
+        self.assertEqual(
+            form.validate(controls),
+            {
+                "first": {"title": "one", "count": 1},
+                "second": {"title": "two", "count": 0},
+            },
+        )
+        self.assertEqual(form["first"]["count"].cstruct, "1")
+
+    def test_default_item_css_class(self):
+        field = self._makeOne(DummySchema(name="Prénom  de-l'Élève"))
+        self.assertEqual(
+            field.default_item_css_class(), "item-prenom-de-leleve"
+        )
+
+    def test_default_item_css_class_no_name(self):
+        field = self._makeOne(DummySchema(name=""))
+        self.assertEqual(field.default_item_css_class(), None)
+
+    def test_default_item_css_class_cached(self):
+        field = self._makeOne(DummySchema(name="cached name"))
+        other = self._makeOne(DummySchema(name="cached name"))
+        before = field.item_css_class_cache_info()
+        self.assertEqual(field.default_item_css_class(), "item-cached-name")
+        self.assertEqual(other.default_item_css_class(), "item-cached-name")
+        after = self._getTargetClass().item_css_class_cache_info()
+        self.assertEqual(
+            after.hits + after.misses, before.hits + before.misses + 2
+        )
+        self.assertGreaterEqual(after.hits, before.hits + 1)
+        self.assertEqual(after.maxsize, 2048)
+
     def test_errormsg_error_None(self):
         schema = DummySchema()
         field = self._makeOne(schema)
@@ -608,6 +1580,178 @@ class TestField(unittest.TestCase):
         self.assertEqual(field.cstruct, ["yo"])
         self.assertEqual(child.cstruct, "1")
 
+    def _makeDiffSchema(self):
+        # Pyramid
+        import colander
+
+        class Tab(colander.Schema):
+            title = colander.SchemaNode(colander.String())
+            body = colander.SchemaNode(colander.String())
+
+        class Tabs(colander.Schema):
+            first = Tab()
+            second = Tab()
+
+        return Tabs()
+
+    def test_update_cstruct_skips_unchanged_subtrees(self):
+        field = self._makeOne(self._makeDiffSchema())
+        field.cstruct = {
+            "first": {"title": "a", "body": "b"},
+            "second": {"title": "c", "body": "d"},
+        }
+        field["first"]["title"]._cstruct = "untouched"
+        cstruct = {
+            "first": {"title": "a", "body": "b"},
+            "second": {"title": "c", "body": "changed"},
+        }
+        field.update_cstruct(cstruct)
+        self.assertIs(field.cstruct, cstruct)
+        self.assertEqual(field["first"]["title"].cstruct, "untouched")
+        self.assertEqual(field["second"]["title"].cstruct, "c")
+        self.assertEqual(field["second"]["body"].cstruct, "changed")
+
+    def test_update_cstruct_same_object(self):
+        field = self._makeOne(self._makeDiffSchema())
+        cstruct = {"first": {"title": "a", "body": "b"}}
+        field.cstruct = cstruct
+        field["first"]._cstruct = "untouched"
+        field.update_cstruct(cstruct)
+        self.assertEqual(field["first"].cstruct, "untouched")
+        # a plain assignment propagates everything
+        field.cstruct = cstruct
+        self.assertEqual(field["first"].cstruct["title"], "a")
+
+    def test_update_cstruct_type_change(self):
+        field = self._makeOne(self._makeDiffSchema())
+        field.cstruct = {"first": {"title": "1", "body": "b"}}
+        field["first"]["title"]._cstruct = 1
+        field.update_cstruct({"first": {"title": 1.0, "body": "b"}})
+        self.assertEqual(type(field["first"]["title"].cstruct), float)
+
+    def test_cstruct_diff(self):
+        field = self._makeOne(self._makeDiffSchema(), cstruct_diff=True)
+        self.assertTrue(field["first"]["title"].cstruct_diff)
+        field.cstruct = {"first": {"title": "a", "body": "b"}}
+        field["second"]["title"]._cstruct = "untouched"
+        field.cstruct = {"first": {"title": "a", "body": "changed"}}
+        self.assertEqual(field["first"]["body"].cstruct, "changed")
+        self.assertEqual(field["second"]["title"].cstruct, "untouched")
+
+    def test_cstruct_diff_lazy(self):
+        field = self._makeOne(
+            self._makeDiffSchema(), cstruct_diff=True, lazy=True
+        )
+        field.cstruct = {"first": {"title": "a", "body": "b"}}
+        self.assertEqual(field["first"]["title"].cstruct, "a")
+
+    def _makeCountingSchema(self, calls):
+        # Pyramid
+        import colander
+
+        class Items(colander.SequenceSchema):
+            item = colander.SchemaNode(colander.String(), default="x")
+
+        class Schema(colander.Schema):
+            title = colander.SchemaNode(colander.String())
+            items = Items()
+
+        schema = Schema()
+        serialize = schema.serialize
+
+        def counting(appstruct):
+            calls.append(appstruct)
+            return serialize(appstruct)
+
+        schema.serialize = counting
+        return schema
+
+    def test_ctor_appstruct_serialized_on_access(self):
+        calls = []
+        schema = self._makeCountingSchema(calls)
+        field = self._makeOne(schema, appstruct={"title": "a"})
+        self.assertEqual(calls, [])
+        self.assertEqual(field["title"].cstruct, "a")
+        self.assertEqual(field.cstruct["title"], "a")
+        self.assertEqual(field["items"]["item"].cstruct, "x")
+        self.assertEqual(calls, [{"title": "a"}])
+
+    def test_ctor_appstruct_not_serialized_when_replaced(self):
+        calls = []
+        schema = self._makeCountingSchema(calls)
+        field = self._makeOne(schema, appstruct={"title": "a"})
+        field.cstruct = {"title": "b", "items": ["y"]}
+        # sequence prototypes get their default nevertheless
+        self.assertEqual(field["items"]["item"].clone().cstruct, "x")
+        self.assertEqual(field["title"].cstruct, "b")
+        self.assertEqual(calls, [])
+
+    def test_ctor_appstruct_prototype_cloned_first(self):
+        calls = []
+        schema = self._makeCountingSchema(calls)
+        field = self._makeOne(schema, appstruct={"title": "a"})
+        self.assertEqual(field["items"]["item"].clone().cstruct, "x")
+        self.assertEqual(calls, [])
+        self.assertEqual(field["title"].cstruct, "a")
+
+    def test_ctor_appstruct_invalid_raises_on_access(self):
+        # Pyramid
+        import colander
+
+        schema = colander.SchemaNode(colander.Mapping())
+        schema.add(colander.SchemaNode(colander.Integer(), name="num"))
+        field = self._makeOne(schema, appstruct={"num": "abc"})
+        self.assertRaises(colander.Invalid, getattr, field, "cstruct")
+        # the placeholder is kept until serialization succeeds
+        self.assertRaises(colander.Invalid, getattr, field["num"], "cstruct")
+
+    def test_ctor_appstruct_copied(self):
+        calls = []
+        schema = self._makeCountingSchema(calls)
+        appstruct = {"title": "a"}
+        field = self._makeOne(schema, appstruct=appstruct)
+        appstruct["title"] = "b"
+        self.assertEqual(field["title"].cstruct, "a")
+
+    def test_ctor_appstruct_child_outlives_root(self):
+        # Standard Library
+        import gc
+        import weakref
+
+        calls = []
+        schema = self._makeCountingSchema(calls)
+        field = self._makeOne(schema, appstruct={"title": "a"})
+        ref = weakref.ref(field)
+        child = field["title"]
+        del field
+        gc.collect()
+        self.assertEqual(child.cstruct, "a")
+        self.assertEqual(len(calls), 1)
+        # the root is released once the appstruct has been serialized
+        del child
+        gc.collect()
+        self.assertEqual(ref(), None)
+
+    def test_ctor_set_appstruct_overridden(self):
+        # Pyramid
+        import colander
+
+        calls = []
+
+        class MyField(self._getTargetClass()):
+            def set_appstruct(self, appstruct):
+                calls.append(appstruct)
+                return super(MyField, self).set_appstruct(appstruct)
+
+        schema = colander.SchemaNode(colander.Mapping())
+        schema.add(colander.SchemaNode(colander.Integer(), name="num"))
+        field = MyField(schema, appstruct={"num": 1})
+        self.assertEqual(calls, [{"num": 1}])
+        self.assertEqual(field["num"].cstruct, "1")
+        self.assertRaises(
+            colander.Invalid, MyField, schema, appstruct={"num": "abc"}
+        )
+
     def test_del_cstruct(self):
         # Pyramid
         from colander import null
@@ -624,6 +1768,145 @@ class TestField(unittest.TestCase):
         field.set_appstruct("a")
         self.assertEqual(field.cstruct, "a")
 
+    def _makeMappingSchema(self, unknown="ignore"):
+        # Pyramid
+        import colander
+
+        class Item(colander.Schema):
+            name = colander.SchemaNode(colander.String())
+
+        class Items(colander.SequenceSchema):
+            item = Item()
+
+        class Address(colander.Schema):
+            street = colander.SchemaNode(colander.String())
+            city = colander.SchemaNode(colander.String(), default="Paris")
+            note = colander.SchemaNode(
+                colander.String(), default=colander.drop
+            )
+
+        class Schema(colander.Schema):
+            title = colander.SchemaNode(colander.String())
+            count = colander.SchemaNode(colander.Integer())
+            address = Address()
+            items = Items()
+
+        schema = Schema()
+        schema.typ.unknown = unknown
+        return schema
+
+    def _cstructs(self, field):
+        return [(f.name, f.cstruct) for f in field._walk()]
+
+    def test_set_appstruct_nested_mappings(self):
+        # Pyramid
+        import colander
+
+        schema = self._makeMappingSchema()
+        appstruct = {
+            "title": "a",
+            "count": colander.drop,
+            "address": {"street": "Main", "extra": 1},
+            "items": [{"name": "x"}],
+            "extra": 1,
+        }
+        field = self._makeOne(schema)
+        expected = self._makeOne(schema)
+        expected.cstruct = schema.serialize(appstruct)
+        cstruct = field.set_appstruct(appstruct)
+        self.assertEqual(cstruct, expected.cstruct)
+        self.assertEqual(list(cstruct), ["title", "address", "items"])
+        self.assertEqual(self._cstructs(field), self._cstructs(expected))
+        self.assertEqual(field["count"].cstruct, colander.null)
+        self.assertEqual(field["address"]["city"].cstruct, "Paris")
+
+    def test_set_appstruct_preserving_mapping(self):
+        schema = self._makeMappingSchema(unknown="preserve")
+        field = self._makeOne(schema)
+        cstruct = field.set_appstruct({"title": "a", "extra": 1})
+        self.assertEqual(cstruct["extra"], 1)
+        self.assertEqual(field.cstruct, cstruct)
+        self.assertEqual(field["title"].cstruct, "a")
+
+    def test_set_appstruct_invalid_leaves_cstruct(self):
+        # Pyramid
+        import colander
+
+        schema = self._makeMappingSchema()
+        field = self._makeOne(schema, appstruct={"title": "a"})
+        before = self._cstructs(field)
+        with self.assertRaises(colander.Invalid) as raised:
+            field.set_appstruct({"title": "b", "count": "x"})
+        self.assertEqual(
+            raised.exception.asdict(), {"count": '"x" is not a number'}
+        )
+        self.assertEqual(self._cstructs(field), before)
+        self.assertRaises(colander.Invalid, field.set_appstruct, "abc")
+
+    def test_set_appstruct_matches_colander(self):
+        # Standard Library
+        import collections
+
+        # Pyramid
+        import colander
+
+        # set_appstruct serializes plain mappings with its own copy of
+        # colander.Mapping.serialize; this fails if the two drift apart
+        schema = self._makeMappingSchema()
+        home = schema["address"].clone()
+        home.name = "home"
+        home.default = {"street": "Elm"}
+        schema.add(home)
+        work = schema["address"].clone()
+        work.name = "work"
+        work.default = colander.deferred(lambda node, kw: {"street": "Oak"})
+        schema.add(work)
+        # record the mappings serialized by colander rather than the copy
+        serialized = []
+
+        def record(typ):
+            def serialize(node, appstruct):
+                serialized.append(node.name)
+                return colander.Mapping.serialize(typ, node, appstruct)
+
+            typ.serialize = serialize
+
+        record(schema.typ)
+        record(schema["address"].typ)  # shared by its clones
+        appstructs = [
+            colander.null,
+            {},
+            {"title": "a", "count": 1, "extra": 1},
+            {"title": colander.drop, "count": colander.null},
+            {"address": {"street": "Main", "note": "n", "extra": 1}},
+            {"address": {"note": colander.drop}, "home": colander.null},
+            {"address": colander.null, "work": {"city": "Lyon"}},
+            {"items": [{"name": "x"}, {}]},
+            collections.OrderedDict([("title", "a")]),
+            {"count": "x"},
+            {"address": "abc"},
+            {"address": 1, "count": "x"},
+            [("title", "a")],
+            "abc",
+        ]
+        for appstruct in appstructs:
+            try:
+                expected = schema.serialize(appstruct)
+            except colander.Invalid as e:
+                with self.assertRaises(colander.Invalid) as raised:
+                    self._makeOne(schema).set_appstruct(appstruct)
+                self.assertEqual(raised.exception.asdict(), e.asdict())
+                continue
+            field = self._makeOne(schema)
+            del serialized[:]
+            cstruct = field.set_appstruct(appstruct)
+            self.assertEqual(serialized, [])
+            self.assertEqual(cstruct, expected)
+            self.assertEqual(list(cstruct), list(expected))
+            reference = self._makeOne(schema)
+            reference.cstruct = expected
+            self.assertEqual(self._cstructs(field), self._cstructs(reference))
+
     def test_set_pstruct(self):
         schema = DummySchema()
         field = self._makeOne(schema)
@@ -768,6 +2051,171 @@ class TestField(unittest.TestCase):
         self.assertEqual(root.have_first_input, True)
 
 
+class TestDeepFieldTree(unittest.TestCase):
+    # deeper than the default recursion limit
+    depth = 2000
+
+    def _makeSchema(self):
+        schema = node = DummySchema(name="level0")
+        for level in range(1, self.depth):
+            child = DummySchema(name="level%s" % level)
+            node.children = [child]
+            node = child
+        return schema
+
+    def _makeOne(self, **kw):
+        # Deform
+        from deform.field import Field
+
+        return Field(self._makeSchema(), **kw)
+
+    def _deepest(self, field):
+        while field.children:
+            field = field.children[0]
+        return field
+
+    def test_ctor(self):
+        field = self._makeOne()
+        fields = list(field._walk())
+        self.assertEqual(len(fields), self.depth)
+        self.assertEqual([f.order for f in fields], list(range(self.depth)))
+        deepest = self._deepest(field)
+        self.assertEqual(deepest.name, "level%s" % (self.depth - 1))
+        self.assertIs(deepest.get_root(), field)
+
+    def test_cstruct(self):
+        # Pyramid
+        import colander
+
+        field = self._makeOne()
+        field.cstruct = "abc"
+        self.assertEqual(field.cstruct, "abc")
+        # DummySchema.cstruct_children distributes nulls
+        self.assertIs(self._deepest(field).cstruct, colander.null)
+
+    def test_found_first(self):
+        field = self._makeOne()
+        self._deepest(field).found_first()
+        self.assertTrue(all(f.have_first_input for f in field._walk()))
+
+    def test_get_widget_requirements(self):
+        field = self._makeOne()
+        for num, f in enumerate(field._walk()):
+            f.widget = DummyWidget()
+            f.widget.requirements = (("req%s" % (num % 3), None),)
+        self.assertEqual(
+            field.get_widget_requirements(),
+            [("req0", None), ("req1", None), ("req2", None)],
+        )
+
+    def test_handle_error(self):
+        # Pyramid
+        import colander
+
+        field = self._makeOne()
+        errors = []
+        for f in field._walk():
+            errors.append(colander.Invalid(f.schema, f.name))
+        for parent, child in zip(errors, errors[1:]):
+            parent.add(child, 0)
+        field.widget.handle_error(field, errors[0])
+        self.assertEqual([f.error for f in field._walk()], errors)
+
+    def test_clone(self):
+        field = self._makeOne()
+        cloned = field.clone()
+        self.assertEqual(len(list(cloned._walk())), self.depth)
+        self.assertIs(self._deepest(cloned).get_root(), cloned)
+
+    def test_lazy(self):
+        field = self._makeOne(lazy=True)
+        deepest = self._deepest(field)
+        self.assertEqual(deepest.name, "level%s" % (self.depth - 1))
+        self.assertEqual(deepest.order, self.depth - 1)
+
+
+class TestFieldMemory(unittest.TestCase):
+    # The memory allocated per leaf field when constructing a form from a
+    # wide mapping schema (the field object, its default oid once
+    # computed, its empty children list and its share of the parent's
+    # children list and cstruct) is compared with that of plain objects
+    # holding the same attributes in an instance dictionary, measured in
+    # the same process, so that the check does not depend on the
+    # interpreter's object and allocator layout.  The slotted fields take
+    # about 5% more on CPython 3.11 (their parent references and their
+    # share of the parent's children list); beyond that is a regression.
+    max_ratio = 1.1
+
+    def _measure(self, make, count):
+        # Standard Library
+        import gc
+        import tracemalloc
+
+        make()  # warm up caches and imports
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            result = make()  # noqa: F841 (kept alive until the snapshot)
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        stats = after.compare_to(before, "filename")
+        return sum(stat.size_diff for stat in stats) / float(count)
+
+    def test_per_field_cost(self):
+        # Standard Library
+        import platform
+
+        # Pyramid
+        import colander
+
+        # Deform
+        from deform.field import Field
+        from deform.form import Form
+
+        if platform.python_implementation() != "CPython":  # pragma: no cover
+            self.skipTest("tracemalloc sizes are CPython specific")
+        count = 2000
+        schema = colander.SchemaNode(colander.Mapping())
+        for num in range(count):
+            schema.add(
+                colander.SchemaNode(colander.String(), name="field%s" % num)
+            )
+        names = [
+            name
+            for klass in Field.__mro__
+            for name in klass.__dict__.get("__slots__", ())
+            if name not in ("__dict__", "__weakref__")
+        ]
+
+        class Plain(object):
+            pass
+
+        def make_form():
+            form = Form(schema)
+            for field in form.children:
+                field.oid
+            return form
+
+        def make_plain():
+            result = []
+            for num in range(count):
+                obj = Plain()
+                for name in names:
+                    setattr(obj, name, None)
+                obj._children = []
+                obj._oid = "deformField%s" % num
+                result.append(obj)
+            return result
+
+        # an ordinary field allocates no instance dictionary
+        self.assertEqual(make_form().children[0].__dict__, {})
+        per_field = self._measure(make_form, count)
+        per_plain = self._measure(make_plain, count)
+        self.assertLessEqual(per_field / per_plain, self.max_ratio)
+
+
 class DummyField(object):
     oid = "oid"
     requirements = (("abc", "123"), ("def", "456"))
@@ -785,6 +2233,66 @@ class DummyField(object):
         return self.requirements
 
 
+class TestLazyDefault(unittest.TestCase):
+    def _makeOne(self):
+        # Deform
+        from deform.field import _LazyDefault
+
+        return _LazyDefault("deform.template", "default_dir")
+
+    def test_get(self):
+        # Deform
+        from deform.template import default_dir
+
+        lazy = self._makeOne()
+
+        class Dummy(object):
+            attr = lazy
+
+        self.assertEqual(Dummy().attr, default_dir)
+        self.assertEqual(Dummy.attr, default_dir)
+        self.assertEqual(lazy.resolve(), default_dir)
+
+
+class Test_class_default(unittest.TestCase):
+    def _callFUT(self, cls, name):
+        # Deform
+        from deform.field import _class_default
+
+        return _class_default(cls, name)
+
+    def test_unresolved(self):
+        # Deform
+        from deform.field import _LazyDefault
+
+        lazy = _LazyDefault("deform.template", "default_dir")
+
+        class Base(object):
+            attr = lazy
+
+        class Dummy(Base):
+            pass
+
+        self.assertIs(self._callFUT(Dummy, "attr"), lazy)
+        lazy.resolve()
+        self.assertEqual(self._callFUT(Dummy, "attr"), lazy.value)
+
+    def test_overridden(self):
+        # Deform
+        from deform.field import _LazyDefault
+
+        def renderer():
+            """ """
+
+        class Base(object):
+            attr = _LazyDefault("deform.template", "default_dir")
+
+        class Dummy(Base):
+            attr = staticmethod(renderer)
+
+        self.assertIs(self._callFUT(Dummy, "attr"), renderer)
+
+
 class DummySchema(object):
     typ = None
     title = "title"
@@ -11,6 +11,14 @@ class TestForm(unittest.TestCase):
 
         return Form(schema, **kw)
 
+    def test_ajax_options(self):
+        schema = DummySchema()
+        form = self._makeOne(schema, ajax_options=" {'a': 1} ")
+        self.assertEqual(form.ajax_options, "{'a': 1}")
+        self.assertEqual(form.ajax_options.__html__(), "{'a': 1}")
+        form.ajax_options = "{}"
+        self.assertEqual(form.ajax_options.__html__(), "{}")
+
     def test_ctor_buttons_strings(self):
         # Deform
         from deform.widget import FormWidget
@@ -2,7 +2,12 @@
 
 # Standard Library
 import datetime
+import json
+import os
+import shutil
+import subprocess
 import unittest
+import urllib.parse
 
 # Pyramid
 import colander
@@ -379,3 +384,93 @@ class TestDeferredFunction(unittest.TestCase):
         )
         new_schema = schema.bind(nodates=True)
         self.assertNotIn("date", new_schema)
+
+
+# Runs deform.js and prints the ids ``deform.itemId`` gives to the ids read
+# from stdin for each random component passed as an argument
+ITEM_IDS_JS = """
+var fs = require("fs");
+var vm = require("vm");
+var context = {document: {addEventListener: function () {}}};
+vm.runInNewContext(fs.readFileSync(process.argv[1], "utf8"), context);
+var ids = JSON.parse(fs.readFileSync(0, "utf8"));
+var items = process.argv.slice(2).map(function (genid) {
+    return ids.map(function (id) { return context.deform.itemId(id, genid); });
+});
+process.stdout.write(JSON.stringify(items));
+"""
+
+
+@unittest.skipIf(shutil.which("node") is None, "Node.js is not installed")
+class TestAddSequenceItems(unittest.TestCase):
+    def _makeForm(self):
+        # Deform
+        from deform.field import PathOids
+        from deform.form import Form
+
+        class Person(colander.MappingSchema):
+            name = colander.SchemaNode(colander.String())
+            proto = colander.SchemaNode(colander.String())
+            color = colander.SchemaNode(
+                colander.String(),
+                widget=deform.widget.RadioChoiceWidget(
+                    values=(("red", "Red"), ("blue", "Blue"))
+                ),
+            )
+
+        class People(colander.SequenceSchema):
+            person = Person()
+
+        class Schema(colander.MappingSchema):
+            people = People(oid="people")
+
+        return Form(Schema(), oid_strategy=PathOids())
+
+    def _addItems(self, ids, *genids):
+        """Return, for each of ``genids``, a mapping of ``ids`` to the ids
+        deform.js gives to the nodes of a new item."""
+        # Deform
+        import deform
+
+        script = os.path.join(
+            os.path.dirname(deform.__file__), "static", "scripts", "deform.js"
+        )
+        result = subprocess.run(
+            ["node", "-e", ITEM_IDS_JS, script] + list(genids),
+            input=json.dumps(ids),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return [dict(zip(ids, item)) for item in json.loads(result.stdout)]
+
+    def test_add_two_items_explicit_oid(self):
+        from bs4 import BeautifulSoup
+
+        form = self._makeForm()
+        html = form.render(
+            {"people": [{"name": "Fred", "proto": "x", "color": "red"}]}
+        )
+        page = BeautifulSoup(html, "html.parser")
+        prototype = page.find(attrs={"prototype": True})["prototype"]
+        proto = BeautifulSoup(urllib.parse.unquote(prototype), "html.parser")
+        ids = [node["id"] for node in proto.find_all(id=True)]
+        radio_names = sorted(
+            {node["name"] for node in proto.find_all("input", type="radio")}
+        )
+        fors = [node["for"] for node in proto.find_all("label")]
+        first, second = self._addItems(
+            ids + radio_names + fors, "AAAAAA", "BBBBBB"
+        )
+        page_ids = [node["id"] for node in page.find_all(id=True)]
+        new_ids = [first[oid] for oid in ids] + [second[oid] for oid in ids]
+        self.assertEqual(len(set(page_ids + new_ids)), len(page_ids + new_ids))
+        for item in (first, second):
+            self.assertNotEqual(item[radio_names[0]], radio_names[0])
+            for label_for in fors:
+                if label_for in ids:
+                    self.assertIn(item[label_for], new_ids)
+        self.assertNotEqual(first[radio_names[0]], second[radio_names[0]])
+        self.assertEqual(first["people--proto-name"], "people-AAAAAA-name")
+        # a field named ``proto`` is not taken for the marker
+        self.assertEqual(first["people--proto-proto"], "people-AAAAAA-proto")
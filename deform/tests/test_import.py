@@ -0,0 +1,64 @@
+"""Import time tests."""
+
+# Standard Library
+import unittest
+
+# the cumulative time importing deform may take, in milliseconds; it is
+# about 150 ms on a typical machine (most of it colander)
+IMPORT_BUDGET_MS = 1000
+
+
+class TestImportTime(unittest.TestCase):
+    def _importtime(self, statement):
+        """Run ``statement`` in a new interpreter with ``-X importtime``
+        and return the cumulative import time of each module, in
+        microseconds."""
+        # Standard Library
+        import os
+        import subprocess
+        import sys
+
+        # Deform
+        import deform
+
+        root = os.path.dirname(os.path.dirname(deform.__file__))
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [root] + [p for p in [env.get("PYTHONPATH")] if p]
+        )
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        times = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            self_us, cumulative, name = line[12:].split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+        return times
+
+    def test_import_deform(self):
+        times = self._importtime("import deform")
+        self.assertIn("deform", times)
+        self.assertNotIn("pkg_resources", times)
+        self.assertNotIn("chameleon", times)
+        self.assertLess(times["deform"] / 1000, IMPORT_BUDGET_MS)
+
+    def test_validate_without_rendering(self):
+        # Chameleon is only imported by processes which render forms
+        statement = "\n".join(
+            [
+                "import colander, deform",
+                "schema = colander.SchemaNode(colander.Mapping())",
+                "schema.add(colander.SchemaNode(colander.String(), name='a'))",
+                "deform.Form(schema).validate([('a', 'x')])",
+            ]
+        )
+        times = self._importtime(statement)
+        self.assertNotIn("chameleon", times)
+        self.assertNotIn("deform.template", times)
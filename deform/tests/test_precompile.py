@@ -0,0 +1,84 @@
+"""Precompile command tests."""
+
+# Standard Library
+import unittest
+
+
+class Test_main(unittest.TestCase):
+    def _callFUT(self, argv):
+        # Standard Library
+        import contextlib
+        import io
+
+        # Deform
+        from deform.precompile import main
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            result = main(argv)
+        return result, out.getvalue()
+
+    def _makeCacheDir(self):
+        # Standard Library
+        import shutil
+        import tempfile
+
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        return cache_dir
+
+    def _makeDefaultDir(self):
+        # a stand-in for the bundled templates holding two of them, as
+        # compiling all of them takes seconds
+        # Standard Library
+        import os
+        import shutil
+        import tempfile
+
+        # Deform
+        from deform import precompile
+        from deform.template import default_dir
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        os.mkdir(os.path.join(directory, "readonly"))
+        for name in ("textinput.pt", "readonly/textinput.pt"):
+            shutil.copy(
+                os.path.join(default_dir, name),
+                os.path.join(directory, name),
+            )
+        self.addCleanup(setattr, precompile, "default_dir", default_dir)
+        precompile.default_dir = directory
+        return directory
+
+    def test_default_templates(self):
+        # Standard Library
+        import os
+
+        # Deform
+        from deform.template import ZPTRendererFactory
+
+        default_dir = self._makeDefaultDir()
+        cache_dir = self._makeCacheDir()
+        result, out = self._callFUT([cache_dir])
+        self.assertEqual(result, 0)
+        self.assertIn("readonly/textinput", out)
+        entries = sorted(os.listdir(cache_dir))
+        self.assertEqual(len(entries), 2)
+
+        renderer = ZPTRendererFactory((default_dir,), cache_dir=cache_dir)
+        renderer.loader.kwargs["loader"].build = None  # must not compile
+        renderer.warmup()
+        self.assertEqual(sorted(os.listdir(cache_dir)), entries)
+
+    def test_search_path_only(self):
+        # Standard Library
+        import os
+
+        cache_dir = self._makeCacheDir()
+        result, out = self._callFUT(
+            ["-q", "--no-default", cache_dir, "deform.tests:fixtures"]
+        )
+        self.assertEqual(result, 0)
+        self.assertEqual(out, "")
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
@@ -20,6 +20,10 @@ class TestConfigureZPT_Renderer(unittest.TestCase):
             return get_localizer(get_current_request()).translate(term)
 
         # Configure renderer
+        self.addCleanup(
+            deform.form.Form.set_default_renderer,
+            deform.form.Form.default_renderer,
+        )
         deform.renderer.configure_zpt_renderer(
             search_path=["deform:custom_widgets"], translator=translator
         )
@@ -124,6 +124,100 @@ class TestFileData(unittest.TestCase):
         self.assertEqual(result["morg"], "moo")
 
 
+class TestWidgetMakerRegistry(unittest.TestCase):
+    def _makeOne(self, *arg, **kw):
+        # Deform
+        from deform.schema import WidgetMakerRegistry
+
+        return WidgetMakerRegistry(*arg, **kw)
+
+    def test_default_widget_makers(self):
+        # Pyramid
+        import colander
+
+        # Deform
+        from deform.schema import WidgetMakerRegistry
+        from deform.schema import default_widget_makers
+        from deform.widget import MappingWidget
+
+        self.assertIsInstance(default_widget_makers, WidgetMakerRegistry)
+        self.assertIs(
+            default_widget_makers.resolve(colander.Mapping), MappingWidget
+        )
+
+    def test_resolve_exact(self):
+        registry = self._makeOne({Base: "base", Derived: "derived"})
+        self.assertEqual(registry.resolve(Derived), "derived")
+        self.assertEqual(registry.resolve(Base), "base")
+
+    def test_resolve_follows_mro(self):
+        class Other(object):
+            pass
+
+        class Both(Other, Derived):
+            pass
+
+        registry = self._makeOne({Base: "base", Derived: "derived"})
+        self.assertEqual(registry.resolve(Both), "derived")
+        self.assertEqual(registry.resolve(Other), None)
+
+    def test_resolve_virtual_subclass(self):
+        # Standard Library
+        import abc
+
+        class Interface(abc.ABC):
+            pass
+
+        class Implementation(object):
+            pass
+
+        Interface.register(Implementation)
+        registry = self._makeOne({Interface: "interface"})
+        self.assertEqual(registry.resolve(Implementation), "interface")
+
+    def test_resolve_is_cached(self):
+        registry = self._makeOne({Base: "base"})
+        self.assertEqual(registry.resolve(Derived), "base")
+        self.assertEqual(registry._resolved, {Derived: "base"})
+
+    def test_cache_invalidated_on_change(self):
+        registry = self._makeOne({Base: "base"})
+
+        def check(expected, change):
+            registry.resolve(Derived)
+            change()
+            self.assertEqual(registry.resolve(Derived), expected)
+
+        check("derived", lambda: registry.register(Derived, "derived"))
+        check("base", lambda: registry.unregister(Derived))
+        check("other", lambda: registry.__setitem__(Derived, "other"))
+        check("base", lambda: registry.__delitem__(Derived))
+        check("updated", lambda: registry.update({Derived: "updated"}))
+        check("base", lambda: registry.pop(Derived))
+        check("popped", lambda: registry.setdefault(Derived, "popped"))
+        check("base", registry.popitem)
+        check(None, registry.clear)
+
+        def ior():
+            nonlocal registry
+            registry |= {Base: "ior"}
+
+        check("ior", ior)
+
+    def test_unregister_missing(self):
+        registry = self._makeOne()
+        registry.unregister(Base)
+        self.assertEqual(registry, {})
+
+
+class Base(object):
+    pass
+
+
+class Derived(Base):
+    pass
+
+
 class DummySchemaNode(object):
     def __init__(self, typ=None, name="", exc=None, default=None):
         self.typ = typ
@@ -0,0 +1,277 @@
+"""Request state tests."""
+
+# Standard Library
+import unittest
+
+
+def _makeSchema():
+    # Pyramid
+    import colander
+
+    # Deform
+    from deform.widget import CheckedInputWidget
+
+    class Person(colander.MappingSchema):
+        first_name = colander.SchemaNode(colander.String())
+        age = colander.SchemaNode(colander.Integer())
+
+    class People(colander.SequenceSchema):
+        person = Person()
+
+    class Schema(colander.MappingSchema):
+        name = colander.SchemaNode(colander.String())
+        password = colander.SchemaNode(
+            colander.String(),
+            widget=CheckedInputWidget(),
+            missing="",
+        )
+        people = People(missing=())
+
+    return Schema()
+
+
+def _makeForm(**kw):
+    # Deform
+    from deform.field import PathOids
+    from deform.form import Form
+
+    form = Form(
+        _makeSchema(), buttons=("submit",), oid_strategy=PathOids(), **kw
+    )
+    return form.prepare()
+
+
+def _controls(name, num):
+    result = [
+        ("name", name),
+        ("__start__", "password:mapping"),
+        ("password", name),
+        ("password-confirm", name if num % 2 else "other"),
+        ("__end__", "password:mapping"),
+        ("__start__", "people:sequence"),
+    ]
+    for item in range(num % 3):
+        result.extend(
+            [
+                ("__start__", "person:mapping"),
+                ("first_name", "%s-%s" % (name, item)),
+                ("age", "x" if num % 2 else str(item)),
+                ("__end__", "person:mapping"),
+            ]
+        )
+    result.append(("__end__", "people:sequence"))
+    return result
+
+
+class TestFieldState(unittest.TestCase):
+    def _makeOne(self, **kw):
+        # Deform
+        from deform.state import FieldState
+
+        return FieldState(**kw)
+
+    def test_defaults(self):
+        # Deform
+        from deform.state import UNSET
+
+        state = self._makeOne()
+        self.assertIs(state.error, None)
+        self.assertIs(state.cstruct, None)
+        self.assertIs(state.sequence_fields, None)
+        self.assertIs(state.unparseable, UNSET)
+        self.assertEqual(state.attributes, {})
+
+    def test_copy(self):
+        state = self._makeOne(
+            error="error",
+            cstruct="cstruct",
+            sequence_fields=["a"],
+            unparseable="x",
+            attributes={"a": 1},
+        )
+        copied = state.copy()
+        self.assertEqual(copied.error, "error")
+        self.assertEqual(copied.cstruct, "cstruct")
+        self.assertEqual(copied.sequence_fields, ["a"])
+        self.assertEqual(copied.unparseable, "x")
+        self.assertEqual(copied.attributes, {"a": 1})
+        copied.attributes["b"] = 2
+        self.assertEqual(state.attributes, {"a": 1})
+
+
+class TestRequestState(unittest.TestCase):
+    def _makeOne(self):
+        # Deform
+        from deform.state import RequestState
+
+        return RequestState()
+
+    def test_current(self):
+        # Deform
+        from deform.state import current
+
+        self.assertIs(current(), None)
+        state = self._makeOne()
+        with state as entered:
+            self.assertIs(entered, state)
+            self.assertIs(current(), state)
+            with self._makeOne() as inner:
+                self.assertIs(current(), inner)
+            self.assertIs(current(), state)
+        self.assertIs(current(), None)
+
+    def test_getitem_starts_from_field(self):
+        form = _makeForm()
+        form["name"].error = "base"
+        state = self._makeOne()
+        self.assertIs(state.get(form["name"]), None)
+        field_state = state[form["name"]]
+        self.assertEqual(field_state.error, "base")
+        self.assertIs(state[form["name"]], field_state)
+        self.assertEqual(len(state), 1)
+
+    def test_error_and_cstruct_isolated(self):
+        form = _makeForm()
+        with self._makeOne():
+            form["name"].error = "error"
+            form.cstruct = {"name": "Fred", "password": "", "people": []}
+            self.assertEqual(form["name"].error, "error")
+            self.assertEqual(form["name"].cstruct, "Fred")
+        self.assertIs(form["name"].error, None)
+        self.assertEqual(form["name"].cstruct, form.schema["name"].default)
+
+    def test_unparseable_isolated(self):
+        form = _makeForm()
+        with self._makeOne():
+            form["name"].unparseable = "x"
+            self.assertEqual(form["name"].unparseable, "x")
+            del form["name"].unparseable
+            self.assertFalse(hasattr(form["name"], "unparseable"))
+            form["name"].unparseable = "y"
+        self.assertFalse(hasattr(form["name"], "unparseable"))
+
+    def test_sequence_fields_isolated(self):
+        form = _makeForm()
+        people = form["people"]
+        with self._makeOne():
+            people.sequence_fields = [people.children[0].clone()]
+            self.assertEqual(len(people.sequence_fields), 1)
+            item = people.sequence_fields[0]
+            self.assertIs(form.get_field("people.0"), item)
+        self.assertRaises(KeyError, form.get_field, "people.0")
+        self.assertFalse(hasattr(people, "sequence_fields"))
+
+    def test_field_index_isolated(self):
+        form = _makeForm()
+        people = form["people"]
+        index = form.get_field_index()
+        with self._makeOne():
+            self.assertIsNot(form.get_field_index(), index)
+            people.sequence_fields = [people.children[0].clone()]
+            self.assertIn("people.0.age", form.get_field_index().paths)
+        self.assertIs(form.get_field_index(), index)
+        self.assertNotIn("people.0.age", index.paths)
+
+    def test_field_index_children_changed_in_place(self):
+        # Pyramid
+        import colander
+
+        # Deform
+        from deform.field import Field
+
+        form = _makeForm()
+        with self._makeOne():
+            self.assertRaises(KeyError, form.get_field, "extra")
+            extra = Field(colander.SchemaNode(colander.String(), name="extra"))
+            form.children.append(extra)
+            self.assertIs(form.get_field("extra"), extra)
+        self.assertIs(form.get_field("extra"), extra)
+
+    def test_validate_leaves_form_untouched(self):
+        # Deform
+        from deform.exception import ValidationFailure
+
+        form = _makeForm()
+        pristine = form.render()
+        with self._makeOne():
+            self.assertRaises(
+                ValidationFailure, form.validate, _controls("Fred", 4)
+            )
+            self.assertTrue(form.error)
+            self.assertEqual(form["name"].cstruct, "Fred")
+        self.assertIs(form.error, None)
+        self.assertEqual(form.render(), pristine)
+
+    def test_validate_leaves_prepared_lazy_form_untouched(self):
+        # Deform
+        from deform.exception import ValidationFailure
+
+        form = _makeForm(lazy=True, appstruct={"name": "Bob"})
+
+        def snapshot():
+            return [
+                (field, field._children, field._cstruct, field._widget)
+                for field in form._walk()
+            ]
+
+        before = snapshot()
+        with self._makeOne():
+            self.assertRaises(
+                ValidationFailure, form.validate, _controls("Fred", 4)
+            )
+            self.assertEqual(form["name"].cstruct, "Fred")
+        self.assertEqual(snapshot(), before)
+        self.assertEqual(form["name"].cstruct, "Bob")
+
+    def test_checked_input_confirm(self):
+        # Deform
+        from deform.exception import ValidationFailure
+
+        form = _makeForm()
+        with self._makeOne():
+            with self.assertRaises(ValidationFailure) as raised:
+                form.validate(_controls("Fred", 0))
+            rendered = raised.exception.render()
+            self.assertIn('value="other"', rendered)
+        self.assertFalse(hasattr(form["password"], "password-confirm"))
+
+    def test_matches_fresh_forms_across_threads(self):
+        # Standard Library
+        import threading
+
+        # Deform
+        from deform.exception import ValidationFailure
+
+        shared = _makeForm()
+        pristine = shared.render()
+
+        def process(form, name, num):
+            try:
+                form.validate(_controls(name, num))
+            except ValidationFailure as e:
+                return e.render()
+            return form.render()
+
+        failures = []
+
+        def worker(name):
+            try:
+                for num in range(20):
+                    with self._makeOne():
+                        result = process(shared, name, num)
+                    expected = process(_makeForm(), name, num)
+                    if result != expected:
+                        failures.append((name, num, "wrong rendering"))
+            except Exception as e:  # pragma: no cover
+                failures.append((name, e))
+
+        threads = [
+            threading.Thread(target=worker, args=("t%s" % num,))
+            for num in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+        self.assertEqual(shared.render(), pristine)
@@ -119,7 +119,8 @@ class TestZPTRendererFactory(unittest.TestCase):
         return ZPTRendererFactory(dirs, **kw)
 
     def test_functional(self):
-        from pkg_resources import resource_filename
+        # Deform
+        from deform.utils import resource_filename
 
         default_dir = resource_filename("deform", "tests/fixtures/")
         renderer = self._makeOne((default_dir,))
@@ -144,6 +145,273 @@ class TestZPTRendererFactory(unittest.TestCase):
         self.assertEqual(template.encoding, "utf-16")
         self.assertEqual(template.translate("a"), "translation")
 
+    def _countLoads(self, renderer):
+        loads = []
+        load = renderer.loader.load
+
+        def counting(template_name):
+            loads.append(template_name)
+            return load(template_name)
+
+        renderer.loader.load = counting
+        return loads
+
+    def test_load_cached(self):
+        # Standard Library
+        import os
+
+        fixtures = os.path.join(os.path.dirname(__file__), "fixtures")
+        renderer = self._makeOne((fixtures,), auto_reload=False)
+        loads = self._countLoads(renderer)
+        template = renderer.load("test")
+        self.assertIs(renderer.load("test"), template)
+        self.assertEqual(renderer("test").strip(), "<div>Test</div>")
+        self.assertEqual(renderer("test").strip(), "<div>Test</div>")
+        self.assertIs(renderer.load("test.pt"), template)
+        self.assertEqual(loads, ["test", "test.pt"])
+
+    def test_load_cached_asset_spec(self):
+        renderer = self._makeOne(())
+        loads = self._countLoads(renderer)
+        spec = "deform.tests:fixtures/test.pt"
+        self.assertEqual(renderer(spec).strip(), "<div>Test</div>")
+        self.assertEqual(renderer(spec).strip(), "<div>Test</div>")
+        self.assertEqual(loads, [spec])
+
+    def test_load_missing_not_cached(self):
+        # Deform
+        from deform.template import TemplateError
+
+        renderer = self._makeOne((self._makeOverrides(),))
+        self.assertRaises(TemplateError, renderer.load, "missing")
+        self.assertEqual(renderer._templates, {})
+
+    def test_invalidate(self):
+        # Standard Library
+        import os
+
+        overrides = self._makeOverrides()
+        renderer = self._makeOne((overrides,), auto_reload=False)
+        template = renderer.load("test")
+        renderer.load("test.pt")
+        readonly = renderer.load("readonly/test")
+        self.assertEqual(renderer("test").strip(), "<div>Override</div>")
+        with open(os.path.join(overrides, "test.pt"), "w") as f:
+            f.write("<div>Changed</div>")
+        self.assertEqual(renderer("test").strip(), "<div>Override</div>")
+        renderer.invalidate("test")
+        renderer.invalidate("unknown")
+        self.assertIsNot(renderer.load("test.pt"), template)
+        self.assertEqual(renderer("test").strip(), "<div>Changed</div>")
+        self.assertIs(renderer.load("readonly/test"), readonly)
+        renderer.invalidate()
+        self.assertIsNot(renderer.load("readonly/test"), readonly)
+
+    def _makeOverrides(self):
+        # Standard Library
+        import os
+        import shutil
+        import tempfile
+
+        overrides = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, overrides)
+        os.mkdir(os.path.join(overrides, "readonly"))
+        for name, body in (
+            ("test.pt", "<div>Override</div>"),
+            ("readonly/test.pt", "<div>Readonly</div>"),
+            ("notes.txt", "not a template"),
+        ):
+            with open(os.path.join(overrides, name), "w") as f:
+                f.write(body)
+        return overrides
+
+    def test_template_names(self):
+        # Standard Library
+        import os
+
+        fixtures = os.path.join(os.path.dirname(__file__), "fixtures")
+        renderer = self._makeOne((self._makeOverrides(), fixtures))
+        self.assertEqual(renderer.template_names(), ["readonly/test", "test"])
+
+    def test_warmup(self):
+        # Standard Library
+        import os
+
+        fixtures = os.path.join(os.path.dirname(__file__), "fixtures")
+        renderer = self._makeOne((self._makeOverrides(), fixtures))
+        timings = renderer.warmup()
+        self.assertEqual(sorted(timings), ["readonly/test", "test"])
+        self.assertTrue(all(t >= 0 for t in timings.values()))
+        template = renderer.load("test")
+        self.assertTrue(template._cooked)
+        self.assertTrue(renderer.load("readonly/test")._cooked)
+        self.assertEqual(renderer("test").strip(), "<div>Override</div>")
+
+    def test_template_names_default_templates(self):
+        # compiling every bundled template is left to
+        # benchmarks/bench_warmup.py
+        # Deform
+        from deform.template import default_renderer
+
+        names = default_renderer.template_names()
+        self.assertIn("textinput", names)
+        self.assertIn("readonly/textinput", names)
+
+    def test_warmup_freeze(self):
+        # Deform
+        from deform import template
+
+        calls = []
+
+        class DummyGC(object):
+            def collect(self):
+                calls.append("collect")
+
+            def freeze(self):
+                calls.append("freeze")
+
+        self.addCleanup(setattr, template, "gc", template.gc)
+        template.gc = DummyGC()
+        renderer = self._makeOne((self._makeOverrides(),))
+        renderer.warmup()
+        self.assertEqual(calls, [])
+        renderer.warmup(freeze=True)
+        self.assertEqual(calls, ["collect", "freeze"])
+
+    def test_cache_dir(self):
+        # Standard Library
+        import os
+        import shutil
+        import tempfile
+
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        fixtures = os.path.join(os.path.dirname(__file__), "fixtures")
+        renderer = self._makeOne((fixtures,), cache_dir=cache_dir)
+        self.assertEqual(renderer("test").strip(), "<div>Test</div>")
+        entries = os.listdir(cache_dir)
+        self.assertEqual(len(entries), 1)
+
+        # the same source elsewhere is found in the cache
+        elsewhere = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, elsewhere)
+        shutil.copy(os.path.join(fixtures, "test.pt"), elsewhere)
+        other = self._makeOne((elsewhere,), cache_dir=cache_dir)
+
+        def build(source, filename):
+            raise AssertionError("compiled again")
+
+        other.loader.kwargs["loader"].build = build
+        self.assertEqual(other("test").strip(), "<div>Test</div>")
+        self.assertEqual(os.listdir(cache_dir), entries)
+
+        # another source is compiled
+        changed = self._makeOne((self._makeOverrides(),), cache_dir=cache_dir)
+        changed.loader.kwargs["loader"].build = build
+        self.assertRaises(AssertionError, changed, "test")
+
+    def test_cache_dir_errors_report_template_path(self):
+        # Standard Library
+        import os
+        import shutil
+        import tempfile
+
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        paths = []
+        for num in range(2):
+            directory = tempfile.mkdtemp()
+            self.addCleanup(shutil.rmtree, directory)
+            path = os.path.join(directory, "bad.pt")
+            with open(path, "w") as f:
+                f.write("<div>${missing}</div>")
+            paths.append(path)
+            renderer = self._makeOne((directory,), cache_dir=cache_dir)
+            with self.assertRaises(NameError) as cm:
+                renderer("bad")
+            self.assertIn(path, str(cm.exception))
+        self.assertNotIn(paths[0], str(cm.exception))
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_cache_dir_settings_in_key(self):
+        # Standard Library
+        import os
+        import shutil
+        import tempfile
+
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        fixtures = os.path.join(os.path.dirname(__file__), "fixtures")
+        self._makeOne((fixtures,), cache_dir=cache_dir)("test")
+        self._makeOne((fixtures,), cache_dir=cache_dir, encoding="latin-1")(
+            "test"
+        )
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+
+class TestCompiledTemplateCache(unittest.TestCase):
+    def _makeOne(self):
+        # Standard Library
+        import os
+        import shutil
+        import tempfile
+
+        # Deform
+        from deform.template import CompiledTemplateCache
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        return CompiledTemplateCache(os.path.join(directory, "cache"))
+
+    def test_get_missing(self):
+        cache = self._makeOne()
+        self.assertIs(cache.get("template_abc.py"), None)
+
+    def test_build_and_get(self):
+        # Standard Library
+        import os
+
+        cache = self._makeOne()
+        namespace = cache.build("x = 1\n", "template_abc.py")
+        self.assertEqual(namespace["x"], 1)
+        self.assertEqual(cache.get("template_abc.py")["x"], 1)
+        self.assertEqual(len(os.listdir(cache.directory)), 1)
+
+    def test_get_unreadable(self):
+        # Standard Library
+        import os
+
+        cache = self._makeOne()
+        cache.build("x = 1\n", "template_abc.py")
+        (name,) = os.listdir(cache.directory)
+        with open(os.path.join(cache.directory, name), "wb") as f:
+            f.write(b"garbage")
+        self.assertIs(cache.get("template_abc.py"), None)
+
+    def test_build_failure_leaves_nothing(self):
+        # Standard Library
+        import os
+
+        cache = self._makeOne()
+        self.assertRaises(SyntaxError, cache.build, "x = (", "bad_abc.py")
+        self.assertEqual(os.listdir(cache.directory), [])
+
+
+class Test__getattr__(unittest.TestCase):
+    def test_default_renderer(self):
+        # Deform
+        from deform import template
+
+        renderer = template.default_renderer
+        self.assertEqual(renderer.__class__, template.ZPTRendererFactory)
+        self.assertIs(template.default_renderer, renderer)
+
+    def test_missing(self):
+        # Deform
+        from deform import template
+
+        self.assertRaises(AttributeError, getattr, template, "missing")
+
 
 class Test_default_renderer(unittest.TestCase):
     def _callFUT(self, template, **kw):
@@ -59,6 +59,35 @@ class TestWidget(unittest.TestCase):
         widget.handle_error(field, error)
         self.assertEqual(widget.error, "abc")
 
+    def test_handle_error_dispatched_by_position(self):
+        fields = []
+        for num in range(3):
+            inner_field = DummyField()
+            inner_field.widget = self._makeOne()
+            fields.append(inner_field)
+        outer_field = DummyField()
+        outer_field.widget = self._makeOne()
+        outer_field.children = fields
+        errors = []
+        for pos in (2, 0, 3, -1, None, 1.0):
+            inner_error = DummyInvalid()
+            inner_error.pos = pos
+            errors.append(inner_error)
+        outer_error = DummyInvalid(*errors)
+        self.assertEqual(
+            outer_field.widget._error_targets(outer_field, outer_error),
+            [
+                (fields[2], errors[0]),
+                (fields[0], errors[1]),
+                (fields[1], errors[5]),
+            ],
+        )
+        outer_field.widget.handle_error(outer_field, outer_error)
+        self.assertEqual(
+            [field.error for field in fields],
+            [errors[1], errors[5], errors[0]],
+        )
+
 
 class TestTextInputWidget(unittest.TestCase):
     def _makeOne(self, **kw):
@@ -1798,6 +1827,47 @@ class TestSequenceWidget(unittest.TestCase):
         self.assertEqual(unquote(result), "abc")
         self.assertEqual(protofield.cloned, True)
 
+    def _makePathOidField(self, renderer):
+        # Deform
+        from deform.field import Field
+        from deform.field import PathOids
+
+        class Items(colander.SequenceSchema):
+            item = colander.SchemaNode(colander.String())
+
+        class Schema(colander.Schema):
+            items = Items()
+
+        field = Field(Schema(), renderer, oid_strategy=PathOids())
+        return field["items"]
+
+    def test_prototype_path_oids(self):
+        renderer = DummyRenderer("abc")
+        field = self._makePathOidField(renderer)
+        widget = self._makeOne()
+        widget.prototype(field)
+        self.assertEqual(renderer.kw["field"].oid, "deformField-items--proto")
+        self.assertEqual(field.children[0].oid, "deformField-items-item")
+
+    def test_serialize_path_oids(self):
+        renderer = DummyRenderer("abc")
+        field = self._makePathOidField(renderer)
+        widget = self._makeOne()
+        widget.serialize(field, ["a", "b"])
+        self.assertEqual(
+            [subfield.oid for _, subfield in renderer.kw["subfields"]],
+            ["deformField-items-0", "deformField-items-1"],
+        )
+
+    def test_deserialize_path_oids(self):
+        field = self._makePathOidField(DummyRenderer("abc"))
+        widget = self._makeOne()
+        widget.deserialize(field, ["a", "b"])
+        self.assertEqual(
+            [subfield.oid for subfield in field.sequence_fields],
+            ["deformField-items-0", "deformField-items-1"],
+        )
+
     def test_serialize_null(self):
         renderer = DummyRenderer("abc")
         schema = DummySchema()
@@ -2035,6 +2105,27 @@ class TestSequenceWidget(unittest.TestCase):
         widget.handle_error(field, error)
         self.assertEqual(widget.error, "abc")
 
+    def test_handle_error_many_items(self):
+        field = DummyField()
+        widget = self._makeOne()
+        field.sequence_fields = []
+        errors = []
+        for num in range(1000):
+            inner_field = DummyField()
+            inner_field.widget = DummyWidget()
+            field.sequence_fields.append(inner_field)
+            if num % 3 == 0:
+                inner_invalid = DummyInvalid()
+                inner_invalid.pos = num
+                errors.append(inner_invalid)
+        error = DummyInvalid(*reversed(errors))
+        widget.handle_error(field, error)
+        for num, inner_field in enumerate(field.sequence_fields):
+            if num % 3 == 0:
+                self.assertEqual(inner_field.widget.error.pos, num)
+            else:
+                self.assertFalse(hasattr(inner_field.widget, "error"))
+
     def test_deserialize_bad_type(self):
         field = DummyField()
         inner_field = DummyField()
@@ -2290,6 +2381,22 @@ class TestTextInputCSVWidget(unittest.TestCase):
         self.assertEqual(field.error.msg, "Invalid\nInvalid")
 
 
+class Test__getattr__(unittest.TestCase):
+    def test_default_resource_registry(self):
+        # Deform
+        from deform import widget
+
+        registry = widget.default_resource_registry
+        self.assertEqual(registry.__class__, widget.ResourceRegistry)
+        self.assertIs(widget.default_resource_registry, registry)
+
+    def test_missing(self):
+        # Deform
+        from deform import widget
+
+        self.assertRaises(AttributeError, getattr, widget, "missing")
+
+
 class TestResourceRegistry(unittest.TestCase):
     def _makeOne(self, **kw):
         # Deform
@@ -2342,6 +2449,61 @@ class TestResourceRegistry(unittest.TestCase):
         result = reg([("abc", "123")])
         self.assertEqual(result, {"js": ["123"], "css": ["2"]})
 
+    def test___call___deduplicates_in_order(self):
+        reg = self._makeOne(use_defaults=False)
+        reg.registry = {
+            "abc": {"123": {"js": ("a", "b"), "css": "x"}},
+            "def": {None: {"js": ("c", "a"), "css": ("x", "y")}},
+        }
+        result = reg((("abc", "123"), ["def", None]))
+        self.assertEqual(result, {"js": ["a", "b", "c"], "css": ["x", "y"]})
+
+    def test___call___returns_new_lists(self):
+        reg = self._makeOne()
+        reg.registry = {"abc": {"123": {"js": (1, 2)}}}
+        result = reg([("abc", "123")])
+        result["js"].append(3)
+        self.assertEqual(reg([("abc", "123")]), {"js": [1, 2], "css": []})
+
+    def test_resolve_cached_and_immutable(self):
+        reg = self._makeOne()
+        reg.registry = {"abc": {"123": {"js": (1, 2)}}}
+        result = reg.resolve(iter([("abc", "123")]))
+        self.assertEqual(dict(result), {"js": (1, 2), "css": ()})
+        self.assertIs(reg.resolve([["abc", "123"]]), result)
+        with self.assertRaises(TypeError):
+            result["js"] = ()
+
+    def test_resolve_errors_not_cached(self):
+        reg = self._makeOne(use_defaults=False)
+        self.assertRaises(ValueError, reg.resolve, [("abc", "123")])
+        reg.set_js_resources("abc", "123", "a.js")
+        self.assertEqual(reg.resolve([("abc", "123")])["js"], ("a.js",))
+
+    def test_cache_invalidated_by_setters(self):
+        reg = self._makeOne(use_defaults=False)
+        reg.set_js_resources("abc", "123", "a.js")
+        self.assertEqual(reg([("abc", "123")]), {"js": ["a.js"], "css": []})
+        reg.set_css_resources("abc", "123", "a.css")
+        self.assertEqual(
+            reg([("abc", "123")]), {"js": ["a.js"], "css": ["a.css"]}
+        )
+        reg.set_js_resources("abc", "123", "b.js")
+        self.assertEqual(
+            reg([("abc", "123")]), {"js": ["b.js"], "css": ["a.css"]}
+        )
+
+    def test_cache_size(self):
+        reg = self._makeOne(use_defaults=False)
+        reg.cache_size = 2
+        reg.set_js_resources("abc", None, "a.js")
+        reg.set_js_resources("def", None, "d.js")
+        reg.resolve([("abc", None)])
+        reg.resolve([("def", None)])
+        self.assertEqual(len(reg._resolved), 2)
+        reg.resolve([("abc", None), ("def", None)])
+        self.assertEqual(len(reg._resolved), 1)
+
 
 class TestNormalizeChoices(unittest.TestCase):
     def _call(self, values):
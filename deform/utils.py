@@ -1,5 +1,9 @@
 """Utils."""
 
+# Standard Library
+import functools
+import os
+
 
 def text_(s, encoding="latin-1", errors="strict"):
     """If ``s`` is an instance of ``binary_type``, return
@@ -15,3 +19,19 @@ def bytes_(s, encoding="latin-1", errors="strict"):
     if isinstance(s, str):  # pragma: no cover
         return s.encode(encoding, errors)
     return s  # pragma: no cover
+
+
+@functools.lru_cache(maxsize=None)
+def resource_filename(package, name):
+    """Return the path of the resource ``name`` (a ``/``-separated path,
+    a trailing ``/`` being kept) of the package named ``package``, like
+    ``pkg_resources.resource_filename`` does for packages installed as
+    directories, using :mod:`importlib.resources`.  Results are cached
+    per process."""
+    # Standard Library
+    import importlib.resources
+
+    path = os.fspath(importlib.resources.files(package).joinpath(name))
+    if name.endswith("/") and not path.endswith(os.sep):
+        path += os.sep
+    return path
@@ -6,6 +6,7 @@ from io import StringIO
 import json
 import random
 import string
+from types import MappingProxyType
 from urllib.parse import quote
 
 # Pyramid
@@ -20,6 +21,7 @@ from iso8601.iso8601 import ISO8601_REGEX
 from translationstring import TranslationString
 
 from .i18n import _
+from .state import current as _current_state
 from .utils import text_
 
 sequence_types = (
@@ -249,12 +251,29 @@ class Widget(object):
           has an error (as per the ``error`` argument's ``children``
           attribute).
         """
-        if field.error is None:
-            field.error = error
-        for e in error.children:
-            for num, subfield in enumerate(field.children):
-                if e.pos == num:
-                    subfield.widget.handle_error(subfield, e)
+        # The errors of the descendants are dispatched with an explicit
+        # stack rather than by recursion; descendant widgets which
+        # override ``handle_error`` are called in turn.
+        stack = [(self, field, error)]
+        root = True
+        while stack:
+            widget, field, error = stack.pop()
+            if not root:
+                handle_error = getattr(widget.__class__, "handle_error", None)
+                if handle_error is not Widget.handle_error:
+                    widget.handle_error(field, error)
+                    continue
+            root = False
+            if field.error is None:
+                field.error = error
+            targets = widget._error_targets(field, error)
+            for subfield, e in reversed(targets):
+                stack.append((subfield.widget, subfield, e))
+
+    def _error_targets(self, field, error):
+        """Return the ``(subfield, error)`` pairs to which ``handle_error``
+        dispatches the children of ``error``, in order."""
+        return _positional_targets(error, field.children)
 
     def get_template_values(self, field, cstruct, kw):
         values = {"cstruct": cstruct, "field": field}
@@ -1407,7 +1426,12 @@ class CheckedInputWidget(Widget):
         readonly = kw.get("readonly", self.readonly)
         kw.setdefault("subject", self.subject)
         kw.setdefault("confirm_subject", self.confirm_subject)
-        confirm = getattr(field, "%s-confirm" % (field.name,), cstruct)
+        confirm_name = "%s-confirm" % (field.name,)
+        state = _current_state()
+        if state is None:
+            confirm = getattr(field, confirm_name, cstruct)
+        else:
+            confirm = state[field].attributes.get(confirm_name, cstruct)
         kw["confirm"] = confirm
         template = readonly and self.readonly_template or self.template
         values = self.get_template_values(field, cstruct, kw)
@@ -1430,7 +1454,11 @@ class CheckedInputWidget(Widget):
 
         value = validated[field.name]
         confirm = validated[confirm_name]
-        setattr(field, confirm_name, confirm)
+        state = _current_state()
+        if state is None:
+            setattr(field, confirm_name, confirm)
+        else:
+            state[field].attributes[confirm_name] = confirm
         if (value or confirm) and (value != confirm):
             raise Invalid(field.schema, self.mismatch_message, value)
         if not value:
@@ -1653,6 +1681,7 @@ class SequenceWidget(Widget):
         if not item_field.name:
             info = "Prototype for %r has no name" % field
             raise ValueError(info)
+        self._set_item_oid(field, item_field, None)
         # NB: item_field default should already be set up
         proto = item_field.render_template(self.item_template, parent=field)
         if isinstance(proto, str):
@@ -1685,8 +1714,9 @@ class SequenceWidget(Widget):
             # this serialization is being performed as a result of a
             # first-time rendering
             subfields = []
-            for val in cstruct:
+            for num, val in enumerate(cstruct):
                 cloned = item_field.clone()
+                self._set_item_oid(field, cloned, num)
                 if val is not null:
                     # item field has already been set up with a default by
                     # virtue of its constructor and setting cstruct to null
@@ -1733,11 +1763,12 @@ class SequenceWidget(Widget):
         elif not isinstance(pstruct, list):
             raise Invalid(field.schema, "Pstruct is not a list")
 
-        field.sequence_fields = []
+        sequence_fields = []
         item_field = field.children[0]
 
         for num, substruct in enumerate(pstruct):
             subfield = item_field.clone()
+            self._set_item_oid(field, subfield, num)
             try:
                 subval = subfield.deserialize(substruct)
             except Invalid as e:
@@ -1748,22 +1779,44 @@ class SequenceWidget(Widget):
 
             subfield.cstruct = subval
             result.append(subval)
-            field.sequence_fields.append(subfield)
+            sequence_fields.append(subfield)
+
+        field.sequence_fields = sequence_fields
 
         if error is not None:
             raise error
 
         return result
 
-    def handle_error(self, field, error):
-        if field.error is None:
-            field.error = error
-        # XXX exponential time
+    def _set_item_oid(self, field, item_field, index):
+        # clones get a new default oid unless the form derives oids from
+        # field paths (see deform.field.PathOids)
+        strategy = getattr(field, "oid_strategy", None)
+        if strategy is not None:
+            item_field.oid = strategy.item_oid(field, index)
+
+    def _error_targets(self, field, error):
         sequence_fields = getattr(field, "sequence_fields", [])
-        for e in error.children:
-            for num, subfield in enumerate(sequence_fields):
-                if e.pos == num:
-                    subfield.widget.handle_error(subfield, e)
+        return _positional_targets(error, sequence_fields)
+
+
+def _positional_targets(error, fields):
+    """Return the ``(field, error)`` pairs matching each child of
+    ``error`` with the field of ``fields`` at its ``pos``, in order.
+    Integer positions are looked up directly; any other position (but
+    ``None``, which matches nothing) is compared with every index."""
+    targets = []
+    count = len(fields)
+    for e in error.children:
+        pos = e.pos
+        if pos.__class__ is int:
+            if 0 <= pos < count:
+                targets.append((fields[pos], e))
+        elif pos is not None:
+            for num in range(count):
+                if pos == num:
+                    targets.append((fields[num], e))
+    return targets
 
 
 class filedict(dict):
@@ -2149,13 +2202,21 @@ class ResourceRegistry(object):
     If the ``use_defaults`` flag is True, the default set of Deform
     requirement-to-resource mappings is loaded into the registry.
     Otherwise, the registry is initialized without any mappings.
+
+    Resolved requirement sets are cached; the cache is cleared by
+    :meth:`set_js_resources` and :meth:`set_css_resources`.  Changes made
+    to the ``registry`` dictionary directly are not detected.
     """
 
+    # the number of distinct requirement sets kept in the cache
+    cache_size = 1024
+
     def __init__(self, use_defaults=True):
         if use_defaults is True:
             self.registry = default_resources.copy()
         else:
             self.registry = {}
+        self._resolved = {}
 
     def set_js_resources(self, requirement, version, *resources):
         """Set the Javascript resources for the requirement/version
@@ -2163,6 +2224,7 @@ class ResourceRegistry(object):
         reqt = self.registry.setdefault(requirement, {})
         ver = reqt.setdefault(version, {})
         ver["js"] = resources
+        self._resolved.clear()
 
     def set_css_resources(self, requirement, version, *resources):
         """Set the CSS resources for the requirement/version
@@ -2170,6 +2232,7 @@ class ResourceRegistry(object):
         reqt = self.registry.setdefault(requirement, {})
         ver = reqt.setdefault(version, {})
         ver["css"] = resources
+        self._resolved.clear()
 
     def __call__(self, requirements):
         """Return a dictionary representing the resources required for a
@@ -2181,7 +2244,27 @@ class ResourceRegistry(object):
         ``package:path``.  You can use the paths for each resource type to
         inject CSS and Javascript on-demand into the head of dynamic pages that
         render Deform forms."""
-        result = {"js": [], "css": []}
+        resolved = self.resolve(requirements)
+        return {"js": list(resolved["js"]), "css": list(resolved["css"])}
+
+    def resolve(self, requirements):
+        """Like :meth:`deform.widget.ResourceRegistry.__call__`, but return
+        a read-only mapping of resource type to a tuple of asset
+        specifications, which may be shared between calls."""
+        key = tuple(
+            (requirement, version) for requirement, version in requirements
+        )
+        resolved = self._resolved.get(key)
+        if resolved is not None:
+            return resolved
+        resolved = self._resolve(key)
+        if len(self._resolved) >= self.cache_size:
+            self._resolved.clear()
+        self._resolved[key] = resolved
+        return resolved
+
+    def _resolve(self, requirements):
+        result = {"js": {}, "css": {}}  # dictionaries used as ordered sets
         for requirement, version in requirements:
             tmp = self.registry.get(requirement)
             if tmp is None:
@@ -2201,10 +2284,11 @@ class ResourceRegistry(object):
                 if isinstance(sources, str):
                     sources = (sources,)
                 for source in sources:
-                    if source not in result[thing]:
-                        result[thing].append(source)
+                    result[thing].setdefault(source)
 
-        return result
+        return MappingProxyType(
+            {"js": tuple(result["js"]), "css": tuple(result["css"])}
+        )
 
 
 default_resources = {
@@ -2251,4 +2335,10 @@ default_resources = {
     },
 }
 
-default_resource_registry = ResourceRegistry()
+
+def __getattr__(name):
+    # ``default_resource_registry`` is created the first time it is used,
+    # so that processes which never render do not build it.
+    if name == "default_resource_registry":
+        return globals().setdefault(name, ResourceRegistry())
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -13,7 +13,7 @@
 # out serve to show the default value.
 
 import sys, os, datetime
-import pkg_resources
+import importlib.metadata
 
 # If your extensions are in another directory, add it here. If the
 # directory is relative to the documentation root, use os.path.abspath to
@@ -59,7 +59,7 @@ copyright = '2008-%s, Agendaless Consulting' % thisyear
 # other places throughout the built documents.
 #
 # The short X.Y version.
-version = pkg_resources.get_distribution('deform').version
+version = importlib.metadata.version('deform')
 
 # The full version, including alpha/beta/rc tags.
 release = version
@@ -31,7 +31,6 @@ requires = [
     "peppercorn>=0.3",  # rename operation type
     "translationstring>=1.0",  # add format mapping with %
     "zope.deprecation",
-    "setuptools<81.0.0",
 ]
 
 lint_extras = [
@@ -110,6 +109,11 @@ setup(
     tests_require=testing_extras,
     install_requires=requires,
     test_suite="deform.tests",
+    entry_points={
+        "console_scripts": [
+            "deform-precompile = deform.precompile:main",
+        ],
+    },
     extras_require={
         "lint": lint_extras,
         "testing": testing_extras,